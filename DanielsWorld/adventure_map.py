@@ -6,6 +6,16 @@ import random
 from player_profile import PlayerProfile
 import importlib
 import logging
+from collections import OrderedDict
+from utils.surface_cache import get_scaled
+from utils.asset_manager import AssetManager
+from utils.font_cache import get_font
+from utils.fixed_timestep import FixedTimestep
+from utils.frame_profiler import FrameProfiler
+from utils.perf_hud import PerfHUD
+from utils import tracing
+from utils import draw_counters
+from settings import ADVENTURE_MAP_CACHE_SIZE
 
 # logger to report which encounter generator was used and the final placements
 logger = logging.getLogger(__name__)
@@ -20,8 +30,13 @@ sys.path.insert(0, str(project_root))
 class AdventureMap:
     def __init__(self, map_image_path, window_size=(1280, 720), window_title="Adventure Map",
                  encounter_generator=None, obstacle_generator=None):
-        pygame.init()
-        self.screen = pygame.display.set_mode(window_size, pygame.RESIZABLE)
+        # inside the game pygame and the window already exist; only a standalone map owns them
+        self._owns_pygame = not pygame.get_init()
+        if self._owns_pygame:
+            pygame.init()
+        self.screen = pygame.display.get_surface()
+        if self.screen is None:
+            self.screen = pygame.display.set_mode(window_size, pygame.RESIZABLE)
         pygame.display.set_caption(window_title)
         self.clock = pygame.time.Clock()
         self.running = True
@@ -126,10 +141,42 @@ class AdventureMap:
         self.obstacles = obstacle_generator(self.screen) if obstacle_generator else []
         self.dm = None  # DungeonMaster instance, set in run()
 
+    def _relayout(self):
+        """Recompute player and encounter positions from their normalized values for self.screen."""
+        try:
+            from utils.ui_scaling import denormalize_point
+
+            # Update player position
+            pos = denormalize_point(self.norm_player_pos.x, self.norm_player_pos.y, self.screen)
+            self.player_pos.x, self.player_pos.y = pos
+
+            # Update encounter positions
+            for enc in self.encounter_points:
+                if '_pos_norm' in enc:
+                    norm_x, norm_y = enc['_pos_norm']
+                    screen_x, screen_y = denormalize_point(norm_x, norm_y, self.screen)
+                    enc['pos'] = pygame.Vector2(screen_x, screen_y)
+        except Exception as e:
+            print(f"Error updating positions on resize: {e}", file=sys.stderr)
+
+    def resume(self):
+        """
+        Prepare a map kept from an earlier visit (see AdventureMapCache): re-read the shared
+        player profile, put the player back on the spawn point and lay out for the current window.
+        """
+        self.profile.load()
+        screen = pygame.display.get_surface()
+        if screen is not None:
+            self.screen = screen
+        # run() starts a fresh DungeonMaster that only knows the profile's choices, so a player
+        # left standing on an unfinished encounter would trigger it again on arrival
+        self.norm_player_pos = pygame.Vector2(0.5, 0.5)
+        self._relayout()
+
     def load_background(self):
         try:
             if self.map_image_path and Path(self.map_image_path).exists():
-                self.bg_image = pygame.image.load(str(self.map_image_path)).convert()
+                self.bg_image = AssetManager.get_instance().load_path(self.map_image_path)
             else:
                 print(f"Background image not found at {self.map_image_path}", file=sys.stderr)
         except Exception as e:
@@ -137,11 +184,11 @@ class AdventureMap:
             self.bg_image = None
 
     def load_player_images(self):
+        assets = AssetManager.get_instance()
         player_images = {}
         for direction in ['w', 'a', 's', 'd']:
             try:
-                img_path = self.project_root / "assets" / "images" / f"{direction}Capy.png"
-                player_images[direction] = pygame.image.load(str(img_path))
+                player_images[direction] = assets.get(f"player_{direction}")
             except Exception as e:
                 print(f"Failed to load player image {direction}Capy.png: {e}", file=sys.stderr)
         if not player_images.get('a'):
@@ -160,6 +207,8 @@ class AdventureMap:
 
     def run(self, DungeonMasterClass, ai_generate_dialogue, run_sebs_minigame, run_presleyworld_minigame):
         self.dm = DungeonMasterClass()
+        # let the DM restore the map under its dialogue box from the shared scaled copy
+        self.dm.bg_image = self.bg_image
         # Load profile choices and mark encounters done if present
         for k in self.profile.choices().keys():
             try:
@@ -169,31 +218,29 @@ class AdventureMap:
                 continue
 
         running = True
-        dt = 0
+        frame_dt = 0
+        # movement is simulated in fixed steps; the player sprite is drawn interpolated
+        timestep = FixedTimestep()
+        prev_player_pos = pygame.Vector2(self.player_pos)
+        profiler = FrameProfiler.get_instance()
+        hud = PerfHUD.get_instance()
         while running:
+            profiler.begin_frame("adventure_map")
+            profiler.stage("events")
+            blocked = False  # set when a modal dialog/menu held the loop up this frame
             for event in pygame.event.get():
+                if hud.handle_event(event) or tracing.handle_event(event) or draw_counters.handle_event(event):
+                    continue
                 if event.type == pygame.QUIT:
                     running = False
                 elif event.type == pygame.VIDEORESIZE:
                     self.screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
-                    try:
-                        from utils.ui_scaling import denormalize_point
-                        
-                        # Update player position
-                        pos = denormalize_point(self.norm_player_pos.x, self.norm_player_pos.y, self.screen)
-                        self.player_pos.x, self.player_pos.y = pos
-                        
-                        # Update encounter positions
-                        for enc in self.encounter_points:
-                            if '_pos_norm' in enc:
-                                norm_x, norm_y = enc['_pos_norm']
-                                screen_x, screen_y = denormalize_point(norm_x, norm_y, self.screen)
-                                enc['pos'] = pygame.Vector2(screen_x, screen_y)
-                                
-                    except Exception as e:
-                        print(f"Error updating positions on resize: {e}", file=sys.stderr)
+                    self._relayout()
+                    prev_player_pos = pygame.Vector2(self.player_pos)
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE:
+                        blocked = True
+                        menu_start = tracing.now()
                         menu_active = True
                         menu_selection = 0
                         menu_options = ["Continue", "Reset Progress", "Link Online Account", "Back to Main Menu"]
@@ -230,7 +277,7 @@ class AdventureMap:
                             dark_overlay.fill((0, 0, 0))
                             dark_overlay.set_alpha(128)
                             self.screen.blit(dark_overlay, (0, 0))
-                            menu_font = pygame.font.SysFont(None, 36)
+                            menu_font = get_font(None, 36)
                             menu_title = menu_font.render("Menu", True, (255, 255, 0))
                             title_rect = menu_title.get_rect(centerx=self.screen.get_width() // 2, top=self.screen.get_height() // 3)
                             self.screen.blit(menu_title, title_rect)
@@ -242,13 +289,15 @@ class AdventureMap:
                                     pygame.draw.rect(self.screen, color, text_rect.inflate(20, 5), 1)
                                 self.screen.blit(text, text_rect)
                             pygame.display.flip()
+                        tracing.record("adventure_map.menu", menu_start)
                         if menu_result == "main_menu":
                             return "main_menu"
 
+            profiler.stage("render")
             # draw background
             if self.bg_image:
                 try:
-                    bg_surf = pygame.transform.smoothscale(self.bg_image, (self.screen.get_width(), self.screen.get_height()))
+                    bg_surf = get_scaled(self.bg_image, self.screen.get_size())
                     self.screen.blit(bg_surf, (0, 0))
                 except Exception:
                     self.screen.blit(self.bg_image, (0, 0))
@@ -266,8 +315,9 @@ class AdventureMap:
             elif keys[pygame.K_d]:
                 self.current_player_image = self.player_images.get('d', self.current_player_image)
 
-            # Draw player
-            self.player_rect = self.current_player_image.get_rect(center=self.player_pos)
+            # Draw player between the last two simulated positions
+            draw_pos = prev_player_pos.lerp(self.player_pos, timestep.alpha)
+            self.player_rect = self.current_player_image.get_rect(center=draw_pos)
             self.screen.blit(self.current_player_image, self.player_rect)
 
             # Draw encounter points with normalized radius
@@ -292,14 +342,17 @@ class AdventureMap:
                     badge_pos = (int(pt.x + 28), int(pt.y - 28))
                     pygame.draw.circle(self.screen, badge_color, badge_pos, 12)
                     try:
-                        font = pygame.font.SysFont(None, 20)
+                        font = get_font(None, 20)
                         txt = font.render(str(sel+1), True, (20, 20, 20))
                         txt_rect = txt.get_rect(center=badge_pos)
                         self.screen.blit(txt, txt_rect)
                     except Exception:
                         pass
 
+            profiler.stage("update")
             # AI DM intro
+            if not self.dm.intro_shown:
+                blocked = True
             self.dm.narrate_intro(self.screen)
 
             # Check for encounter proximity
@@ -307,6 +360,8 @@ class AdventureMap:
                 pt = enc["pos"]
                 if not self.dm.encounter_states.get(idx, False):
                     if self.player_pos.distance_to(pt) < 60:
+                        blocked = True
+                        encounter_start = tracing.now()
                         if enc.get("type") == "dialogue":
                             character = enc.get("character", "Stranger")
                             dialogue = ai_generate_dialogue(character)
@@ -317,7 +372,7 @@ class AdventureMap:
                             keep_looping = True
                             while keep_looping and loop_count < max_loops:
                                 self.dm.show_message(self.screen, f"{character}: {prompt}", duration=1.0)
-                                font = pygame.font.SysFont(None, 28)
+                                font = get_font(None, 28)
                                 box_width = int(self.screen.get_width() * 0.8)
                                 box_x = (self.screen.get_width() - box_width) // 2
                                 box_y = 130
@@ -356,7 +411,7 @@ class AdventureMap:
                                             if event.key == pygame.K_UP:
                                                 current_sel = (current_sel - 1) % len(options)
                                                 if self.bg_image:
-                                                    bg_surf = pygame.transform.smoothscale(self.bg_image, (self.screen.get_width(), self.screen.get_height()))
+                                                    bg_surf = get_scaled(self.bg_image, self.screen.get_size())
                                                     self.screen.blit(bg_surf, box_rect, box_rect)
                                                 else:
                                                     pygame.draw.rect(self.screen, (0,0,0), box_rect)
@@ -365,7 +420,7 @@ class AdventureMap:
                                             elif event.key == pygame.K_DOWN:
                                                 current_sel = (current_sel + 1) % len(options)
                                                 if self.bg_image:
-                                                    bg_surf = pygame.transform.smoothscale(self.bg_image, (self.screen.get_width(), self.screen.get_height()))
+                                                    bg_surf = get_scaled(self.bg_image, self.screen.get_size())
                                                     self.screen.blit(bg_surf, box_rect, box_rect)
                                                 else:
                                                     pygame.draw.rect(self.screen, (0,0,0), box_rect)
@@ -384,7 +439,8 @@ class AdventureMap:
                                 followup_text = followup.lower()
                                 if ("riddle" in option_text or "puzzle" in option_text or "riddle" in followup_text or "puzzle" in followup_text):
                                     self.dm.show_message(self.screen, "A mysterious puzzle awaits you...", duration=1.4)
-                                    run_presleyworld_minigame()
+                                    with tracing.span("presleyworld_minigame"):
+                                        run_presleyworld_minigame()
                                 else:
                                     self.dm.show_message(self.screen, followup, duration=1.4)
                                 try:
@@ -404,38 +460,113 @@ class AdventureMap:
                             self.dm.encounter_states[idx] = True
                         else:
                             self.dm.encounter(self.screen, idx)
+                        tracing.record("adventure_map.encounter", encounter_start, idx=idx, type=enc.get("type"))
+
+            if blocked:
+                # don't simulate the time spent inside dialogs/menus as catch-up steps
+                profiler.discard_frame()
+                self.clock.tick()
+                timestep.reset()
+                prev_player_pos = pygame.Vector2(self.player_pos)
 
             # Player movement - using normalized coordinates
             keys = pygame.key.get_pressed()
-            normalized_speed = (300 * dt) / self.screen.get_height()  # Scale speed relative to screen height
-            
-            if keys[pygame.K_w]:
-                self.norm_player_pos.y -= normalized_speed
-            if keys[pygame.K_s]:
-                self.norm_player_pos.y += normalized_speed
-            if keys[pygame.K_a]:
-                self.norm_player_pos.x -= normalized_speed * (self.screen.get_width() / self.screen.get_height())
-            if keys[pygame.K_d]:
-                self.norm_player_pos.x += normalized_speed * (self.screen.get_width() / self.screen.get_height())
-                
-            # Keep player within bounds (0-1 range)
-            self.norm_player_pos.x = max(0.0, min(1.0, self.norm_player_pos.x))
-            self.norm_player_pos.y = max(0.0, min(1.0, self.norm_player_pos.y))
-            
-            # Update absolute position
-            try:
-                from utils.ui_scaling import denormalize_point
-                pos = denormalize_point(self.norm_player_pos.x, self.norm_player_pos.y, self.screen)
-                self.player_pos.x, self.player_pos.y = pos
-            except Exception:
-                # Fallback to direct position update if import fails
-                self.player_pos.x = self.norm_player_pos.x * self.screen.get_width()
-                self.player_pos.y = self.norm_player_pos.y * self.screen.get_height()
+            for dt in timestep.steps(frame_dt):
+                prev_player_pos = pygame.Vector2(self.player_pos)
+                normalized_speed = (300 * dt) / self.screen.get_height()  # Scale speed relative to screen height
+
+                if keys[pygame.K_w]:
+                    self.norm_player_pos.y -= normalized_speed
+                if keys[pygame.K_s]:
+                    self.norm_player_pos.y += normalized_speed
+                if keys[pygame.K_a]:
+                    self.norm_player_pos.x -= normalized_speed * (self.screen.get_width() / self.screen.get_height())
+                if keys[pygame.K_d]:
+                    self.norm_player_pos.x += normalized_speed * (self.screen.get_width() / self.screen.get_height())
 
+                # Keep player within bounds (0-1 range)
+                self.norm_player_pos.x = max(0.0, min(1.0, self.norm_player_pos.x))
+                self.norm_player_pos.y = max(0.0, min(1.0, self.norm_player_pos.y))
+
+                # Update absolute position
+                try:
+                    from utils.ui_scaling import denormalize_point
+                    pos = denormalize_point(self.norm_player_pos.x, self.norm_player_pos.y, self.screen)
+                    self.player_pos.x, self.player_pos.y = pos
+                except Exception:
+                    # Fallback to direct position update if import fails
+                    self.player_pos.x = self.norm_player_pos.x * self.screen.get_width()
+                    self.player_pos.y = self.norm_player_pos.y * self.screen.get_height()
+
+            # the map was drawn before the update (dialogs draw over it), so the HUD gets its own
+            # stage rather than a second "render" span
+            profiler.stage("overlay")
+            if hud.enabled:
+                done = sum(1 for idx in range(len(self.encounter_points)) if self.dm.encounter_states.get(idx, False))
+                hud.set_counts(encounters=len(self.encounter_points), done=done)
+                hud.draw(self.screen, "adventure_map")
+            profiler.stage("flip")
             pygame.display.flip()
-            dt = self.clock.tick(60) / 1000
+            profiler.end_frame()
+            frame_dt = self.clock.tick(60) / 1000
+
+        if self._owns_pygame:
+            pygame.quit()
+        else:
+            # the window was closed from the map; let the game loop see it too
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+
+
+class AdventureMapCache:
+    """
+    Built AdventureMaps kept per world between planet visits, least recently used evicted
+    beyond ADVENTURE_MAP_CACHE_SIZE. A cached map keeps its background, player sprites,
+    generated encounters and normalized layout, so re-entering a planet skips all of that.
+    """
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """Singleton pattern so every screen shares the cached maps."""
+        if cls._instance is None:
+            cls._instance = AdventureMapCache()
+        return cls._instance
+
+    def __init__(self, max_entries=ADVENTURE_MAP_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._maps = OrderedDict()  # world id -> (AdventureMap, constructor kwargs), most recently used last
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, world_id, map_image_path, **kwargs):
+        """
+        Return the map for world_id, building it on the first visit (kwargs go to AdventureMap).
+        A cached map built from a different image or different kwargs is rebuilt.
+        """
+        entry = self._maps.get(world_id)
+        if entry is not None and entry[0].map_image_path == map_image_path and entry[1] == kwargs:
+            self.hits += 1
+            self._maps.move_to_end(world_id)
+            entry[0].resume()
+            return entry[0]
+        self.misses += 1
+        adventure = AdventureMap(map_image_path, **kwargs)
+        self._maps.pop(world_id, None)
+        self._maps[world_id] = (adventure, kwargs)
+        while len(self._maps) > self.max_entries:
+            self._maps.popitem(last=False)
+        return adventure
+
+    def discard(self, world_id):
+        self._maps.pop(world_id, None)
+
+    def clear(self):
+        self._maps.clear()
+
 
-        pygame.quit()
+def get_adventure_map(world_id, map_image_path, **kwargs):
+    """Return the (possibly cached) AdventureMap for a world; see AdventureMapCache."""
+    return AdventureMapCache.get_instance().get(world_id, map_image_path, **kwargs)
 
 # Example usage (for planet.py):
 # from DanielsWorld.adventure_map import AdventureMap
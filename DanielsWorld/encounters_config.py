@@ -17,11 +17,13 @@ import json
 from pathlib import Path
 
 # YAML support is optional. If PyYAML is available, we'll use it to read YAML configs.
-try:
-    import yaml  # type: ignore
-    _HAS_YAML = True
-except Exception:
-    _HAS_YAML = False
+# It is imported on first use (only when an encounters.yaml exists), not at import time.
+def _import_yaml():
+    try:
+        import yaml  # type: ignore
+        return yaml
+    except Exception:
+        return None
 
 # Configuration
 ENCOUNTER_COUNT = 5
@@ -161,7 +163,8 @@ def _load_external_config():
                 return json.load(f)
         except Exception:
             return None
-    if yaml_path.exists() and _HAS_YAML:
+    yaml = _import_yaml() if yaml_path.exists() else None
+    if yaml is not None:
         try:
             with open(yaml_path, 'r', encoding='utf-8') as f:
                 return yaml.safe_load(f)
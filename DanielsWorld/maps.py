@@ -15,25 +15,33 @@ from settings import (
     MOVEMENT_CONTROLS, WORLD1_MAP_PATH
 )
 from player_profile import PlayerProfile
+from utils.surface_cache import get_scaled
+from utils.asset_manager import AssetManager
+from utils.text_renderer import render_text
+from utils.text_layout import wrap_text
+from utils.font_cache import get_font
+from utils.tracing import traced
+from utils import memory_profiler
 
 # --- AI Dungeon Master ---
 import importlib.util
-import threading
-import http.server
-import socketserver
 import json
-import webbrowser
+# threading, http.server, socketserver and webbrowser are only needed for account pairing;
+# they are imported there so loading the map code doesn't pull in the network stack
 
 class DungeonMaster:
     def __init__(self):
         self.intro_shown = False
         self.encounter_states = {}
+        # unscaled map background, used to restore the area under old dialogue boxes
+        self.bg_image = None
 
     def narrate_intro(self, screen):
         if not self.intro_shown:
             self.show_message(screen, "Welcome, adventurer! I am your Dungeon Master. Explore the map and seek out encounters!")
             self.intro_shown = True
 
+    @traced("DungeonMaster.show_message")
     def show_message(self, screen, text, duration=2.5):
         # Draw a semi-transparent box for dialogue
         box_width = int(screen.get_width() * 0.8)
@@ -43,8 +51,8 @@ class DungeonMaster:
         # Clear previous dialogue area
         if hasattr(self, 'last_box_rect') and self.last_box_rect:
             # Redraw background in the old box area
-            if 'bg_image' in globals() and bg_image:
-                bg_surf = pygame.transform.smoothscale(bg_image, (screen.get_width(), screen.get_height()))
+            if self.bg_image:
+                bg_surf = get_scaled(self.bg_image, screen.get_size())
                 screen.blit(bg_surf, self.last_box_rect, self.last_box_rect)
             else:
                 pygame.draw.rect(screen, BACKGROUND_COLOR if 'BACKGROUND_COLOR' in globals() else (0,0,0), self.last_box_rect)
@@ -55,20 +63,10 @@ class DungeonMaster:
         pygame.draw.rect(screen, (255, 255, 0), box_rect, width=3, border_radius=16)
 
         # Render text (wrap if needed)
-        font = pygame.font.SysFont(None, 32)
-        lines = []
-        words = text.split(' ')
-        line = ''
-        for word in words:
-            test_line = line + word + ' '
-            if font.size(test_line)[0] > box_width - 32:
-                lines.append(line)
-                line = word + ' '
-            else:
-                line = test_line
-        lines.append(line)
+        font = get_font(None, 32)
+        lines = wrap_text(text, font, box_width - 32)
         for i, l in enumerate(lines):
-            msg = font.render(l.strip(), True, (255, 255, 0))
+            msg = render_text(font, l, (255, 255, 0))
             msg_rect = msg.get_rect(midleft=(box_x + 20, box_y + 24 + i*32))
             screen.blit(msg, msg_rect)
 
@@ -103,14 +101,16 @@ class DungeonMaster:
 def run_sebs_minigame(screen):
     # Dynamically import and run SebsMinigame.py
     minigame_path = project_root / "SebastiansAwesomeCode" / "SebsMinigame.py"
-    spec = importlib.util.spec_from_file_location("SebsMinigame", str(minigame_path))
-    sebs_module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(sebs_module)
-    if hasattr(sebs_module, "main"):
-        sebs_module.main()
-    else:
-        # fallback: rerun the file as script
-        os.system(f"python {minigame_path}")
+    with memory_profiler.scene("sebs_minigame"):
+        spec = importlib.util.spec_from_file_location("SebsMinigame", str(minigame_path))
+        sebs_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(sebs_module)
+        if hasattr(sebs_module, "main"):
+            sebs_module.main()
+        else:
+            # fallback: rerun the file as script
+            os.system(f"python {minigame_path}")
+        del sebs_module
 
 def run_presleyworld_minigame():
     # Run PresleyWorld/test.py as a subprocess
@@ -118,6 +118,10 @@ def run_presleyworld_minigame():
     os.system(f"python {presley_path}")
 
 def start_pairing(profile):
+    import http.server
+    import socketserver
+    import threading
+    import webbrowser
     # choose a free port by binding a temporary socket
     import socket
     s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -193,7 +197,7 @@ def draw_menu(screen, menu_options, menu_selection):
     screen.blit(dark_overlay, (0, 0))
 
     # Draw menu
-    menu_font = pygame.font.SysFont(None, 36)
+    menu_font = get_font(None, 36)
     menu_title = menu_font.render("Menu", True, (255, 255, 0))
     title_rect = menu_title.get_rect(centerx=screen.get_width() // 2, top=screen.get_height() // 3)
     screen.blit(menu_title, title_rect)
@@ -251,7 +255,7 @@ def handle_encounter(screen, dm, profile, encounter, idx):
         while keep_looping and loop_count < max_loops:
             dm.show_message(screen, f"{character}: {prompt}", duration=1.0)
             # Show response options with visual selection
-            font = pygame.font.SysFont(None, 28)
+            font = get_font(None, 28)
             box_width = int(screen.get_width() * 0.8)
             box_x = (screen.get_width() - box_width) // 2
             box_y = 130
@@ -300,8 +304,8 @@ def handle_encounter(screen, dm, profile, encounter, idx):
                         if event.key == pygame.K_UP:
                             current_sel = (current_sel - 1) % len(options)
                             # redraw
-                            if 'bg_image' in globals() and bg_image:
-                                bg_surf = pygame.transform.smoothscale(bg_image, (screen.get_width(), screen.get_height()))
+                            if dm.bg_image:
+                                bg_surf = get_scaled(dm.bg_image, screen.get_size())
                                 screen.blit(bg_surf, box_rect, box_rect)
                             else:
                                 pygame.draw.rect(screen, (0,0,0), box_rect)
@@ -309,8 +313,8 @@ def handle_encounter(screen, dm, profile, encounter, idx):
                             render_options(current_sel)
                         elif event.key == pygame.K_DOWN:
                             current_sel = (current_sel + 1) % len(options)
-                            if 'bg_image' in globals() and bg_image:
-                                bg_surf = pygame.transform.smoothscale(bg_image, (screen.get_width(), screen.get_height()))
+                            if dm.bg_image:
+                                bg_surf = get_scaled(dm.bg_image, screen.get_size())
                                 screen.blit(bg_surf, box_rect, box_rect)
                             else:
                                 pygame.draw.rect(screen, (0,0,0), box_rect)
@@ -374,10 +378,11 @@ def main():
     pygame.display.set_caption(WINDOW_TITLE)
 
     # Load background image
+    assets = AssetManager.get_instance()
     bg_image = None
     try:
         if WORLD1_MAP_PATH.exists():
-            bg_image = pygame.image.load(str(WORLD1_MAP_PATH)).convert()
+            bg_image = assets.load_path(WORLD1_MAP_PATH)
         else:
             print(f"Background image not found at {WORLD1_MAP_PATH}", file=sys.stderr)
     except Exception as e:
@@ -387,8 +392,7 @@ def main():
     player_images = {}
     for direction in ['w', 'a', 's', 'd']:
         try:
-            img_path = project_root / "assets" / "images" / f"{direction}Capy.png"
-            player_images[direction] = pygame.image.load(str(img_path))
+            player_images[direction] = assets.get(f"player_{direction}")
         except Exception as e:
             print(f"Failed to load player image {direction}Capy.png: {e}", file=sys.stderr)
 
@@ -406,6 +410,7 @@ def main():
     # Load profile and initialize DM
     profile = PlayerProfile()
     dm = DungeonMaster()
+    dm.bg_image = bg_image
 
     # Initialize menu state
     menu_active = False
@@ -478,6 +483,7 @@ def main():
                             dm.encounter_states = {}
                             menu_active = False
                         elif menu_selection == 2:  # Link Online Account
+                            import threading
                             threading.Thread(target=lambda: start_pairing(profile), daemon=True).start()
                             menu_active = False
                         elif menu_selection == 3:  # Back to Main Menu
@@ -486,7 +492,7 @@ def main():
         # Draw game state
         if bg_image:
             try:
-                bg_surf = pygame.transform.smoothscale(bg_image, (screen.get_width(), screen.get_height()))
+                bg_surf = get_scaled(bg_image, screen.get_size())
                 screen.blit(bg_surf, (0, 0))
             except Exception:
                 screen.blit(bg_image, (0, 0))
@@ -526,7 +532,7 @@ def main():
                     badge_color = [(200, 120, 120), (120, 200, 120), (120, 160, 240)][sel % 3]
                     badge_pos = (int(pt.x + 28), int(pt.y - 28))
                     pygame.draw.circle(screen, badge_color, badge_pos, 12)
-                    font = pygame.font.SysFont(None, 20)
+                    font = get_font(None, 20)
                     txt = font.render(str(sel+1), True, (20, 20, 20))
                     txt_rect = txt.get_rect(center=badge_pos)
                     screen.blit(txt, txt_rect)
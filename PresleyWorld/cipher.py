@@ -0,0 +1,35 @@
+"""
+Caesar cipher helpers for the PresleyWorld decoding puzzle.
+
+Kept free of pygame so the puzzle logic can be imported (and benchmarked) without
+starting the game.
+
+Functions:
+- cipher_shift(ch, k): shift one letter k places, keeping case; other chars pass through
+- encode_cipher(text, k) / decode_cipher(text, k)
+- normalize_to_compare(s): upper-case letters only, for comparing a guess to the secret
+"""
+
+
+# Encryption and Decryption with Caesar Cipher
+# Converts chars to unicode number, sets base then shifts 'k' times.
+def cipher_shift(ch, k):
+    if 'A' <= ch <= 'Z':
+        base = ord('A')
+        return chr((ord(ch) - base + k) % 26 + base)
+    if 'a' <= ch <= 'z':
+        base = ord('a')
+        return chr((ord(ch) - base + k) % 26 + base)
+    return ch
+
+
+def encode_cipher(text, k):
+    return ''.join(cipher_shift(c, k) for c in text)
+
+
+def decode_cipher(text, k):
+    return encode_cipher(text, -k)
+
+
+def normalize_to_compare(s):
+    return ''.join(ch.upper() for ch in s if ch.isalpha())
@@ -13,6 +13,10 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 py.init()
 from utils.window_state import WindowState
+from utils.text_renderer import render_text
+from utils.text_layout import wrap_text
+from utils.font_cache import get_font
+from PresleyWorld.cipher import encode_cipher, decode_cipher, normalize_to_compare
 window_state = WindowState.get_instance()
 
 # Reference dimensions for consistent scaling
@@ -40,37 +44,16 @@ except Exception:
     CLICK = None  # run silently if file isn't present
 
 # Fonts - scale based on screen height
-font_big = py.font.SysFont("consolas", get_scaled_font_size(36))
-font_med = py.font.SysFont("consolas", get_scaled_font_size(28))
-font_small = py.font.SysFont("consolas", get_scaled_font_size(22))
+font_big = get_font("consolas", get_scaled_font_size(36))
+font_med = get_font("consolas", get_scaled_font_size(28))
+font_small = get_font("consolas", get_scaled_font_size(22))
 
 def update_fonts():
     """Update font sizes when screen is resized"""
     global font_big, font_med, font_small
-    font_big = py.font.SysFont("consolas", get_scaled_font_size(36))
-    font_med = py.font.SysFont("consolas", get_scaled_font_size(28))
-    font_small = py.font.SysFont("consolas", get_scaled_font_size(22))
-
-# Encryption and Decryption with Caesar Cipher 
-# Converts chars to unicode number, sets base then shifts 'k' times. 
-def cipher_shift(ch, k):
-    if 'A' <= ch <= 'Z':
-        base = ord('A')
-        return chr((ord(ch) - base + k) % 26 + base)
-    if 'a' <= ch <= 'z':
-        base = ord('a')
-        return chr((ord(ch) - base + k) % 26 + base)
-    return ch
-
-def encode_cipher(text, k):
-    return ''.join(cipher_shift(c, k) for c in text)
-
-def decode_cipher(text, k):
-    return encode_cipher(text, -k)
-
-def normalize_to_compare(s):
-    return ''.join(ch.upper() for ch in s if ch.isalpha())
-
+    font_big = get_font("consolas", get_scaled_font_size(36))
+    font_med = get_font("consolas", get_scaled_font_size(28))
+    font_small = get_font("consolas", get_scaled_font_size(22))
 
 def play_click():
     if CLICK:
@@ -107,22 +90,11 @@ won = False
 
 def draw_wrapped_text(surface, text, font, color, x, y, max_width, line_gap=6):
     # Word wrap for longer messages
-    words = text.split(' ')
-    lines = []
-    cur = ""
-    for w in words:
-        test = (cur + " " + w).strip()
-        if font.size(test)[0] <= max_width:
-            cur = test
-        else:
-            lines.append(cur)
-            cur = w
-    if cur:
-        lines.append(cur)
-        
+    lines = wrap_text(text, font, max_width)
+    if lines:
         dy = 0
         for line in lines:
-            img = font.render(line, True, color)
+            img = render_text(font, line, color)
             surface.blit(img, (x, y + dy))
             dy += img.get_height() + line_gap
         return y + dy
@@ -176,7 +148,7 @@ while running:
     screen_width = window_state.width
     screen_height = window_state.height
 
-    title = font_big.render("Alien Code Breaker — Shift-Decode", True, (120, 200, 255))
+    title = render_text(font_big, "Alien Code Breaker — Shift-Decode", (120, 200, 255))
     screen.blit(title, (screen_width//2 - title.get_width()//2, 24))
 
     # Instructions
@@ -188,7 +160,7 @@ while running:
     
     y = 60
     for line in info_lines:
-        txt = font_small.render(line, True, (170, 176, 190))
+        txt = render_text(font_small, line, (170, 176, 190))
         # Use current screen width for centering (W was undefined)
         screen.blit(txt, (screen_width//2 - txt.get_width()//2, y))
         y += 26
@@ -210,10 +182,10 @@ while running:
     py.draw.rect(screen, (30, 36, 54), (right_x, top_y, col_w, box_h), border_radius=12)
 
     # Headings
-    cipher_label = font_med.render("Encrypted Transmission", True, (235, 238, 245))
+    cipher_label = render_text(font_med, "Encrypted Transmission", (235, 238, 245))
     screen.blit(cipher_label, (left_x + 16, top_y + 12))
 
-    decoded_label = font_med.render("Your Decoded Guess", True, (235, 238, 245))
+    decoded_label = render_text(font_med, "Your Decoded Guess", (235, 238, 245))
     screen.blit(decoded_label, (right_x + 16, top_y + 12))
 
     # Ciphertext & decoded (wrapped)
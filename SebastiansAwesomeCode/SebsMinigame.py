@@ -9,73 +9,43 @@ import os
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
-class Node:
-    def __init__(self, x, y, xSpeed, ySpeed):
-        self.x = x
-        self.y = y
-        self.xSpeed = xSpeed
-        self.ySpeed = ySpeed
-        self.next = None
-
-class LinkedListStack:
-    def __init__(self):
-        self.top = None
-        self.size = 0
-
-    def push(self, x, y , xSpeed, ySpeed):
-        new_node = Node(x, y, xSpeed, ySpeed)
-        new_node.next = self.top
-        self.top = new_node
-        self.size += 1
-
-    def remove_offscreen(self, width, height):
-        prev = None
-        node = self.top
-        while node:
-            if node.x < 0 or node.x > width or node.y < 0 or node.y > height:
-                if prev:
-                    prev.next = node.next
-                else:
-                    self.top = node.next
-                self.size -= 1
-                node = node.next
-                continue
-            prev = node
-            node = node.next
-
-    def move_all(self, dt):
-        node = self.top
-        while node:
-            node.x += node.xSpeed * dt
-            node.y += node.ySpeed * dt
-            node = node.next
-
+from utils.bullet_pool import BulletPool, OWNER_PLAYER, OWNER_ENEMY
+from utils.spatial_hash import SpatialHash
+from utils.projectile_renderer import ProjectileRenderer
+from utils.fixed_timestep import FixedTimestep, lerp
+from utils.replay import open_session
+from utils.frame_profiler import FrameProfiler
+from utils.perf_hud import PerfHUD
+from utils import tracing
+from utils import draw_counters
 
 pygame.init()
 from utils.window_state import WindowState
 window_state = WindowState.get_instance()
 screen = window_state.create_screen()
 clock = pygame.time.Clock()
+# live play, or record/replay when SPACECOWBOY_RECORD / SPACECOWBOY_REPLAY is set (seeds random)
+session = open_session(screen.get_size())
+profiler = FrameProfiler.get_instance()
+hud = PerfHUD.get_instance()  # F3 toggles the performance overlay
 running = True
 
 # Store reference size for normalization
 REF_WIDTH = 1280
 REF_HEIGHT = 720
 
-# Load player character images
-project_root = __file__.rsplit('SebastiansAwesomeCode', 1)[0]
+# Load player character images (shared with the rest of the game via the asset registry)
+from utils.asset_manager import AssetManager
+from utils.surface_cache import get_scaled
+assets = AssetManager.get_instance()
 player_images = {}
 player_images_original = {}  # Store original unscaled images
-background_img_path = f"{project_root}assets/images/marsBackground.jpg"
-dead_image_path = f"{project_root}assets/images/deadBara.png"
-enemy_image_path = f"{project_root}assets/images/octopusNormal.png"
-damaged_enemy_image_path = f"{project_root}assets/images/octopusDamaged.png"
 
 # Load all images once
 try:
-    enemy_image_original = pygame.image.load(enemy_image_path)
-    damaged_enemy_image_original = pygame.image.load(damaged_enemy_image_path)
-    dead_image_original = pygame.image.load(dead_image_path)
+    enemy_image_original = assets.get("enemy_octopus")
+    damaged_enemy_image_original = assets.get("enemy_octopus_damaged")
+    dead_image_original = assets.get("player_dead")
 except Exception as e:
     print(f"Failed to load enemy images: {e}", file=sys.stderr)
     enemy_image_original = pygame.Surface((100, 100))
@@ -93,12 +63,7 @@ dead_image = dead_image_original
 # Load player directional images
 for direction in ['w', 'a', 's', 'd']:
     try:
-        background_img_path = f"{project_root}assets/images/marsBackground.png"
-        dead_image_path = f"{project_root}assets/images/deadBara.png"
-        enemy_image_path = f"{project_root}assets/images/octopusNormal.png"
-        damaged_enemy_image_path = f"{project_root}assets/images/octopusDamaged.png"
-        img_path = f"{project_root}assets/images/{direction}Capy.png"
-        player_images_original[direction] = pygame.image.load(img_path)
+        player_images_original[direction] = assets.get(f"player_{direction}")
         player_images[direction] = player_images_original[direction]
     except Exception as e:
         print(f"Failed to load player image {direction}Capy.png: {e}", file=sys.stderr)
@@ -106,6 +71,13 @@ for direction in ['w', 'a', 's', 'd']:
         player_images[direction] = player_images_original[direction]
         player_images[direction].fill("brown")
 
+try:
+    background_img = assets.get("mars_background")
+except Exception as e:
+    print(f"Failed to load background image: {e}", file=sys.stderr)
+    background_img = pygame.Surface((REF_WIDTH, REF_HEIGHT))
+    background_img.fill("white")
+
 # Default player image (facing left)
 current_player_image = player_images.get('a')  # aCapy.png is the default
 if not current_player_image:  # Fallback if image loading failed
@@ -153,8 +125,11 @@ scale_images(screen.get_height())
 norm_cowboy_pos = list(normalize_point(100, 100, (REF_WIDTH, REF_HEIGHT)))
 cowboy_pos = list(denormalize_point(norm_cowboy_pos[0], norm_cowboy_pos[1], screen))
 player_rect = current_player_image.get_rect(center=cowboy_pos)
-stack = LinkedListStack()       # Player bullets
-enemy_stack = LinkedListStack() # Enemy bullets
+bullets = BulletPool()  # Player and enemy bullets (tagged by owner)
+projectiles = ProjectileRenderer()  # one pre-drawn sprite per bullet color, batched blits
+bullet_radius = denormalize_radius(0.0075, screen)  # recomputed on resize
+player_grid = SpatialHash()  # player bullets bucketed by cell, rebuilt each tick
+enemy_grid = SpatialHash()   # enemy bullets bucketed by cell
 
 bulletSpeed = 750
 enemyBulletSpeed = 600
@@ -185,13 +160,19 @@ Ytarget = (screen.get_height() - 100)
 dodge_timer = 0
 dodge_dx, dodge_dy = 0, 0
 
+# Simulation runs at settings.PHYSICS_TIMESTEP; drawing interpolates between the last two ticks
+timestep = FixedTimestep()
+prev_cowboy_pos = tuple(cowboy_pos)
+prev_target = (Xtarget, Ytarget)
+
 while running:
-    dt = clock.tick(60) / 1000
-    shoot_cooldown += dt
-    dodge_timer += dt
-  
+    frame_dt = session.tick(clock, 60)
+    profiler.begin_frame("sebs_minigame")
+    profiler.stage("events")
 
-    for event in pygame.event.get():
+    for event in session.poll_events():
+        if hud.handle_event(event) or tracing.handle_event(event) or draw_counters.handle_event(event):
+            continue
         if event.type == pygame.QUIT:
             running = False
             
@@ -206,6 +187,10 @@ while running:
             
             # Rescale all images for new screen size
             scale_images(screen.get_height())
+            bullet_radius = denormalize_radius(0.0075, screen)
+            projectiles.invalidate()
+            prev_cowboy_pos = tuple(cowboy_pos)
+            prev_target = (Xtarget, Ytarget)
             
         # Left click to shoot
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -216,147 +201,156 @@ while running:
             if dist != 0:
                 dx = (dx / dist) * bulletSpeed
                 dy = (dy / dist) * bulletSpeed
-            stack.push(cowboy_pos[0], cowboy_pos[1], dx, dy)
-
-    # Player movement and image updates
-    keys = pygame.key.get_pressed()
-    moved = False
-    
-    # Calculate movement speed relative to reference size
-    normalized_speed = (player_speed * dt) / REF_HEIGHT
-    
-    if keys[pygame.K_w]:
-        norm_cowboy_pos[1] -= normalized_speed
-        current_player_image = player_images.get('w', current_player_image)
-        moved = True
-    if keys[pygame.K_s]:
-        norm_cowboy_pos[1] += normalized_speed
-        current_player_image = player_images.get('s', current_player_image)
-        moved = True
-    if keys[pygame.K_a]:
-        norm_cowboy_pos[0] -= normalized_speed * (REF_HEIGHT / REF_WIDTH)
-        current_player_image = player_images.get('a', current_player_image)
-        moved = True
-    if keys[pygame.K_d]:
-        norm_cowboy_pos[0] += normalized_speed * (REF_HEIGHT / REF_WIDTH)
-        current_player_image = player_images.get('d', current_player_image)
-        moved = True
-    if keys[pygame.K_q] and playerDead:
-        running = False
-
-    # ✅ Keep player inside screen (in normalized coordinates)
-    norm_cowboy_pos[0] = max(0.05, min(0.95, norm_cowboy_pos[0]))
-    norm_cowboy_pos[1] = max(0.05, min(0.95, norm_cowboy_pos[1]))
+            bullets.spawn(cowboy_pos[0], cowboy_pos[1], dx, dy, OWNER_PLAYER)
+
+    profiler.stage("update")
+    for dt in timestep.steps(frame_dt):
+        prev_cowboy_pos = tuple(cowboy_pos)
+        prev_target = (Xtarget, Ytarget)
+        shoot_cooldown += dt
+        dodge_timer += dt
+
+        # Player movement and image updates
+        keys = session.get_pressed()
+        moved = False
     
-    # Convert normalized coordinates to screen coordinates
-    cowboy_pos[0] = int(norm_cowboy_pos[0] * screen.get_width())
-    cowboy_pos[1] = int(norm_cowboy_pos[1] * screen.get_height())
+        # Calculate movement speed relative to reference size
+        normalized_speed = (player_speed * dt) / REF_HEIGHT
     
-    # Update player rectangle position
-    player_rect.center = cowboy_pos
-
-    if playerDead: 
-        current_player_image = dead_image
-        #current_player_image = player_images.get('deadBara.jpg')
-    # === Enemy Movement (Smart AI) ===
-    # Move toward the player
-    dx = cowboy_pos[0] - Xtarget
-    dy = cowboy_pos[1] - Ytarget
-    dist = math.sqrt(dx**2 + dy**2)
-
-    if dist > 0:
-        dx /= dist
-        dy /= dist
-
-    # Add dodge every 1.5 seconds
-    if dodge_timer > 1.5:
-        dodge_timer = 0
-        dodge_dx = random.uniform(-1, 1)
-        dodge_dy = random.uniform(-1, 1)
-
-    # Combine chase and dodge
-    move_x = dx + dodge_dx * 0.3
-    move_y = dy + dodge_dy * 0.3
-    move_dist = math.sqrt(move_x**2 + move_y**2)
-    if move_dist > 0:
-        move_x /= move_dist
-        move_y /= move_dist
-
-    # Update enemy position using normalized speed
-    normalized_enemy_speed = (enemy_speed * dt) / REF_HEIGHT
-    norm_Xtarget += move_x * normalized_enemy_speed * (REF_HEIGHT / REF_WIDTH)
-    norm_Ytarget += move_y * normalized_enemy_speed
-    
-    # Keep normalized coordinates for position tracking
+        if keys[pygame.K_w]:
+            norm_cowboy_pos[1] -= normalized_speed
+            current_player_image = player_images.get('w', current_player_image)
+            moved = True
+        if keys[pygame.K_s]:
+            norm_cowboy_pos[1] += normalized_speed
+            current_player_image = player_images.get('s', current_player_image)
+            moved = True
+        if keys[pygame.K_a]:
+            norm_cowboy_pos[0] -= normalized_speed * (REF_HEIGHT / REF_WIDTH)
+            current_player_image = player_images.get('a', current_player_image)
+            moved = True
+        if keys[pygame.K_d]:
+            norm_cowboy_pos[0] += normalized_speed * (REF_HEIGHT / REF_WIDTH)
+            current_player_image = player_images.get('d', current_player_image)
+            moved = True
+        if keys[pygame.K_q] and playerDead:
+            running = False
+
+        # ✅ Keep player inside screen (in normalized coordinates)
+        norm_cowboy_pos[0] = max(0.05, min(0.95, norm_cowboy_pos[0]))
+        norm_cowboy_pos[1] = max(0.05, min(0.95, norm_cowboy_pos[1]))
     
-    # Keep within screen bounds in normalized coordinates
-    norm_Xtarget = max(0.05, min(0.95, norm_Xtarget))
-    norm_Ytarget = max(0.05, min(0.95, norm_Ytarget))
+        # Convert normalized coordinates to screen coordinates
+        cowboy_pos[0] = int(norm_cowboy_pos[0] * screen.get_width())
+        cowboy_pos[1] = int(norm_cowboy_pos[1] * screen.get_height())
     
-    # Convert back to screen coordinates
-    Xtarget = int(norm_Xtarget * screen.get_width())
-    Ytarget = int(norm_Ytarget * screen.get_height())
+        # Update player rectangle position
+        player_rect.center = cowboy_pos
 
-    # AI shooting
-    if shoot_cooldown >= 1.0:  # Fire every second
+        if playerDead: 
+            current_player_image = dead_image
+            #current_player_image = player_images.get('deadBara.jpg')
+        # === Enemy Movement (Smart AI) ===
+        # Move toward the player
         dx = cowboy_pos[0] - Xtarget
         dy = cowboy_pos[1] - Ytarget
         dist = math.sqrt(dx**2 + dy**2)
-        if dist != 0:
-            dx = (dx / dist) * enemyBulletSpeed
-            dy = (dy / dist) * enemyBulletSpeed
-        enemy_stack.push(Xtarget, Ytarget, dx, dy)
-        shoot_cooldown = 0
-
-    # Move bullets
-    stack.move_all(dt)
-    enemy_stack.move_all(dt)
-    stack.remove_offscreen(screen.get_width(), screen.get_height())
-    enemy_stack.remove_offscreen(screen.get_width(), screen.get_height())
-
-    # Collision check (player bullets hit target)
-    node = stack.top
-    while node:
-        if math.hypot(node.x - Xtarget, node.y - Ytarget) < 50 and target_alive:
-                target_killed = True
-                 # Stop after one hit per bullet frame
-
-        node = node.next
-
-    # Collision check (enemy bullets hit player)
-    node = enemy_stack.top
-    while node:
-        if math.hypot(node.x - cowboy_pos[0], node.y - cowboy_pos[1]) < 50:
+
+        if dist > 0:
+            dx /= dist
+            dy /= dist
+
+        # Add dodge every 1.5 seconds
+        if dodge_timer > 1.5:
+            dodge_timer = 0
+            dodge_dx = random.uniform(-1, 1)
+            dodge_dy = random.uniform(-1, 1)
+
+        # Combine chase and dodge
+        move_x = dx + dodge_dx * 0.3
+        move_y = dy + dodge_dy * 0.3
+        move_dist = math.sqrt(move_x**2 + move_y**2)
+        if move_dist > 0:
+            move_x /= move_dist
+            move_y /= move_dist
+
+        # Update enemy position using normalized speed
+        normalized_enemy_speed = (enemy_speed * dt) / REF_HEIGHT
+        norm_Xtarget += move_x * normalized_enemy_speed * (REF_HEIGHT / REF_WIDTH)
+        norm_Ytarget += move_y * normalized_enemy_speed
+    
+        # Keep normalized coordinates for position tracking
+    
+        # Keep within screen bounds in normalized coordinates
+        norm_Xtarget = max(0.05, min(0.95, norm_Xtarget))
+        norm_Ytarget = max(0.05, min(0.95, norm_Ytarget))
+    
+        # Convert back to screen coordinates
+        Xtarget = int(norm_Xtarget * screen.get_width())
+        Ytarget = int(norm_Ytarget * screen.get_height())
+
+        # AI shooting
+        if shoot_cooldown >= 1.0:  # Fire every second
+            dx = cowboy_pos[0] - Xtarget
+            dy = cowboy_pos[1] - Ytarget
+            dist = math.sqrt(dx**2 + dy**2)
+            if dist != 0:
+                dx = (dx / dist) * enemyBulletSpeed
+                dy = (dy / dist) * enemyBulletSpeed
+            bullets.spawn(Xtarget, Ytarget, dx, dy, OWNER_ENEMY)
+            shoot_cooldown = 0
+
+        # Move bullets
+        bullets.move_all(dt)
+        bullets.remove_offscreen(screen.get_width(), screen.get_height())
+        bullets.fill_grid(player_grid, OWNER_PLAYER)
+        bullets.fill_grid(enemy_grid, OWNER_ENEMY)
+
+        # Collision check (player bullets hit target)
+        if target_alive and len(player_grid.query_radius(Xtarget, Ytarget, 50)):
+            target_killed = True
+
+        # Collision check (enemy bullets hit player)
+        if len(enemy_grid.query_radius(cowboy_pos[0], cowboy_pos[1], 50)):
             print("💀 You got hit!")
             playerDead = True
-        node = node.next
 
-    # Respawn target if killed
-    if target_killed:
-        target_alive = False
-        counter += dt
-        if counter >= 0.5:
-            # Generate normalized random position
-            norm_Xtarget = random.uniform(0.1, 0.9)
-            norm_Ytarget = random.uniform(0.1, 0.9)
-            # Convert to screen coordinates
-            Xtarget = int(norm_Xtarget * screen.get_width())
-            Ytarget = int(norm_Ytarget * screen.get_height())
-            enemy_health -= 1
-            if enemy_health < 0: enemyActuallyDead = True
-            Xtarget = random.randint(100, screen.get_width() - 100)
-            Ytarget = random.randint(100, screen.get_height() - 100)
-            target_alive = True
-            target_killed = False
-            counter = 0
-
-    # Draw everything
+        # Respawn target if killed
+        if target_killed:
+            target_alive = False
+            counter += dt
+            if counter >= 0.5:
+                # Generate normalized random position
+                norm_Xtarget = random.uniform(0.1, 0.9)
+                norm_Ytarget = random.uniform(0.1, 0.9)
+                # Convert to screen coordinates
+                Xtarget = int(norm_Xtarget * screen.get_width())
+                Ytarget = int(norm_Ytarget * screen.get_height())
+                enemy_health -= 1
+                if enemy_health < 0: enemyActuallyDead = True
+                Xtarget = random.randint(100, screen.get_width() - 100)
+                Ytarget = random.randint(100, screen.get_height() - 100)
+                target_alive = True
+                target_killed = False
+                counter = 0
+                prev_target = (Xtarget, Ytarget)  # respawn is a teleport, don't interpolate it
+
+        if session.wants_state:  # a live session ignores the state, don't build it
+            session.end_tick(norm_cowboy_pos, norm_Xtarget, norm_Ytarget, Xtarget, Ytarget, enemy_health,
+                             target_alive, playerDead, shoot_cooldown, dodge_timer, *bullets.positions())
+
+    profiler.stage("render")
+    # Draw everything at the interpolated moment between the last two ticks
+    alpha = timestep.alpha
+    player_rect.center = (lerp(prev_cowboy_pos[0], cowboy_pos[0], alpha),
+                          lerp(prev_cowboy_pos[1], cowboy_pos[1], alpha))
+    draw_x = lerp(prev_target[0], Xtarget, alpha)
+    draw_y = lerp(prev_target[1], Ytarget, alpha)
     screen.fill("white")
-    background_img = pygame.image.load(background_img_path).convert()
     scale_x = screen.get_width() / background_img.get_width()
     scale_y = screen.get_height() / background_img.get_height()
     scale = min(scale_x, scale_y)  # keeps aspect ratio
-    background_scaled = pygame.transform.smoothscale_by(background_img, scale)
+    background_scaled = get_scaled(background_img, (background_img.get_width() * scale, background_img.get_height() * scale))
     screen.blit(background_scaled, (0, 0))
 
     # Draw player character using current image
@@ -366,40 +360,36 @@ while running:
         target_alive = False
 
     if target_alive:
-        enemy_rect = enemy_image.get_rect(center=(Xtarget, Ytarget))
+        enemy_rect = enemy_image.get_rect(center=(draw_x, draw_y))
         screen.blit(enemy_image, enemy_rect)
     else:
-        damaged_enemy_rect = damaged_enemy_image.get_rect(center=(Xtarget, Ytarget))
+        damaged_enemy_rect = damaged_enemy_image.get_rect(center=(draw_x, draw_y))
         screen.blit(damaged_enemy_image, damaged_enemy_rect)
 
-    # Draw player bullets with relative size
-    bullet_radius = denormalize_radius(0.0075, screen)  # 1% of screen size
     bar_width = 100
     bar_height = 10
-    bar_x = Xtarget - bar_width / 2
-    bar_y = Ytarget - 70
+    bar_x = draw_x - bar_width / 2
+    bar_y = draw_y - 70
     health_ratio = max(enemy_health / max_enemy_health, 0)
     pygame.draw.rect(screen, (255, 0, 0), (bar_x, bar_y, bar_width, bar_height))
     pygame.draw.rect(screen, (0, 255, 0), (bar_x, bar_y, bar_width * health_ratio, bar_height))
 
-    # Player bullets
-    node = stack.top
-    while node:
-        pygame.draw.circle(screen, "yellow", (int(node.x), int(node.y)), int(bullet_radius))
-        node = node.next
-
-    # Enemy bullets with relative size
-    node = enemy_stack.top
-    while node:
-        pygame.draw.circle(screen, "red", (int(node.x), int(node.y)), int(bullet_radius))
-        node = node.next
+    # Player and enemy bullets, sized relative to the screen
+    t = timestep.render_offset
+    projectiles.draw(screen, *bullets.positions(OWNER_PLAYER, t), "yellow", bullet_radius)
+    projectiles.draw(screen, *bullets.positions(OWNER_ENEMY, t), "red", bullet_radius)
+    hud.set_counts(bullets=len(bullets))
+    hud.draw(screen, "sebs_minigame")
+    profiler.stage("flip")
     if not freeze:
         pygame.display.flip()
         if playerDead: 
-            count += dt
+            count += frame_dt
             if count >= 0.5:
                 freeze = True
     if playerDead:
         displayDead = True
+    profiler.end_frame()
 
+session.close()
 pygame.quit()
@@ -2,60 +2,39 @@ import pygame
 import math
 import random
 import sys
-
-class Node:
-    def __init__(self, x, y, xSpeed, ySpeed):
-        self.x = x
-        self.y = y
-        self.xSpeed = xSpeed
-        self.ySpeed = ySpeed
-        self.next = None
-
-class LinkedListStack:
-    def __init__(self):
-        self.top = None
-        self.size = 0
-
-    def push(self, x, y , xSpeed, ySpeed):
-        new_node = Node(x, y, xSpeed, ySpeed)
-        new_node.next = self.top
-        self.top = new_node
-        self.size += 1
-
-    def remove_offscreen(self, width, height):
-        prev = None
-        node = self.top
-        while node:
-            if node.x < 0 or node.x > width or node.y < 0 or node.y > height:
-                if prev:
-                    prev.next = node.next
-                else:
-                    self.top = node.next
-                self.size -= 1
-                node = node.next
-                continue
-            prev = node
-            node = node.next
-
-    def move_all(self, dt):
-        node = self.top
-        while node:
-            node.x += node.xSpeed * dt
-            node.y += node.ySpeed * dt
-            node = node.next
+import os
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from utils.asset_manager import AssetManager
+from utils.bullet_pool import BulletPool, OWNER_PLAYER, OWNER_ENEMY
+from utils.spatial_hash import SpatialHash
+from utils.projectile_renderer import ProjectileRenderer
+from utils.fixed_timestep import FixedTimestep, lerp
+from utils.replay import open_session
+from utils.frame_profiler import FrameProfiler
+from utils.perf_hud import PerfHUD
+from utils import tracing
+from utils import draw_counters
+from SebastiansAwesomeCode.hard_engine import HardEnemy, simulate_tick, ENEMY_RADIUS
 
 pygame.init()
 screen = pygame.display.set_mode((1280, 720), pygame.RESIZABLE)
 clock = pygame.time.Clock()
+# live play, or record/replay when SPACECOWBOY_RECORD / SPACECOWBOY_REPLAY is set (seeds random)
+session = open_session(screen.get_size())
+profiler = FrameProfiler.get_instance()
+hud = PerfHUD.get_instance()  # F3 toggles the performance overlay
 running = True
 
 # Load player character images
-project_root = __file__.rsplit('SebastiansAwesomeCode', 1)[0]
+assets = AssetManager.get_instance()
 player_images = {}
 for direction in ['w', 'a', 's', 'd']:
     try:
-        img_path = f"{project_root}assets/images/{direction}Capy.png"
-        player_images[direction] = pygame.image.load(img_path)
+        player_images[direction] = assets.get(f"player_{direction}")
     except Exception as e:
         print(f"Failed to load player image {direction}Capy.png: {e}", file=sys.stderr)
 
@@ -68,33 +47,36 @@ if not current_player_image:  # Fallback if image loading failed
 
 cowboy_pos = [screen.get_width() // 2, screen.get_height() // 2]
 player_rect = current_player_image.get_rect(center=cowboy_pos)
-stack = LinkedListStack()       # Player bullets
-enemy_stack = LinkedListStack() # Enemy bullets
+bullets = BulletPool()  # Player and enemy bullets (tagged by owner)
+projectiles = ProjectileRenderer()  # one pre-drawn sprite per bullet color, batched blits
+player_grid = SpatialHash()  # player bullets bucketed by cell, rebuilt each tick
+enemy_grid = SpatialHash()   # enemy bullets bucketed by cell
 
 bulletSpeed = 600
-enemyBulletSpeed = 400
 speed = 300
-target_speed = 120
 target_alive = True
 target_killed = False
 counter = 0
-shoot_cooldown = 0
-
-# Enemy     
-Xtarget = random.randint(100, screen.get_width() - 100)
-Ytarget = random.randint(100, screen.get_height() - 100)
 
-# Enemy movement direction
-target_dir = [random.choice([-1, 1]), random.choice([-1, 1])]
+# Enemy (wanders, dodges and shoots; see hard_engine)
+target = HardEnemy(random.randint(100, screen.get_width() - 100),
+                   random.randint(100, screen.get_height() - 100),
+                   [random.choice([-1, 1]), random.choice([-1, 1])])
+enemies = [target]
 
-# Enemy radius
-ENEMY_RADIUS = 50
+# Simulation runs at settings.PHYSICS_TIMESTEP; drawing interpolates between the last two ticks
+timestep = FixedTimestep()
+prev_cowboy_pos = tuple(cowboy_pos)
+prev_target = (target.x, target.y)
 
 while running:
-    dt = clock.tick(60) / 1000
-    shoot_cooldown += dt
+    frame_dt = session.tick(clock, 60)
+    profiler.begin_frame("sebs_minigame_hard")
+    profiler.stage("events")
 
-    for event in pygame.event.get():
+    for event in session.poll_events():
+        if hud.handle_event(event) or tracing.handle_event(event) or draw_counters.handle_event(event):
+            continue
         if event.type == pygame.QUIT:
             running = False
 
@@ -107,143 +89,89 @@ while running:
             if dist != 0:
                 dx = (dx / dist) * bulletSpeed
                 dy = (dy / dist) * bulletSpeed
-            stack.push(cowboy_pos[0], cowboy_pos[1], dx, dy)
-
-    # Player movement and image updates
-    keys = pygame.key.get_pressed()
-    moved = False
-    if keys[pygame.K_w]:
-        cowboy_pos[1] -= speed * dt
-        current_player_image = player_images.get('w', current_player_image)
-        moved = True
-    if keys[pygame.K_s]:
-        cowboy_pos[1] += speed * dt
-        current_player_image = player_images.get('s', current_player_image)
-        moved = True
-    if keys[pygame.K_a]:
-        cowboy_pos[0] -= speed * dt
-        current_player_image = player_images.get('a', current_player_image)
-        moved = True
-    if keys[pygame.K_d]:
-        cowboy_pos[0] += speed * dt
-        current_player_image = player_images.get('d', current_player_image)
-        moved = True
+            bullets.spawn(cowboy_pos[0], cowboy_pos[1], dx, dy, OWNER_PLAYER)
+
+    profiler.stage("update")
+    for dt in timestep.steps(frame_dt):
+        prev_cowboy_pos = tuple(cowboy_pos)
+        prev_target = (target.x, target.y)
+
+        # Player movement and image updates
+        keys = session.get_pressed()
+        moved = False
+        if keys[pygame.K_w]:
+            cowboy_pos[1] -= speed * dt
+            current_player_image = player_images.get('w', current_player_image)
+            moved = True
+        if keys[pygame.K_s]:
+            cowboy_pos[1] += speed * dt
+            current_player_image = player_images.get('s', current_player_image)
+            moved = True
+        if keys[pygame.K_a]:
+            cowboy_pos[0] -= speed * dt
+            current_player_image = player_images.get('a', current_player_image)
+            moved = True
+        if keys[pygame.K_d]:
+            cowboy_pos[0] += speed * dt
+            current_player_image = player_images.get('d', current_player_image)
+            moved = True
     
-    # Update player rectangle position
-    player_rect.center = cowboy_pos
-
-    # Enemy movement (wanders and dodges player bullets)
-    Xtarget += target_dir[0] * target_speed * dt
-    Ytarget += target_dir[1] * target_speed * dt
-
-    # Keep enemy inside the screen
-    if Xtarget < ENEMY_RADIUS:
-        Xtarget = ENEMY_RADIUS
-        target_dir[0] = abs(target_dir[0])  # Bounce right
-    elif Xtarget > screen.get_width() - ENEMY_RADIUS:
-        Xtarget = screen.get_width() - ENEMY_RADIUS
-        target_dir[0] = -abs(target_dir[0])  # Bounce left
-
-    if Ytarget < ENEMY_RADIUS:
-        Ytarget = ENEMY_RADIUS
-        target_dir[1] = abs(target_dir[1])  # Bounce down
-    elif Ytarget > screen.get_height() - ENEMY_RADIUS:
-        Ytarget = screen.get_height() - ENEMY_RADIUS
-        target_dir[1] = -abs(target_dir[1])  # Bounce up
-
-    # Occasionally change direction randomly
-    if random.random() < 0.01:
-        target_dir = [random.choice([-1, 0, 1]), random.choice([-1, 0, 1])]
-
-    # Dodge nearest bullet if too close
-    node = stack.top
-    while node:
-        dist = math.hypot(node.x - Xtarget, node.y - Ytarget)
-        if dist < 200:  # Dodge if bullet nearby
-            if node.x < Xtarget:
-                target_dir[0] = 1
-            else:
-                target_dir[0] = -1
-            if node.y < Ytarget:
-                target_dir[1] = 1
-            else:
-                target_dir[1] = -1
-        node = node.next
-
-    # Enemy shooting logic — fires every 0.5 seconds
-    if shoot_cooldown >= 0.5:
-        # Predictive shot
-        dx = cowboy_pos[0] - Xtarget
-        dy = cowboy_pos[1] - Ytarget
+        # Update player rectangle position
+        player_rect.center = cowboy_pos
+
+        # Enemy and bullets; the enemy leads its aimed shot by 0.3 s of player movement
         player_speed_x = (keys[pygame.K_d] - keys[pygame.K_a]) * speed
         player_speed_y = (keys[pygame.K_s] - keys[pygame.K_w]) * speed
+        aim = (cowboy_pos[0] + player_speed_x * 0.3, cowboy_pos[1] + player_speed_y * 0.3)
+        simulate_tick(dt, enemies, bullets, player_grid, enemy_grid, aim,
+                      screen.get_width(), screen.get_height())
 
-        predicted_x = cowboy_pos[0] + player_speed_x * 0.3
-        predicted_y = cowboy_pos[1] + player_speed_y * 0.3
-        dx = predicted_x - Xtarget
-        dy = predicted_y - Ytarget
-        dist = math.sqrt(dx**2 + dy**2)
-        if dist != 0:
-            dx = (dx / dist) * enemyBulletSpeed
-            dy = (dy / dist) * enemyBulletSpeed
-        enemy_stack.push(Xtarget, Ytarget, dx, dy)
-
-        # Random bullet
-        angle = random.uniform(0, math.tau)
-        dx2 = math.cos(angle) * enemyBulletSpeed
-        dy2 = math.sin(angle) * enemyBulletSpeed
-        enemy_stack.push(Xtarget, Ytarget, dx2, dy2)
-
-        shoot_cooldown = 0
-
-    # Move bullets
-    stack.move_all(dt)
-    enemy_stack.move_all(dt)
-    stack.remove_offscreen(screen.get_width(), screen.get_height())
-    enemy_stack.remove_offscreen(screen.get_width(), screen.get_height())
-
-    # Collision check (player bullets hit target)
-    node = stack.top
-    while node:
-        if math.hypot(node.x - Xtarget, node.y - Ytarget) < ENEMY_RADIUS:
+        # Collision check (player bullets hit target)
+        if len(player_grid.query_radius(target.x, target.y, ENEMY_RADIUS)):
             target_killed = True
             target_alive = False
-        node = node.next
 
-    # Collision check (enemy bullets hit player)
-    node = enemy_stack.top
-    while node:
-        if math.hypot(node.x - cowboy_pos[0], node.y - cowboy_pos[1]) < 50:
+        # Collision check (enemy bullets hit player)
+        if len(enemy_grid.query_radius(cowboy_pos[0], cowboy_pos[1], 50)):
             print("💀 You got hit!")
             running = False
-        node = node.next
-
-    # Respawn target if killed
-    if target_killed:
-        counter += dt
-        if counter >= 0.5:
-            Xtarget = random.randint(100, screen.get_width() - 100)
-            Ytarget = random.randint(100, screen.get_height() - 100)
-            target_alive = True
-            target_killed = False
-            counter = 0
-
-    # Draw everything
+
+        # Respawn target if killed
+        if target_killed:
+            counter += dt
+            if counter >= 0.5:
+                target.x = random.randint(100, screen.get_width() - 100)
+                target.y = random.randint(100, screen.get_height() - 100)
+                target_alive = True
+                target_killed = False
+                counter = 0
+                prev_target = (target.x, target.y)  # respawn is a teleport, don't interpolate it
+
+        if session.wants_state:  # a live session ignores the state, don't build it
+            session.end_tick(cowboy_pos, target.x, target.y, target.dir, target_alive, target.cooldown,
+                             *bullets.positions())
+
+    profiler.stage("render")
+    # Draw everything at the interpolated moment between the last two ticks
+    alpha = timestep.alpha
+    player_rect.center = (lerp(prev_cowboy_pos[0], cowboy_pos[0], alpha),
+                          lerp(prev_cowboy_pos[1], cowboy_pos[1], alpha))
+    draw_x = int(lerp(prev_target[0], target.x, alpha))
+    draw_y = int(lerp(prev_target[1], target.y, alpha))
     screen.fill("white")
     # Draw player character using current image
     screen.blit(current_player_image, player_rect)
     if target_alive:
-        pygame.draw.circle(screen, "green", (int(Xtarget), int(Ytarget)), ENEMY_RADIUS)
+        pygame.draw.circle(screen, "green", (draw_x, draw_y), ENEMY_RADIUS)
     else:
-        pygame.draw.circle(screen, "red", (int(Xtarget), int(Ytarget)), ENEMY_RADIUS)
-    node = stack.top
-    while node:
-        pygame.draw.circle(screen, "yellow", (int(node.x), int(node.y)), 8)
-        node = node.next
-    node = enemy_stack.top
-    while node:
-        pygame.draw.circle(screen, "red", (int(node.x), int(node.y)), 8)
-        node = node.next
+        pygame.draw.circle(screen, "red", (draw_x, draw_y), ENEMY_RADIUS)
+    projectiles.draw(screen, *bullets.positions(OWNER_PLAYER, timestep.render_offset), "yellow", 8)
+    projectiles.draw(screen, *bullets.positions(OWNER_ENEMY, timestep.render_offset), "red", 8)
+    hud.set_counts(bullets=len(bullets))
+    hud.draw(screen, "sebs_minigame_hard")
+    profiler.stage("flip")
     pygame.display.flip()
+    profiler.end_frame()
 
+session.close()
 pygame.quit()
@@ -2,61 +2,39 @@ import pygame
 import math
 import random
 import sys
-
-class Node:
-    def __init__(self, x, y, xSpeed, ySpeed):
-        self.x = x
-        self.y = y
-        self.xSpeed = xSpeed
-        self.ySpeed = ySpeed
-        self.next = None
-
-class LinkedListStack:
-    def __init__(self):
-        self.top = None
-        self.size = 0
-
-    def push(self, x, y, xSpeed, ySpeed):
-        new_node = Node(x, y, xSpeed, ySpeed)
-        new_node.next = self.top
-        self.top = new_node
-        self.size += 1
-
-    def remove_offscreen(self, width, height):
-        prev = None
-        node = self.top
-        while node:
-            if node.x < 0 or node.x > width or node.y < 0 or node.y > height:
-                if prev:
-                    prev.next = node.next
-                else:
-                    self.top = node.next
-                self.size -= 1
-                node = node.next
-                continue
-            prev = node
-            node = node.next
-
-    def move_all(self, dt):
-        node = self.top
-        while node:
-            node.x += node.xSpeed * dt
-            node.y += node.ySpeed * dt
-            node = node.next
-
+import os
+import numpy as np
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from utils.asset_manager import AssetManager
+from utils.bullet_pool import BulletPool, OWNER_PLAYER, OWNER_ENEMY
+from utils.spatial_hash import SpatialHash
+from utils.projectile_renderer import ProjectileRenderer
+from utils.fixed_timestep import FixedTimestep, lerp
+from utils.replay import open_session
+from utils.frame_profiler import FrameProfiler
+from utils.perf_hud import PerfHUD
+from utils import tracing
+from utils import draw_counters
 
 pygame.init()
 screen = pygame.display.set_mode((1280, 720), pygame.RESIZABLE)
 clock = pygame.time.Clock()
+# live play, or record/replay when SPACECOWBOY_RECORD / SPACECOWBOY_REPLAY is set (seeds random)
+session = open_session(screen.get_size())
+profiler = FrameProfiler.get_instance()
+hud = PerfHUD.get_instance()  # F3 toggles the performance overlay
 running = True
 
 # Load player character images
-project_root = __file__.rsplit('SebastiansAwesomeCode', 1)[0]
+assets = AssetManager.get_instance()
 player_images = {}
 for direction in ['w', 'a', 's', 'd']:
     try:
-        img_path = f"{project_root}assets/images/{direction}Capy.png"
-        player_images[direction] = pygame.image.load(img_path)
+        player_images[direction] = assets.get(f"player_{direction}")
     except Exception as e:
         print(f"Failed to load player image {direction}Capy.png: {e}", file=sys.stderr)
 
@@ -69,8 +47,10 @@ if not current_player_image:  # Fallback if image loading failed
 
 cowboy_pos = [screen.get_width() // 2, screen.get_height() // 2]
 player_rect = current_player_image.get_rect(center=cowboy_pos)
-stack = LinkedListStack()       # Player bullets
-enemy_stack = LinkedListStack() # Enemy bullets
+bullets = BulletPool()  # Player and enemy bullets (tagged by owner)
+projectiles = ProjectileRenderer()  # one pre-drawn sprite per bullet color, batched blits
+player_grid = SpatialHash()  # player bullets bucketed by cell, rebuilt each tick
+enemy_grid = SpatialHash()   # enemy bullets bucketed by cell
 
 bulletSpeed = 600
 enemyBulletSpeed = 400
@@ -89,11 +69,19 @@ Ytarget = random.randint(100, screen.get_height() - 100)
 target_dir_x = random.uniform(-1, 1)
 target_dir_y = random.uniform(-1, 1)
 
+# Simulation runs at settings.PHYSICS_TIMESTEP; drawing interpolates between the last two ticks
+timestep = FixedTimestep()
+prev_cowboy_pos = tuple(cowboy_pos)
+prev_target = (Xtarget, Ytarget)
+
 while running:
-    dt = clock.tick(60) / 1000
-    shoot_cooldown += dt
+    frame_dt = session.tick(clock, 60)
+    profiler.begin_frame("sebs_minigame_medium")
+    profiler.stage("events")
 
-    for event in pygame.event.get():
+    for event in session.poll_events():
+        if hud.handle_event(event) or tracing.handle_event(event) or draw_counters.handle_event(event):
+            continue
         if event.type == pygame.QUIT:
             running = False
 
@@ -106,149 +94,154 @@ while running:
             if dist != 0:
                 dx = (dx / dist) * bulletSpeed
                 dy = (dy / dist) * bulletSpeed
-            stack.push(cowboy_pos[0], cowboy_pos[1], dx, dy)
-
-    # --- Player movement and image updates ---
-    keys = pygame.key.get_pressed()
-    moved = False
-    if keys[pygame.K_w]:
-        cowboy_pos[1] -= speed * dt
-        current_player_image = player_images.get('w', current_player_image)
-        moved = True
-    if keys[pygame.K_s]:
-        cowboy_pos[1] += speed * dt
-        current_player_image = player_images.get('s', current_player_image)
-        moved = True
-    if keys[pygame.K_a]:
-        cowboy_pos[0] -= speed * dt
-        current_player_image = player_images.get('a', current_player_image)
-        moved = True
-    if keys[pygame.K_d]:
-        cowboy_pos[0] += speed * dt
-        current_player_image = player_images.get('d', current_player_image)
-        moved = True
+            bullets.spawn(cowboy_pos[0], cowboy_pos[1], dx, dy, OWNER_PLAYER)
+
+    profiler.stage("update")
+    for dt in timestep.steps(frame_dt):
+        prev_cowboy_pos = tuple(cowboy_pos)
+        prev_target = (Xtarget, Ytarget)
+        shoot_cooldown += dt
+
+        # --- Player movement and image updates ---
+        keys = session.get_pressed()
+        moved = False
+        if keys[pygame.K_w]:
+            cowboy_pos[1] -= speed * dt
+            current_player_image = player_images.get('w', current_player_image)
+            moved = True
+        if keys[pygame.K_s]:
+            cowboy_pos[1] += speed * dt
+            current_player_image = player_images.get('s', current_player_image)
+            moved = True
+        if keys[pygame.K_a]:
+            cowboy_pos[0] -= speed * dt
+            current_player_image = player_images.get('a', current_player_image)
+            moved = True
+        if keys[pygame.K_d]:
+            cowboy_pos[0] += speed * dt
+            current_player_image = player_images.get('d', current_player_image)
+            moved = True
     
-    # Update player rectangle position
-    player_rect.center = cowboy_pos
-
-    # --- Enemy AI (smart dodging + movement) ---
-    dodge_x, dodge_y = 0, 0
-    threat_count = 0
-
-    node = stack.top
-    while node:
-        dx = node.x - Xtarget
-        dy = node.y - Ytarget
-        dist = math.hypot(dx, dy)
-        if dist < 300:
+        # Update player rectangle position
+        player_rect.center = cowboy_pos
+
+        # --- Enemy AI (smart dodging + movement) ---
+        dodge_x, dodge_y = 0, 0
+        threat_count = 0
+
+        bullets.fill_grid(player_grid, OWNER_PLAYER)
+        threats = player_grid.query_radius(Xtarget, Ytarget, 300)
+        threat_count = len(threats)
+        if threat_count:
+            dist = np.hypot(bullets.x[threats] - Xtarget, bullets.y[threats] - Ytarget)
             # Predict bullet trajectory by its velocity direction
-            bullet_angle = math.atan2(node.ySpeed, node.xSpeed)
-            # Vector perpendicular to bullet (strafing)
-            strafe_x = -math.sin(bullet_angle)
-            strafe_y = math.cos(bullet_angle)
-            # Move sideways relative to bullet path
-            dodge_x += strafe_x * (300 - dist) / 300
-            dodge_y += strafe_y * (300 - dist) / 300
-            threat_count += 1
-        node = node.next
-
-    # Normalize dodge
-    mag = math.hypot(dodge_x, dodge_y)
-    if mag > 0:
-        dodge_x /= mag
-        dodge_y /= mag
-
-    # If no bullets nearby, roam naturally
-    if threat_count == 0:
-        # Gradually change direction for smooth wandering
-        target_dir_x += random.uniform(-0.3, 0.3) * dt
-        target_dir_y += random.uniform(-0.3, 0.3) * dt
-        mag = math.hypot(target_dir_x, target_dir_y)
+            bullet_angle = np.arctan2(bullets.vy[threats], bullets.vx[threats])
+            # Move sideways (perpendicular to the bullet path), harder for closer bullets
+            weight = (300 - dist) / 300
+            dodge_x = float(np.sum(-np.sin(bullet_angle) * weight))
+            dodge_y = float(np.sum(np.cos(bullet_angle) * weight))
+
+        # Normalize dodge
+        mag = math.hypot(dodge_x, dodge_y)
         if mag > 0:
-            target_dir_x /= mag
-            target_dir_y /= mag
-        move_x = target_dir_x
-        move_y = target_dir_y
-    else:
-        # Combine dodging with a little random jitter
-        move_x = dodge_x + random.uniform(-0.1, 0.1)
-        move_y = dodge_y + random.uniform(-0.1, 0.1)
-
-    # Move the target
-    Xtarget += move_x * target_speed * dt
-    Ytarget += move_y * target_speed * dt
-
-    # Keep inside the screen
-    if Xtarget < 50 or Xtarget > screen.get_width() - 50:
-        target_dir_x *= -1
-    if Ytarget < 50 or Ytarget > screen.get_height() - 50:
-        target_dir_y *= -1
-    Xtarget = max(50, min(screen.get_width() - 50, Xtarget))
-    Ytarget = max(50, min(screen.get_height() - 50, Ytarget))
-
-    # --- AI shooting ---
-    if shoot_cooldown >= 1.2:  # Fire every 1.2 seconds
-        dx = cowboy_pos[0] - Xtarget
-        dy = cowboy_pos[1] - Ytarget
-        dist = math.sqrt(dx**2 + dy**2)
-        if dist != 0:
-            dx = (dx / dist) * enemyBulletSpeed
-            dy = (dy / dist) * enemyBulletSpeed
-        enemy_stack.push(Xtarget, Ytarget, dx, dy)
-        shoot_cooldown = 0
-
-    # --- Update bullets ---
-    stack.move_all(dt)
-    enemy_stack.move_all(dt)
-    stack.remove_offscreen(screen.get_width(), screen.get_height())
-    enemy_stack.remove_offscreen(screen.get_width(), screen.get_height())
-
-    # --- Collision detection ---
-    node = stack.top
-    while node:
-        if math.hypot(node.x - Xtarget, node.y - Ytarget) < 50:
+            dodge_x /= mag
+            dodge_y /= mag
+
+        # If no bullets nearby, roam naturally
+        if threat_count == 0:
+            # Gradually change direction for smooth wandering
+            target_dir_x += random.uniform(-0.3, 0.3) * dt
+            target_dir_y += random.uniform(-0.3, 0.3) * dt
+            mag = math.hypot(target_dir_x, target_dir_y)
+            if mag > 0:
+                target_dir_x /= mag
+                target_dir_y /= mag
+            move_x = target_dir_x
+            move_y = target_dir_y
+        else:
+            # Combine dodging with a little random jitter
+            move_x = dodge_x + random.uniform(-0.1, 0.1)
+            move_y = dodge_y + random.uniform(-0.1, 0.1)
+
+        # Move the target
+        Xtarget += move_x * target_speed * dt
+        Ytarget += move_y * target_speed * dt
+
+        # Keep inside the screen
+        if Xtarget < 50 or Xtarget > screen.get_width() - 50:
+            target_dir_x *= -1
+        if Ytarget < 50 or Ytarget > screen.get_height() - 50:
+            target_dir_y *= -1
+        Xtarget = max(50, min(screen.get_width() - 50, Xtarget))
+        Ytarget = max(50, min(screen.get_height() - 50, Ytarget))
+
+        # --- AI shooting ---
+        if shoot_cooldown >= 1.2:  # Fire every 1.2 seconds
+            dx = cowboy_pos[0] - Xtarget
+            dy = cowboy_pos[1] - Ytarget
+            dist = math.sqrt(dx**2 + dy**2)
+            if dist != 0:
+                dx = (dx / dist) * enemyBulletSpeed
+                dy = (dy / dist) * enemyBulletSpeed
+            bullets.spawn(Xtarget, Ytarget, dx, dy, OWNER_ENEMY)
+            shoot_cooldown = 0
+
+        # --- Update bullets ---
+        bullets.move_all(dt)
+        bullets.remove_offscreen(screen.get_width(), screen.get_height())
+        bullets.fill_grid(player_grid, OWNER_PLAYER)
+        bullets.fill_grid(enemy_grid, OWNER_ENEMY)
+
+        # --- Collision detection ---
+        if len(player_grid.query_radius(Xtarget, Ytarget, 50)):
             target_killed = True
             target_alive = False
-        node = node.next
 
-    node = enemy_stack.top
-    while node:
-        if math.hypot(node.x - cowboy_pos[0], node.y - cowboy_pos[1]) < 50:
+        if len(enemy_grid.query_radius(cowboy_pos[0], cowboy_pos[1], 50)):
             print("💀 You got hit!")
             running = False
-        node = node.next
-
-    # Respawn target if killed
-    if target_killed:
-        counter += dt
-        if counter >= 0.5:
-            Xtarget = random.randint(100, screen.get_width() - 100)
-            Ytarget = random.randint(100, screen.get_height() - 100)
-            target_alive = True
-            target_killed = False
-            counter = 0
-
-    # --- Drawing ---
+
+        # Respawn target if killed
+        if target_killed:
+            counter += dt
+            if counter >= 0.5:
+                Xtarget = random.randint(100, screen.get_width() - 100)
+                Ytarget = random.randint(100, screen.get_height() - 100)
+                target_alive = True
+                target_killed = False
+                counter = 0
+                prev_target = (Xtarget, Ytarget)  # respawn is a teleport, don't interpolate it
+
+        if session.wants_state:  # a live session ignores the state, don't build it
+            session.end_tick(cowboy_pos, Xtarget, Ytarget, target_dir_x, target_dir_y, target_alive,
+                             shoot_cooldown, *bullets.positions())
+
+    profiler.stage("render")
+    # --- Drawing (interpolated between the last two ticks) ---
+    alpha = timestep.alpha
+    player_rect.center = (lerp(prev_cowboy_pos[0], cowboy_pos[0], alpha),
+                          lerp(prev_cowboy_pos[1], cowboy_pos[1], alpha))
+    draw_x = int(lerp(prev_target[0], Xtarget, alpha))
+    draw_y = int(lerp(prev_target[1], Ytarget, alpha))
     screen.fill("white")
     # Draw player character using current image
     screen.blit(current_player_image, player_rect)
     if target_alive:
-        pygame.draw.circle(screen, "green", (int(Xtarget), int(Ytarget)), 50)
+        pygame.draw.circle(screen, "green", (draw_x, draw_y), 50)
     else:
-        pygame.draw.circle(screen, "red", (int(Xtarget), int(Ytarget)), 50)
+        pygame.draw.circle(screen, "red", (draw_x, draw_y), 50)
 
     # Player bullets
-    node = stack.top
-    while node:
-        pygame.draw.circle(screen, "yellow", (int(node.x), int(node.y)), 8)
-        node = node.next
+    projectiles.draw(screen, *bullets.positions(OWNER_PLAYER, timestep.render_offset), "yellow", 8)
 
     # Enemy bullets
-    node = enemy_stack.top
-    while node:
-        pygame.draw.circle(screen, "red", (int(node.x), int(node.y)), 8)
-        node = node.next
+    projectiles.draw(screen, *bullets.positions(OWNER_ENEMY, timestep.render_offset), "red", 8)
 
+    hud.set_counts(bullets=len(bullets))
+    hud.draw(screen, "sebs_minigame_medium")
+    profiler.stage("flip")
     pygame.display.flip()
+    profiler.end_frame()
 
+session.close()
 pygame.quit()
@@ -0,0 +1,95 @@
+"""
+The enemy and bullet update of SebsMinigameHard, shared with benchmarks/stress.py.
+
+HardEnemy holds one enemy's state. simulate_tick() runs one simulation tick for a list of
+them: each enemy wanders, bounces off the screen edges, dodges the nearest player bullet and
+fires twice every 0.5 s (one shot at `aim`, one in a random direction). Then every bullet
+moves, off-screen bullets are culled and both grids are rebuilt for the caller's collision
+checks. The minigame runs it with a single enemy, the stress sweep with N of them.
+
+Randomness comes from `rng`, which needs the `random` module's interface. The minigame
+passes `random` itself so recorded replays stay deterministic.
+
+Usage:
+    enemy = HardEnemy(x, y, [1, -1])
+    simulate_tick(dt, [enemy], bullets, player_grid, enemy_grid, aim, width, height)
+    if len(player_grid.query_radius(enemy.x, enemy.y, ENEMY_RADIUS)): ...
+"""
+import math
+import random
+import numpy as np
+from utils.bullet_pool import OWNER_PLAYER, OWNER_ENEMY
+
+ENEMY_RADIUS = 50
+ENEMY_SPEED = 120
+ENEMY_BULLET_SPEED = 400
+FIRE_INTERVAL = 0.5   # seconds between volleys
+DODGE_RADIUS = 200    # player bullets closer than this make the enemy dodge
+TURN_CHANCE = 0.01    # chance per tick of picking a new random direction
+
+
+class HardEnemy:
+    def __init__(self, x, y, direction, cooldown=0.0):
+        self.x = x
+        self.y = y
+        self.dir = direction  # [dx, dy], each -1, 0 or 1
+        self.cooldown = cooldown
+
+    def update(self, dt, bullets, player_grid, aim, width, height, rng=random):
+        """Move, dodge and fire; player_grid must hold the player's bullets."""
+        self.cooldown += dt
+        self.x += self.dir[0] * ENEMY_SPEED * dt
+        self.y += self.dir[1] * ENEMY_SPEED * dt
+
+        # Keep the enemy inside the screen
+        if self.x < ENEMY_RADIUS:
+            self.x = ENEMY_RADIUS
+            self.dir[0] = abs(self.dir[0])  # Bounce right
+        elif self.x > width - ENEMY_RADIUS:
+            self.x = width - ENEMY_RADIUS
+            self.dir[0] = -abs(self.dir[0])  # Bounce left
+        if self.y < ENEMY_RADIUS:
+            self.y = ENEMY_RADIUS
+            self.dir[1] = abs(self.dir[1])  # Bounce down
+        elif self.y > height - ENEMY_RADIUS:
+            self.y = height - ENEMY_RADIUS
+            self.dir[1] = -abs(self.dir[1])  # Bounce up
+
+        # Occasionally change direction randomly
+        if rng.random() < TURN_CHANCE:
+            self.dir = [rng.choice([-1, 0, 1]), rng.choice([-1, 0, 1])]
+
+        # Dodge the nearest bullet if it is too close
+        threats = player_grid.query_radius(self.x, self.y, DODGE_RADIUS)
+        if len(threats):
+            dist = np.hypot(bullets.x[threats] - self.x, bullets.y[threats] - self.y)
+            nearest = threats[np.argmin(dist)]
+            self.dir[0] = 1 if bullets.x[nearest] < self.x else -1
+            self.dir[1] = 1 if bullets.y[nearest] < self.y else -1
+
+        if self.cooldown >= FIRE_INTERVAL:
+            # Aimed shot
+            dx = aim[0] - self.x
+            dy = aim[1] - self.y
+            dist = math.sqrt(dx**2 + dy**2)
+            if dist != 0:
+                dx = (dx / dist) * ENEMY_BULLET_SPEED
+                dy = (dy / dist) * ENEMY_BULLET_SPEED
+            bullets.spawn(self.x, self.y, dx, dy, OWNER_ENEMY)
+
+            # Random bullet
+            angle = rng.uniform(0, math.tau)
+            bullets.spawn(self.x, self.y, math.cos(angle) * ENEMY_BULLET_SPEED,
+                          math.sin(angle) * ENEMY_BULLET_SPEED, OWNER_ENEMY)
+            self.cooldown = 0
+
+
+def simulate_tick(dt, enemies, bullets, player_grid, enemy_grid, aim, width, height, rng=random):
+    """Update every enemy, then move and cull the bullets and rebuild both grids."""
+    bullets.fill_grid(player_grid, OWNER_PLAYER)
+    for enemy in enemies:
+        enemy.update(dt, bullets, player_grid, aim, width, height, rng)
+    bullets.move_all(dt)
+    bullets.remove_offscreen(width, height)
+    bullets.fill_grid(player_grid, OWNER_PLAYER)
+    bullets.fill_grid(enemy_grid, OWNER_ENEMY)
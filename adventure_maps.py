@@ -11,8 +11,9 @@ Progress for each map is tracked separately via the ProgressManager.
 """
 import os
 import pygame
-from utils.ui_scaling import normalize_point, normalize_radius, get_ref_size
+from utils.ui_scaling import normalize_point, normalize_radius
 from utils.progress_manager import ProgressManager
+from utils.image_probe import image_size, save_image_sizes
 
 # Constants
 MAPS_DIR = os.path.join('assets', 'images', 'maps')
@@ -128,12 +129,11 @@ def normalize_map_encounters(map_data):
     """
     Normalize encounter positions and radii for a map using the background image size as reference.
     This ensures encounters stay in the right relative positions when the window is resized.
+    The size is read from the image header (no pixel decode), so this is cheap to call again.
     """
     try:
-        # Load background image to get reference size
-        bg_image = pygame.image.load(map_data['bg_image'])
-        ref_size = get_ref_size(bg_image, None)
-        
+        ref_size = image_size(map_data['bg_image'])
+
         # Normalize each encounter's position and radius
         for enc in map_data['encounters']:
             pos = enc['pos']
@@ -147,7 +147,8 @@ def normalize_map_encounters(map_data):
 def init_maps():
     """
     Initialize all maps by normalizing their encounter positions.
-    Call this once when loading the game.
+    Only image headers are read, so this costs microseconds per map.
     """
     for map_data in WORLD_MAPS.values():
-        normalize_map_encounters(map_data)
\ No newline at end of file
+        normalize_map_encounters(map_data)
+    save_image_sizes()
\ No newline at end of file
@@ -0,0 +1,65 @@
+"""
+Micro-benchmark: per-bullet pygame.draw.circle vs. batched sprite blits (ProjectileRenderer).
+
+Runs headless (SDL dummy video driver) on a 1280x720 surface and prints the mean time
+per frame for drawing N bullets each way.
+
+Usage:
+    python benchmarks/bench_projectiles.py [--frames 50] [--radius 8]
+"""
+import argparse
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import numpy as np
+import pygame
+from utils.projectile_renderer import ProjectileRenderer
+
+WIDTH, HEIGHT = 1280, 720
+COUNTS = (100, 1000, 10000)
+
+
+def draw_circles(screen, xs, ys, color, radius):
+    for bx, by in zip(xs, ys):
+        pygame.draw.circle(screen, color, (int(bx), int(by)), radius)
+
+
+def time_frames(draw, screen, xs, ys, radius, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        screen.fill("white")
+        draw(screen, xs, ys, "yellow", radius)
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=50)
+    parser.add_argument("--radius", type=int, default=8)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    renderer = ProjectileRenderer()
+    rng = np.random.default_rng(0)
+
+    print(f"{'bullets':>8} {'draw.circle ms':>15} {'blits ms':>10} {'speedup':>8}")
+    for n in COUNTS:
+        xs = rng.uniform(0, WIDTH, n)
+        ys = rng.uniform(0, HEIGHT, n)
+        circle_ms = time_frames(draw_circles, screen, xs, ys, args.radius, args.frames)
+        blits_ms = time_frames(renderer.draw, screen, xs, ys, args.radius, args.frames)
+        print(f"{n:>8} {circle_ms:>15.3f} {blits_ms:>10.3f} {circle_ms / blits_ms:>7.1f}x")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
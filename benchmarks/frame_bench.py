@@ -0,0 +1,370 @@
+"""
+Headless frame-time benchmark for every screen.
+
+Drives the main menu, the planet select screen (PlayScreen), an AdventureMap and each
+SebsMinigame variant for N frames under SDL's dummy video driver, with scripted mouse and
+keyboard input. Frame and stage times come from the FrameProfiler marks in each loop.
+
+- The clock is replaced by one that reports a steady 60 FPS without sleeping, so every
+  frame runs exactly one simulation step and the run takes as long as the work does.
+- Each scene runs in its own subprocess, so caches and display state never leak between
+  scenes.
+
+For each scene it reports:
+- p50/p95/p99/mean/max frame time
+- mean ms per stage, and the update (events + update) versus render (render + flip) split
+- net allocated blocks and GC collections per frame
+- the GC pause histogram from utils.gc_scheduler, which runs for every scene as it does in
+  the game
+- with --draw-counters, per-frame draw/transform/font/display/blit calls, pixels and time by
+  calling module (utils/draw_counters.py; the blit hook makes frame times slower)
+- with --tracemalloc, the mean per-frame peak of traced memory, in KB
+
+Usage:
+    python benchmarks/frame_bench.py                       # all scenes, JSON on stdout
+    python benchmarks/frame_bench.py --frames 600 --out frame_bench.json
+    python benchmarks/frame_bench.py --scenes play adventure_map --tracemalloc
+    python benchmarks/frame_bench.py --scenes adventure_map --draw-counters
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import runpy
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # keep stdout clean for the JSON report
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import numpy as np
+import pygame
+from utils.frame_profiler import FrameProfiler
+from utils.gc_scheduler import GCScheduler
+from utils.draw_counters import DrawCounters
+
+FRAME_MS = 1000 / 60  # what the fake clock reports for every frame
+
+MINIGAMES = {
+    "sebs_minigame": "SebastiansAwesomeCode/SebsMinigame.py",
+    "sebs_minigame_medium": "SebastiansAwesomeCode/SebsMinigameMedium.py",
+    "sebs_minigame_hard": "SebastiansAwesomeCode/SebsMinigameHard.py",
+}
+SCENES = ("menu", "play", "adventure_map") + tuple(MINIGAMES)
+
+
+class FixedClock:
+    """Stand-in for pygame.time.Clock: never sleeps, always reports a 60 FPS frame."""
+
+    def tick(self, framerate=0):
+        return FRAME_MS
+
+    def tick_busy_loop(self, framerate=0):
+        return FRAME_MS
+
+    def get_time(self):
+        return FRAME_MS
+
+    def get_rawtime(self):
+        return FRAME_MS
+
+    def get_fps(self):
+        return 1000 / FRAME_MS
+
+
+class ScriptedKeys:
+    def __init__(self, held):
+        self._held = held
+
+    def __getitem__(self, key):
+        return key in self._held
+
+
+class ScriptedInput:
+    """Deterministic mouse/keyboard script installed over pygame's input getters."""
+
+    KEY_CYCLE = ((pygame.K_d,), (pygame.K_s,), (pygame.K_a,), (pygame.K_w,),
+                 (pygame.K_d, pygame.K_s), (pygame.K_a, pygame.K_w))
+    KEY_PERIOD = 45  # frames each key combination is held
+
+    def __init__(self, click_every=0):
+        self.frame = 0
+        self.click_every = click_every  # post a left click every N frames (0 = never)
+        self._saved = None
+
+    def install(self):
+        self._saved = (pygame.mouse.get_pos, pygame.mouse.get_pressed, pygame.key.get_pressed)
+        pygame.mouse.get_pos = self.mouse_pos
+        pygame.mouse.get_pressed = self.mouse_pressed
+        pygame.key.get_pressed = self.keys_pressed
+
+    def uninstall(self):
+        if self._saved is not None:
+            pygame.mouse.get_pos, pygame.mouse.get_pressed, pygame.key.get_pressed = self._saved
+            self._saved = None
+
+    def mouse_pos(self):
+        # slow Lissajous sweep over the whole window, crossing every planet and menu entry
+        surface = pygame.display.get_surface()
+        w, h = surface.get_size() if surface is not None else (1280, 720)
+        t = self.frame / 60
+        return (int(w * (0.5 + 0.45 * np.sin(t * 0.9))), int(h * (0.5 + 0.45 * np.sin(t * 1.3))))
+
+    def mouse_pressed(self, num_buttons=3):
+        # never press: a click on a planet would start a nested scene
+        return (False,) * num_buttons
+
+    def keys_pressed(self):
+        return ScriptedKeys(self.KEY_CYCLE[(self.frame // self.KEY_PERIOD) % len(self.KEY_CYCLE)])
+
+    def advance(self):
+        self.frame += 1
+        if self.click_every and self.frame % self.click_every == 0:
+            pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=self.mouse_pos()))
+
+
+class FrameRecorder:
+    """FrameProfiler listener that collects the measured frames and ends the scene."""
+
+    def __init__(self, scripted_input, frames, warmup, trace_memory=False):
+        self.input = scripted_input
+        self.target = frames
+        self.warmup = warmup
+        self.trace_memory = trace_memory
+        self.seen = 0
+        self.totals = []
+        self.stages = []
+        self.alloc_blocks = []
+        self.peak_bytes = []
+        self.gc_collections = 0
+        self._blocks = sys.getallocatedblocks()
+        self._gc = self._gc_count()
+
+    @staticmethod
+    def _gc_count():
+        return sum(gen["collections"] for gen in gc.get_stats())
+
+    @property
+    def done(self):
+        return len(self.totals) >= self.target
+
+    def __call__(self, total_ms, stages):
+        blocks = sys.getallocatedblocks()
+        collections = self._gc_count()
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+        self.seen += 1
+        if self.seen == self.warmup:
+            GCScheduler.get_instance().reset_stats()
+            DrawCounters.get_instance().reset()
+        if self.seen > self.warmup and not self.done:
+            self.totals.append(total_ms)
+            self.stages.append(stages)
+            self.alloc_blocks.append(blocks - self._blocks)
+            self.gc_collections += collections - self._gc
+            if self.trace_memory:
+                self.peak_bytes.append(peak - self._traced)
+            if self.done:
+                pygame.event.post(pygame.event.Event(pygame.QUIT))
+        self._blocks = blocks
+        self._gc = collections
+        if self.trace_memory:
+            self._traced = current
+        self.input.advance()
+
+    def start(self):
+        if self.trace_memory:
+            tracemalloc.start()
+            self._traced = tracemalloc.get_traced_memory()[0]
+        self._blocks = sys.getallocatedblocks()
+        self._gc = self._gc_count()
+
+    def summary(self):
+        totals = np.array(self.totals)
+        names = sorted({name for stages in self.stages for name in stages})
+        stage_means = {name: float(np.mean([s.get(name, 0.0) for s in self.stages])) for name in names}
+        update_ms = stage_means.get("events", 0.0) + stage_means.get("update", 0.0)
+        result = {
+            "frames": len(totals),
+            "frame_ms": {
+                "mean": float(totals.mean()),
+                "p50": float(np.percentile(totals, 50)),
+                "p95": float(np.percentile(totals, 95)),
+                "p99": float(np.percentile(totals, 99)),
+                "max": float(totals.max()),
+            },
+            "stages_ms": stage_means,
+            "update_ms": update_ms,
+            # "overlay" is the adventure map's HUD stage, drawn after its update
+            "render_ms": sum(stage_means.get(name, 0.0) for name in ("render", "overlay", "flip")),
+            "alloc_blocks_per_frame": float(np.mean(self.alloc_blocks)),
+            "gc_collections_per_frame": self.gc_collections / len(totals),
+            "gc_pauses": GCScheduler.get_instance().stats(),
+        }
+        counters = DrawCounters.get_instance()
+        if counters.enabled:
+            result["draw_counters"] = counters.summary()
+        if self.trace_memory:
+            result["peak_alloc_kb_per_frame"] = float(np.mean(self.peak_bytes)) / 1024
+        return result
+
+
+def _run_game(screen_name):
+    from main_rework import SpaceCowboyGame
+    game = SpaceCowboyGame()
+    if screen_name == "play":
+        game.go_to_play()
+    game.run()
+
+
+def _run_adventure_map():
+    from DanielsWorld.adventure_map import AdventureMap
+    from DanielsWorld.maps import DungeonMaster, ai_generate_dialogue, run_sebs_minigame, run_presleyworld_minigame
+    from adventure_maps import WORLD_MAPS
+
+    adventure = AdventureMap(WORLD_MAPS["world1"]["bg_image"])
+
+    class BenchDungeonMaster(DungeonMaster):
+        # skip everything that blocks on a timed message or waits for a choice
+        def __init__(self):
+            super().__init__()
+            self.intro_shown = True
+            self.encounter_states = {i: True for i in range(len(adventure.encounter_points))}
+
+    adventure.run(BenchDungeonMaster, ai_generate_dialogue, run_sebs_minigame, run_presleyworld_minigame)
+
+
+def _run_minigame(path, recorder):
+    import random
+    run = 0
+    # the medium/hard variants end when the player is hit; keep playing until enough frames
+    while not recorder.done:
+        random.seed(run)
+        runpy.run_path(os.path.join(project_root, path), run_name="__main__")
+        run += 1
+
+
+def run_scene(name, frames, warmup, trace_memory, draw_counters=False):
+    """Run one scene in this process and return its summary dict."""
+    os.chdir(project_root)
+    if draw_counters:
+        DrawCounters.get_instance().enable(blits=True)
+    pygame.time.Clock = FixedClock
+    scripted = ScriptedInput(click_every=8 if name in MINIGAMES else 0)
+    scripted.install()
+    recorder = FrameRecorder(scripted, frames, warmup, trace_memory)
+    FrameProfiler.get_instance().add_listener(recorder)
+    recorder.start()
+    scheduler = GCScheduler.get_instance()
+    scheduler.start()
+    try:
+        if name in ("menu", "play"):
+            _run_game(name)
+        elif name == "adventure_map":
+            _run_adventure_map()
+        else:
+            _run_minigame(MINIGAMES[name], recorder)
+    finally:
+        scheduler.stop()
+        scripted.uninstall()
+        if trace_memory:
+            tracemalloc.stop()
+    if not recorder.totals:
+        raise RuntimeError(f"scene {name} finished before recording any frames")
+    return recorder.summary()
+
+
+def run_all(scenes, frames, warmup, trace_memory, draw_counters=False, verbose=False):
+    results = {}
+    for name in scenes:
+        print(f"benchmarking {name} ...", file=sys.stderr)
+        with tempfile.TemporaryDirectory() as tmp:
+            result_file = os.path.join(tmp, "result.json")
+            cmd = [sys.executable, os.path.abspath(__file__), "--scene", name,
+                   "--frames", str(frames), "--warmup", str(warmup), "--result-file", result_file]
+            if trace_memory:
+                cmd.append("--tracemalloc")
+            if draw_counters:
+                cmd.append("--draw-counters")
+            proc = subprocess.run(cmd, cwd=project_root, capture_output=not verbose, text=True)
+            if proc.returncode != 0 or not os.path.exists(result_file):
+                print(f"  {name} failed (exit {proc.returncode})", file=sys.stderr)
+                if proc.stderr:
+                    print(proc.stderr[-2000:], file=sys.stderr)
+                results[name] = {"error": f"exit code {proc.returncode}"}
+                continue
+            with open(result_file, "r", encoding="utf-8") as f:
+                results[name] = json.load(f)
+    return results
+
+
+def print_table(results):
+    print(f"{'scene':<22} {'p50':>7} {'p95':>7} {'p99':>7} {'update':>7} {'render':>7} {'blocks/f':>9} "
+          f"{'gc':>5} {'gc max':>7}", file=sys.stderr)
+    for name, r in results.items():
+        if "error" in r:
+            print(f"{name:<22} {r['error']}", file=sys.stderr)
+            continue
+        ft = r["frame_ms"]
+        print(f"{name:<22} {ft['p50']:>7.3f} {ft['p95']:>7.3f} {ft['p99']:>7.3f} "
+              f"{r['update_ms']:>7.3f} {r['render_ms']:>7.3f} {r['alloc_blocks_per_frame']:>9.1f} "
+              f"{r['gc_pauses']['pauses']:>5} {r['gc_pauses']['max_ms']:>7.3f}", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless frame-time benchmark for every screen.")
+    parser.add_argument("--frames", type=int, default=300, help="measured frames per scene")
+    parser.add_argument("--warmup", type=int, default=30, help="frames run before measuring")
+    parser.add_argument("--scenes", nargs="+", choices=SCENES, default=list(SCENES))
+    parser.add_argument("--out", help="write the JSON report here instead of stdout")
+    parser.add_argument("--tracemalloc", action="store_true", help="also measure per-frame peak memory (slower)")
+    parser.add_argument("--draw-counters", action="store_true",
+                        help="also count draw/blit/transform calls per frame by module (slower)")
+    parser.add_argument("--verbose", action="store_true", help="show the scenes' own output")
+    # internal: run a single scene in this process
+    parser.add_argument("--scene", choices=SCENES, help=argparse.SUPPRESS)
+    parser.add_argument("--result-file", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.scene:
+        summary = run_scene(args.scene, args.frames, args.warmup, args.tracemalloc, args.draw_counters)
+        with open(args.result_file, "w", encoding="utf-8") as f:
+            json.dump(summary, f)
+        return
+
+    results = run_all(args.scenes, args.frames, args.warmup, args.tracemalloc, args.draw_counters, args.verbose)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "video_driver": os.environ.get("SDL_VIDEODRIVER"),
+            "frames": args.frames,
+            "warmup": args.warmup,
+            "tracemalloc": args.tracemalloc,
+            "draw_counters": args.draw_counters,
+        },
+        "scenes": results,
+    }
+    print_table(results)
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if any("error" in r for r in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
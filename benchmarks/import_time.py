@@ -0,0 +1,179 @@
+"""
+Cold-start import time report with a checked-in budget.
+
+Imports the game's entry module (main_rework) in fresh interpreters with `python -X importtime`
+and parses the per-module timings. It keeps the best of several runs and reports:
+- the total cumulative import time of the entry module
+- the self time of the project's own modules (everything outside the stdlib and site-packages)
+- the slowest modules by cumulative time
+- any module from the budget's "deferred" list that was imported at startup. Those modules
+  (networking, YAML, the map and minigame code, the profiler) must load on first use only.
+
+`check` compares against import_budget.json and exits 1 when the total or the project time
+is more than the threshold over budget, or when a deferred module shows up at startup.
+
+Commands:
+    python benchmarks/import_time.py report [--top 25]
+    python benchmarks/import_time.py check [--threshold 0.25]
+    python benchmarks/import_time.py update-budget        # rewrite import_budget.json
+
+Like micro_baseline.json, the budget holds absolute timings from one machine. Re-record it
+with update-budget when moving to different hardware.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BUDGET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "import_budget.json")
+ENTRY_MODULE = "main_rework"
+DEFAULT_THRESHOLD = 0.25  # fail when more than 25% over budget
+DEFAULT_REPEAT = 5
+# must not be imported by the entry module; they load when the feature is first used
+DEFERRED_MODULES = (
+    "http.server", "socketserver", "webbrowser", "yaml", "cProfile", "pstats",
+    "DanielsWorld.maps", "DanielsWorld.adventure_map", "DanielsWorld.encounters_config",
+)
+
+
+def project_packages():
+    """Top-level module and package names that belong to this repo."""
+    names = set()
+    for entry in os.listdir(project_root):
+        path = os.path.join(project_root, entry)
+        if entry.endswith(".py"):
+            names.add(entry[:-3])
+        elif os.path.isdir(path) and any(f.endswith(".py") for f in os.listdir(path)):
+            names.add(entry)
+    return names
+
+
+def parse_importtime(stderr):
+    """{module: (self_us, cumulative_us)} from -X importtime output."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def measure_once(module=ENTRY_MODULE):
+    env = dict(os.environ)
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    env.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=project_root, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(f"importing {module} failed:\n{proc.stderr[-2000:]}")
+    return parse_importtime(proc.stderr)
+
+
+def measure(module=ENTRY_MODULE, repeat=DEFAULT_REPEAT):
+    """Best (lowest) self/cumulative time per module over `repeat` fresh interpreters."""
+    measure_once(module)  # write any stale .pyc files first so compiling isn't counted
+    best = {}
+    for _ in range(repeat):
+        for name, (self_us, cumulative_us) in measure_once(module).items():
+            old = best.get(name)
+            best[name] = (self_us, cumulative_us) if old is None else (min(old[0], self_us),
+                                                                        min(old[1], cumulative_us))
+    project = project_packages()
+    return {
+        "module": module,
+        "total_ms": best[module][1] / 1000,
+        "project_ms": sum(s for name, (s, _) in best.items() if name.split(".")[0] in project) / 1000,
+        "modules": best,
+        "deferred_imported": sorted(name for name in DEFERRED_MODULES if name in best),
+    }
+
+
+def print_report(result, top):
+    print(f"cold import of {result['module']}: {result['total_ms']:.1f} ms total, "
+          f"{result['project_ms']:.1f} ms in project modules")
+    print(f"{'module':<48} {'self ms':>10} {'cumul ms':>10}")
+    rows = sorted(result["modules"].items(), key=lambda item: -item[1][1])
+    for name, (self_us, cumulative_us) in rows[:top]:
+        print(f"{name:<48} {self_us / 1000:>10.2f} {cumulative_us / 1000:>10.2f}")
+    if result["deferred_imported"]:
+        print(f"imported at startup but should be deferred: {', '.join(result['deferred_imported'])}")
+
+
+def _budget(result):
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "module": result["module"],
+        "total_ms": round(result["total_ms"], 1),
+        "project_ms": round(result["project_ms"], 1),
+        "deferred": list(DEFERRED_MODULES),
+    }
+
+
+def check(result, budget, threshold):
+    """Return the list of budget violations (empty when within budget)."""
+    failures = []
+    for key, label in (("total_ms", "total"), ("project_ms", "project modules")):
+        limit = budget[key] * (1 + threshold)
+        status = "ok" if result[key] <= limit else "OVER"
+        print(f"{label:<16} {result[key]:>8.1f} ms  budget {budget[key]:>8.1f} ms "
+              f"(limit {limit:.1f})  {status}")
+        if result[key] > limit:
+            failures.append(f"{label} import time {result[key]:.1f} ms > {limit:.1f} ms")
+    deferred = [name for name in budget.get("deferred", DEFERRED_MODULES) if name in result["modules"]]
+    for name in deferred:
+        failures.append(f"{name} is imported at startup")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold-start import time report and budget check.")
+    sub = parser.add_subparsers(dest="command")
+    report_p = sub.add_parser("report", help="print the slowest imports")
+    report_p.add_argument("--top", type=int, default=25)
+    check_p = sub.add_parser("check", help="compare against the budget; exit 1 when over")
+    check_p.add_argument("--budget", default=BUDGET_PATH)
+    check_p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                         help="allowed fraction over budget (default %(default)s)")
+    budget_p = sub.add_parser("update-budget", help="measure and overwrite the budget")
+    budget_p.add_argument("--budget", default=BUDGET_PATH)
+    for p in (report_p, check_p, budget_p):
+        p.add_argument("--module", default=ENTRY_MODULE)
+        p.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    args = parser.parse_args()
+    if args.command is None:
+        parser.print_help()
+        return
+
+    result = measure(args.module, args.repeat)
+    if args.command == "report":
+        print_report(result, args.top)
+    elif args.command == "update-budget":
+        with open(args.budget, "w", encoding="utf-8") as f:
+            json.dump(_budget(result), f, indent=2)
+            f.write("\n")
+        print_report(result, 10)
+        print(f"Budget written to {args.budget}")
+    else:
+        with open(args.budget, "r", encoding="utf-8") as f:
+            budget = json.load(f)
+        failures = check(result, budget, args.threshold)
+        if failures:
+            print()
+            for failure in failures:
+                print(f"FAIL: {failure}")
+            sys.exit(1)
+        print("import time within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Headless leak check for repeated planet -> map -> menu cycles.
+
+Runs the real SpaceCowboyGame under SDL's dummy video driver with the memory profiler
+enabled. Each cycle:
+- opens the planet select screen
+- clicks a planet, which builds and runs an AdventureMap
+- leaves the map through its ESC menu ("Back to Main Menu")
+- returns to the main menu
+Every scene enter/exit is snapshotted (see utils/memory_profiler.py), so each cycle prints
+the Python and Surface memory left behind plus the top allocation sites. A scene whose
+exit level keeps growing is flagged as a possible leak.
+
+The map's intro and encounters are skipped (they block on timed messages), and the map's
+input is scripted, so the run needs no interaction.
+
+Usage:
+    python benchmarks/memory_cycles.py                  # 6 cycles on planet1
+    python benchmarks/memory_cycles.py --cycles 10 --planet planet3
+Exit status is 1 when a possible leak was flagged.
+"""
+import argparse
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import pygame
+from utils.memory_profiler import MemoryProfiler
+
+# what the map's event loops see, one list per pygame.event.get() call:
+# ESC opens its menu, three downs select "Back to Main Menu", Enter confirms
+MAP_SCRIPT = (
+    [pygame.K_ESCAPE],
+    [pygame.K_DOWN], [pygame.K_DOWN], [pygame.K_DOWN],
+    [pygame.K_RETURN],
+)
+
+
+class _AllDone(dict):
+    """Encounter states that report every encounter as completed."""
+
+    def get(self, key, default=None):
+        return True
+
+
+def _scripted_event_get(script):
+    steps = iter(script)
+
+    def get(*args, **kwargs):
+        keys = next(steps, [])
+        return [pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="") for key in keys]
+    return get
+
+
+def run_cycle(game, planet_id):
+    import play_screen
+
+    game.go_to_play()
+    game.render()  # lays the planets out for the current window size
+
+    planet = next(p for p in game.play_screen._planets_abs if p["id"] == planet_id)
+    saved = (pygame.mouse.get_pos, pygame.mouse.get_pressed, pygame.event.get)
+    pygame.mouse.get_pos = lambda: planet["pos"]
+    pygame.mouse.get_pressed = lambda num_buttons=3: (True, False, False)
+    pygame.event.get = _scripted_event_get(MAP_SCRIPT)
+    try:
+        game.render()  # the click runs the AdventureMap until the scripted ESC menu exits it
+    finally:
+        pygame.mouse.get_pos, pygame.mouse.get_pressed, pygame.event.get = saved
+    if play_screen.progress_manager.current_world is None:
+        raise RuntimeError(f"clicking {planet_id} did not open its map")
+
+    game.go_to_menu()
+    game.render()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Leak check for repeated planet -> map -> menu cycles.")
+    parser.add_argument("--cycles", type=int, default=6)
+    parser.add_argument("--planet", default="planet1")
+    args = parser.parse_args()
+
+    os.chdir(project_root)
+    profiler = MemoryProfiler.get_instance()
+    profiler.start()
+
+    from DanielsWorld import maps
+    from DanielsWorld.maps import DungeonMaster
+    from main_rework import SpaceCowboyGame
+
+    class CycleDungeonMaster(DungeonMaster):
+        # skip everything that blocks on a timed message or waits for a choice
+        def __init__(self):
+            super().__init__()
+            self.intro_shown = True
+            self.encounter_states = _AllDone()
+
+    maps.DungeonMaster = CycleDungeonMaster  # play_screen imports it when a planet is clicked
+    game = SpaceCowboyGame()
+    for cycle in range(args.cycles):
+        print(f"--- cycle {cycle + 1}/{args.cycles}")
+        run_cycle(game, args.planet)
+
+    leaks = [r for r in profiler.reports if r["leak_bytes"] is not None]
+    print()
+    print(f"{'scene':<16} {'visit':>5} {'python':>12} {'surfaces':>12}")
+    for report in profiler.reports:
+        print(f"{report['scene']:<16} {report['visit']:>5} {report['python_bytes']:>12,} "
+              f"{report['surface_bytes']:>12,}{'  LEAK?' if report['leak_bytes'] is not None else ''}")
+    pygame.quit()
+    if leaks:
+        print(f"\npossible leak in: {', '.join(sorted({r['scene'] for r in leaks}))}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+"""
+Micro-benchmarks for utils and core data structures, with a checked-in baseline.
+
+Cases cover:
+- ui_scaling point helpers and recalc_encounter_positions (10 to 100k encounters)
+- BulletPool spawn/move_all/remove_offscreen
+- encounters_config placement helpers at large counts
+- PlayScreen._wrap_text, cached and cold
+- the PresleyWorld cipher
+
+Each case reports the best per-call time over several timeit repeats.
+
+Commands:
+    python benchmarks/micro_bench.py run [--filter bullet] [--out results.json]
+    python benchmarks/micro_bench.py compare [--threshold 0.25]   # exit 1 on regressions
+        (cases that look slower are re-timed before being reported, to filter out noise)
+    python benchmarks/micro_bench.py update-baseline               # rewrite micro_baseline.json
+
+The baseline holds absolute timings from one machine. Re-record it with update-baseline when
+moving to different hardware, and use compare to check a change on the same box.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import timeit
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import pygame
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "micro_baseline.json")
+DEFAULT_THRESHOLD = 0.25  # flag cases more than 25% slower than the baseline
+SCREEN_SIZE = (1280, 720)
+
+# name -> setup(); setup returns the zero-argument callable to time
+CASES = {}
+
+
+def case(name):
+    def register(setup):
+        CASES[name] = setup
+        return setup
+    return register
+
+
+# ---- utils.ui_scaling ----
+
+@case("ui_scaling.normalize_point")
+def _normalize_point():
+    from utils.ui_scaling import normalize_point
+    return lambda: normalize_point(640.0, 360.0, SCREEN_SIZE)
+
+
+@case("ui_scaling.denormalize_point")
+def _denormalize_point():
+    from utils.ui_scaling import denormalize_point
+    screen = pygame.Surface(SCREEN_SIZE)
+    return lambda: denormalize_point(0.5, 0.5, screen)
+
+
+def _recalc_case(count):
+    def setup():
+        from utils.ui_scaling import set_encounters_normalized, recalc_encounter_positions
+        rng = random.Random(0)
+        encounters = [{"pos": (rng.uniform(0, 1280), rng.uniform(0, 720)), "radius": 30}
+                      for _ in range(count)]
+        set_encounters_normalized(encounters, SCREEN_SIZE)
+        screen = pygame.Surface((1920, 1080))
+        return lambda: recalc_encounter_positions(encounters, screen, SCREEN_SIZE)
+    return setup
+
+
+for _n in (10, 1000, 100000):
+    case(f"ui_scaling.recalc_encounter_positions[{_n}]")(_recalc_case(_n))
+
+
+# ---- utils.bullet_pool (replaced the old LinkedListStack) ----
+
+def _bullet_pool(count):
+    import numpy as np
+    from utils.bullet_pool import BulletPool
+    pool = BulletPool(capacity=max(count, 1))
+    rng = np.random.default_rng(0)
+    for x, y, a in zip(rng.uniform(0, 1280, count), rng.uniform(0, 720, count), rng.uniform(0, 6.28, count)):
+        pool.spawn(x, y, np.cos(a) * 600, np.sin(a) * 600)
+    return pool
+
+
+@case("bullet_pool.spawn[1000]")
+def _spawn():
+    from utils.bullet_pool import BulletPool
+    pool = BulletPool(capacity=1000)
+
+    def run():
+        for i in range(1000):
+            pool.spawn(i, i, 600.0, 0.0)
+        pool.clear()
+    return run
+
+
+def _move_case(count):
+    def setup():
+        pool = _bullet_pool(count)
+        return lambda: pool.move_all(1 / 60)
+    return setup
+
+
+def _offscreen_case(count):
+    def setup():
+        # steady state: every bullet is on screen, so this times the scan itself
+        pool = _bullet_pool(count)
+        return lambda: pool.remove_offscreen(1280, 720)
+    return setup
+
+
+for _n in (100, 4096):
+    case(f"bullet_pool.move_all[{_n}]")(_move_case(_n))
+    case(f"bullet_pool.remove_offscreen[{_n}]")(_offscreen_case(_n))
+
+
+# ---- DanielsWorld.encounters_config ----
+
+def _random_positions_case(count):
+    def setup():
+        from DanielsWorld.encounters_config import _random_positions
+        screen = pygame.Surface(SCREEN_SIZE)
+
+        def run():
+            random.seed(0)
+            return _random_positions(screen, count)
+        return run
+    return setup
+
+
+def _grid_positions_case(count):
+    def setup():
+        from DanielsWorld.encounters_config import _grid_positions
+        screen = pygame.Surface(SCREEN_SIZE)
+        return lambda: _grid_positions(screen, count)
+    return setup
+
+
+for _n in (10, 100, 1000):
+    case(f"encounters_config._random_positions[{_n}]")(_random_positions_case(_n))
+for _n in (1000, 100000):
+    case(f"encounters_config._grid_positions[{_n}]")(_grid_positions_case(_n))
+
+
+# ---- PlayScreen._wrap_text ----
+
+WRAP_TEXT = ("Planet 2: The sheriff station orbits a dusty red world where outlaws hide between "
+             "the canyons. Rumour says the old marshal left a map somewhere in the ruins.\n"
+             "Progress: 3/5 encounters completed")
+
+
+def _play_screen():
+    if pygame.display.get_surface() is None:
+        pygame.init()
+        pygame.display.set_mode(SCREEN_SIZE)
+    from play_screen import PlayScreen
+    return PlayScreen(bg_path=os.path.join(project_root, "assets", "images", "Sherriff_station_boss_locked.png"))
+
+
+@case("play_screen._wrap_text[cached]")
+def _wrap_cached():
+    screen = _play_screen()
+    return lambda: screen._wrap_text(WRAP_TEXT, 600)
+
+
+@case("play_screen._wrap_text[cold]")
+def _wrap_cold():
+    from utils import text_layout
+    screen = _play_screen()
+
+    def run():
+        text_layout.clear()
+        return screen._wrap_text(WRAP_TEXT, 600)
+    return run
+
+
+# ---- PresleyWorld cipher ----
+
+def _cipher_case(fn_name, length):
+    def setup():
+        from PresleyWorld import cipher
+        fn = getattr(cipher, fn_name)
+        text = ("THE VOID RESPONDED IN BINARY, humanity is the experiment. " * (length // 58 + 1))[:length]
+        return lambda: fn(text, 7)
+    return setup
+
+
+for _n in (64, 10000):
+    case(f"cipher.encode_cipher[{_n}]")(_cipher_case("encode_cipher", _n))
+    case(f"cipher.decode_cipher[{_n}]")(_cipher_case("decode_cipher", _n))
+
+
+# ---- runner ----
+
+def measure(fn, repeat=5):
+    """Best seconds per call over `repeat` timeit runs of an auto-ranged loop."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run_cases(name_filter=None, repeat=5):
+    results = {}
+    for name, setup in CASES.items():
+        if name_filter and name_filter not in name:
+            continue
+        results[name] = measure(setup(), repeat)
+        print(f"{name:<48} {_fmt(results[name]):>12}", file=sys.stderr)
+    return results
+
+
+def _fmt(seconds):
+    if seconds < 1e-6:
+        return f"{seconds * 1e9:.1f} ns"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.2f} us"
+    return f"{seconds * 1e3:.3f} ms"
+
+
+def _report(results):
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+
+
+def _load(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _regressed(current, baseline, threshold):
+    return [name for name, now in current.items()
+            if name in baseline and now / baseline[name] - 1 > threshold]
+
+
+def confirm_regressions(current, baseline, threshold, repeat=5, retries=2):
+    """Re-time cases that look slower and keep their best time, so one noisy run doesn't fail."""
+    for _ in range(retries):
+        suspects = _regressed(current, baseline, threshold)
+        if not suspects:
+            break
+        print(f"re-timing {len(suspects)} suspected regression(s) ...", file=sys.stderr)
+        for name in suspects:
+            current[name] = min(current[name], measure(CASES[name](), repeat))
+    return current
+
+
+def compare(current, baseline, threshold):
+    """Print a comparison table; return the names that regressed beyond threshold."""
+    regressions = []
+    print(f"{'case':<48} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name, now in current.items():
+        before = baseline.get(name)
+        if before is None:
+            print(f"{name:<48} {'-':>12} {_fmt(now):>12} {'new':>8}")
+            continue
+        change = now / before - 1
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<48} {_fmt(before):>12} {_fmt(now):>12} {change:>+7.0%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Micro-benchmarks for utils and core data structures.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_p = sub.add_parser("run", help="run the benchmarks and print the timings")
+    run_p.add_argument("--out", help="also write the results as JSON")
+
+    cmp_p = sub.add_parser("compare", help="run and compare against the baseline")
+    cmp_p.add_argument("--baseline", default=BASELINE_PATH)
+    cmp_p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                       help="allowed slowdown as a fraction (0.25 = 25%%)")
+    cmp_p.add_argument("--results", help="compare this saved results JSON instead of running")
+
+    base_p = sub.add_parser("update-baseline", help="run and overwrite the baseline")
+    base_p.add_argument("--baseline", default=BASELINE_PATH)
+
+    for p in (run_p, cmp_p, base_p):
+        p.add_argument("--filter", help="only cases whose name contains this text")
+        p.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.command == "compare" and args.results:
+        results = _load(args.results)["results"]
+    else:
+        results = run_cases(args.filter, args.repeat)
+
+    if args.command == "run":
+        if args.out:
+            with open(args.out, "w", encoding="utf-8") as f:
+                json.dump(_report(results), f, indent=2)
+    elif args.command == "update-baseline":
+        baseline = _load(args.baseline)["results"] if (args.filter and os.path.exists(args.baseline)) else {}
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(_report(baseline), f, indent=2)
+            f.write("\n")
+        print(f"Baseline written to {args.baseline}")
+    else:
+        baseline = _load(args.baseline)["results"]
+        if not args.results:
+            results = confirm_regressions(results, baseline, args.threshold, args.repeat)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) slower than baseline by more than {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+"""
+Stress sweep: frame time versus entity count for each subsystem.
+
+Each subsystem is run headless at increasing entity counts (default 10, 100, 1k, 10k) and
+timed with the FrameProfiler marks, using frame_bench's fake 60 FPS clock and scripted
+input:
+- encounters: an AdventureMap with N encounters (all completed, so no dialog blocks the loop)
+- bullets:    the SebsMinigameHard engine loop (BulletPool, SpatialHash, ProjectileRenderer)
+              with N player bullets in flight and one enemy
+- enemies:    the same loop with N dodging, shooting enemies
+- planets:    the planet select screen (PlayScreen) with N planets, driven by SpaceCowboyGame
+
+The engine subsystems drive SebsMinigameHard's enemy and bullet update
+(SebastiansAwesomeCode.hard_engine.simulate_tick) with N enemies instead of the minigame's one.
+
+Every (subsystem, N) point runs in its own subprocess. The CSV has one row per point. The
+summary on stderr lists, per subsystem:
+- mean frame time at each N
+- the scaling exponent between neighbouring counts (1.0 = linear, above ~1.1 is marked as
+  superlinear)
+- the first N whose p95 misses the 60 FPS budget
+
+Usage:
+    python benchmarks/stress.py                                   # CSV on stdout
+    python benchmarks/stress.py --out stress.csv --counts 10 100 1000
+    python benchmarks/stress.py --subsystems bullets enemies --frames 200
+"""
+import argparse
+import csv
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # keep stdout clean for the CSV
+
+# Add project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import numpy as np
+import pygame
+from utils.frame_profiler import FrameProfiler
+from frame_bench import FixedClock, ScriptedInput, FrameRecorder
+
+SUBSYSTEMS = ("encounters", "bullets", "enemies", "planets")
+DEFAULT_COUNTS = (10, 100, 1000, 10000)
+BUDGET_MS = 1000 / 60
+SUPERLINEAR = 1.1  # scaling exponent above which a step counts as superlinear
+SCREEN_SIZE = (1280, 720)
+CSV_FIELDS = ("subsystem", "n", "frames", "mean_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms",
+              "update_ms", "render_ms")
+
+
+class _AllDone(dict):
+    """Encounter states that report every encounter as completed."""
+
+    def get(self, key, default=None):
+        return True
+
+
+# ---- subsystems ----
+
+def _run_encounters(count):
+    from DanielsWorld.adventure_map import AdventureMap
+    from DanielsWorld.maps import DungeonMaster, ai_generate_dialogue, run_sebs_minigame, run_presleyworld_minigame
+    from adventure_maps import WORLD_MAPS
+
+    def generate(screen):
+        rng = np.random.default_rng(0)
+        return [{"id": f"stress{i}", "pos": pygame.Vector2(x, y), "type": "dialogue"}
+                for i, (x, y) in enumerate(rng.uniform(0.05, 0.95, (count, 2)))]
+
+    class StressDungeonMaster(DungeonMaster):
+        # intro done and every encounter completed, so nothing blocks the loop
+        def __init__(self):
+            super().__init__()
+            self.intro_shown = True
+            self.encounter_states = _AllDone()
+
+    adventure = AdventureMap(WORLD_MAPS["world1"]["bg_image"], encounter_generator=generate)
+    adventure.run(StressDungeonMaster, ai_generate_dialogue, run_sebs_minigame, run_presleyworld_minigame)
+
+
+def _run_engine(bullet_count, enemy_count, recorder):
+    """SebsMinigameHard's per-tick update and draw with many bullets and enemies."""
+    from utils.asset_manager import AssetManager
+    from utils.bullet_pool import BulletPool, OWNER_PLAYER, OWNER_ENEMY, DEFAULT_CAPACITY
+    from utils.spatial_hash import SpatialHash
+    from utils.projectile_renderer import ProjectileRenderer
+    from SebastiansAwesomeCode.hard_engine import HardEnemy, simulate_tick, ENEMY_RADIUS
+
+    bullet_speed = 600
+    dt = 1 / 60
+
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+    width, height = SCREEN_SIZE
+    player_image = AssetManager.get_instance().get("player_a")
+    player_rect = player_image.get_rect(center=(width // 2, height // 2))
+    cowboy = player_rect.center
+
+    # each enemy fires twice every 0.5 s and a bullet crosses the screen in about 2 s
+    bullets = BulletPool(capacity=max(DEFAULT_CAPACITY, 2 * bullet_count + 10 * enemy_count))
+    projectiles = ProjectileRenderer()
+    player_grid = SpatialHash()
+    enemy_grid = SpatialHash()
+    rng = np.random.default_rng(0)
+    enemy_rng = random.Random(0)
+    enemies = [HardEnemy(float(x), float(y), [int(dx), int(dy)], float(cooldown))
+               for x, y, dx, dy, cooldown in zip(rng.uniform(ENEMY_RADIUS, width - ENEMY_RADIUS, enemy_count),
+                                                 rng.uniform(ENEMY_RADIUS, height - ENEMY_RADIUS, enemy_count),
+                                                 rng.choice((-1, 1), enemy_count), rng.choice((-1, 1), enemy_count),
+                                                 rng.uniform(0, 0.5, enemy_count))]
+    profiler = FrameProfiler.get_instance()
+
+    while not recorder.done:
+        profiler.begin_frame("engine")
+        profiler.stage("events")
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                return
+
+        profiler.stage("update")
+        # keep the player's bullets topped up, fired from the player in every direction
+        missing = bullet_count - len(bullets.indices(OWNER_PLAYER))
+        for angle in rng.uniform(0, math.tau, max(0, missing)):
+            bullets.spawn(cowboy[0], cowboy[1], math.cos(angle) * bullet_speed, math.sin(angle) * bullet_speed, OWNER_PLAYER)
+
+        simulate_tick(dt, enemies, bullets, player_grid, enemy_grid, cowboy, width, height, enemy_rng)
+        for enemy in enemies:
+            hits = player_grid.query_radius(enemy.x, enemy.y, ENEMY_RADIUS)
+            if len(hits):
+                bullets.kill(hits)
+        # the player can't die here; absorb the hits so the pool doesn't fill up
+        hits = enemy_grid.query_radius(cowboy[0], cowboy[1], 50)
+        if len(hits):
+            bullets.kill(hits)
+
+        profiler.stage("render")
+        screen.fill("white")
+        screen.blit(player_image, player_rect)
+        for enemy in enemies:
+            pygame.draw.circle(screen, "green", (int(enemy.x), int(enemy.y)), ENEMY_RADIUS)
+        projectiles.draw(screen, *bullets.positions(OWNER_PLAYER), "yellow", 8)
+        projectiles.draw(screen, *bullets.positions(OWNER_ENEMY), "red", 8)
+        profiler.stage("flip")
+        pygame.display.flip()
+        profiler.end_frame()
+
+
+def _run_planets(count):
+    from main_rework import SpaceCowboyGame
+
+    game = SpaceCowboyGame()
+    screen = game.play_screen
+    bw, bh = screen._bg_size
+    rng = np.random.default_rng(0)
+    screen.planets = [{"pos": (float(x), float(y)), "radius": int(r), "id": f"stress{i}"}
+                      for i, (x, y, r) in enumerate(zip(rng.uniform(0, bw, count), rng.uniform(0, bh, count),
+                                                        rng.uniform(10, 60, count)))]
+    screen._compute_normalized_planets()
+    screen._last_screen_size = None
+    game.go_to_play()
+    game.run()
+
+
+def run_point(subsystem, count, frames, warmup):
+    """Run one (subsystem, N) point in this process and return its CSV row."""
+    os.chdir(project_root)
+    pygame.init()
+    pygame.time.Clock = FixedClock
+    scripted = ScriptedInput()
+    scripted.install()
+    recorder = FrameRecorder(scripted, frames, warmup)
+    FrameProfiler.get_instance().add_listener(recorder)
+    recorder.start()
+    try:
+        if subsystem == "encounters":
+            _run_encounters(count)
+        elif subsystem == "bullets":
+            _run_engine(count, 1, recorder)
+        elif subsystem == "enemies":
+            _run_engine(10, count, recorder)
+        else:
+            _run_planets(count)
+    finally:
+        scripted.uninstall()
+    if not recorder.totals:
+        raise RuntimeError(f"{subsystem}[{count}] finished before recording any frames")
+    summary = recorder.summary()
+    frame = summary["frame_ms"]
+    return {
+        "subsystem": subsystem,
+        "n": count,
+        "frames": summary["frames"],
+        "mean_ms": frame["mean"],
+        "p50_ms": frame["p50"],
+        "p95_ms": frame["p95"],
+        "p99_ms": frame["p99"],
+        "max_ms": frame["max"],
+        "update_ms": summary["update_ms"],
+        "render_ms": summary["render_ms"],
+    }
+
+
+def sweep(subsystems, counts, frames, warmup, verbose=False):
+    rows = []
+    for subsystem in subsystems:
+        for count in counts:
+            print(f"stressing {subsystem} at N={count} ...", file=sys.stderr)
+            with tempfile.TemporaryDirectory() as tmp:
+                result_file = os.path.join(tmp, "result.json")
+                cmd = [sys.executable, os.path.abspath(__file__), "--point", subsystem, str(count),
+                       "--frames", str(frames), "--warmup", str(warmup), "--result-file", result_file]
+                proc = subprocess.run(cmd, cwd=project_root, capture_output=not verbose, text=True)
+                if proc.returncode != 0 or not os.path.exists(result_file):
+                    print(f"  {subsystem}[{count}] failed (exit {proc.returncode})", file=sys.stderr)
+                    if proc.stderr:
+                        print(proc.stderr[-2000:], file=sys.stderr)
+                    continue
+                with open(result_file, "r", encoding="utf-8") as f:
+                    rows.append(json.load(f))
+    return rows
+
+
+def summarize(rows):
+    """Per subsystem: (count, mean ms, exponent from the previous count or None) and the first N over budget."""
+    summary = {}
+    for subsystem in dict.fromkeys(row["subsystem"] for row in rows):
+        points = sorted((row for row in rows if row["subsystem"] == subsystem), key=lambda row: row["n"])
+        steps = []
+        previous = None
+        for row in points:
+            exponent = None
+            if previous is not None and previous["mean_ms"] > 0:
+                exponent = math.log(row["mean_ms"] / previous["mean_ms"]) / math.log(row["n"] / previous["n"])
+            steps.append((row["n"], row["mean_ms"], exponent))
+            previous = row
+        over_budget = next((row["n"] for row in points if row["p95_ms"] > BUDGET_MS), None)
+        summary[subsystem] = {"steps": steps, "over_budget_at": over_budget}
+    return summary
+
+
+def print_summary(summary):
+    first = None  # (count, subsystem) of the earliest superlinear step
+    for subsystem, info in summary.items():
+        parts = []
+        for count, mean_ms, exponent in info["steps"]:
+            if exponent is None:
+                parts.append(f"N={count}: {mean_ms:.3f} ms")
+                continue
+            mark = " superlinear" if exponent > SUPERLINEAR else ""
+            parts.append(f"N={count}: {mean_ms:.3f} ms (x^{exponent:.2f}{mark})")
+            if exponent > SUPERLINEAR and (first is None or count < first[0]):
+                first = (count, subsystem)
+        budget = info["over_budget_at"]
+        print(f"{subsystem:<11} " + ", ".join(parts), file=sys.stderr)
+        print(f"{'':<11} p95 over the 60 FPS budget from N={budget}" if budget is not None
+              else f"{'':<11} p95 within the 60 FPS budget at every N", file=sys.stderr)
+    if first is not None:
+        print(f"first superlinear: {first[1]} (by N={first[0]})", file=sys.stderr)
+    else:
+        print("no subsystem scaled superlinearly", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Frame time versus entity count for each subsystem.")
+    parser.add_argument("--subsystems", nargs="+", choices=SUBSYSTEMS, default=list(SUBSYSTEMS))
+    parser.add_argument("--counts", nargs="+", type=int, default=list(DEFAULT_COUNTS))
+    parser.add_argument("--frames", type=int, default=120, help="measured frames per point")
+    parser.add_argument("--warmup", type=int, default=20, help="frames run before measuring")
+    parser.add_argument("--out", help="write the CSV here instead of stdout")
+    parser.add_argument("--verbose", action="store_true", help="show the scenes' own output")
+    # internal: run a single point in this process
+    parser.add_argument("--point", nargs=2, metavar=("SUBSYSTEM", "N"), help=argparse.SUPPRESS)
+    parser.add_argument("--result-file", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.point:
+        row = run_point(args.point[0], int(args.point[1]), args.frames, args.warmup)
+        with open(args.result_file, "w", encoding="utf-8") as f:
+            json.dump(row, f)
+        return
+
+    rows = sweep(args.subsystems, sorted(args.counts), args.frames, args.warmup, args.verbose)
+    out = open(args.out, "w", newline="", encoding="utf-8") if args.out else sys.stdout
+    try:
+        writer = csv.DictWriter(out, fieldnames=CSV_FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({key: (f"{value:.4f}" if isinstance(value, float) else value) for key, value in row.items()})
+    finally:
+        if args.out:
+            out.close()
+    print_summary(summarize(rows))
+    if len(rows) < len(args.subsystems) * len(args.counts):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
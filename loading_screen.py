@@ -0,0 +1,52 @@
+import sys
+import pygame
+from utils.text_renderer import render_text
+from utils.font_cache import get_font
+
+
+class LoadingScreen:
+    """
+    Progress bar shown while the AssetLoader decodes the images the first screens need.
+    The bar follows the loader's real progress (images handed over to the AssetManager).
+    """
+
+    def __init__(self, loader, names, title="Loading..."):
+        self.loader = loader
+        self.names = list(names)  # manifest names that must be resident before we return
+        self.title = title
+
+    def draw(self, screen, progress):
+        sw = screen.get_width()
+        sh = screen.get_height()
+        screen.fill("black")
+
+        title_font = get_font(None, max(20, int(sh * 0.08)))
+        title_surface = render_text(title_font, self.title, (255, 255, 255))
+        screen.blit(title_surface, title_surface.get_rect(center=(sw // 2, int(sh * 0.42))))
+
+        bar_w = int(sw * 0.5)
+        bar_h = max(12, int(sh * 0.03))
+        bar_rect = pygame.Rect(sw // 2 - bar_w // 2, int(sh * 0.52), bar_w, bar_h)
+        fill_rect = bar_rect.inflate(-4, -4)
+        fill_rect.width = int(fill_rect.width * progress)
+        pygame.draw.rect(screen, (255, 255, 100), fill_rect)
+        # light border
+        pygame.draw.rect(screen, (200, 200, 200), bar_rect, 2)
+
+    def run(self, screen, clock=None):
+        """
+        Pump the loader and draw the bar until every name is loaded.
+        Returns False if the window was closed meanwhile.
+        """
+        clock = clock or pygame.time.Clock()
+        while self.loader.pending(self.names):
+            # only take QUIT; resizes and key presses stay queued for the game loop
+            if pygame.event.get(pygame.QUIT):
+                return False
+            self.loader.pump()
+            self.draw(screen, self.loader.progress(self.names))
+            pygame.display.flip()
+            clock.tick(60)
+        if self.loader.failed:
+            print(f"{len(self.loader.failed)} image(s) failed to load", file=sys.stderr)
+        return True
@@ -1,4 +1,7 @@
 import pygame
+from utils.asset_manager import AssetManager
+from utils.text_renderer import render_text
+from utils.font_cache import get_font
 
 class MainMenu:
     def __init__(self, on_play=None):
@@ -15,7 +18,7 @@ class MainMenu:
         self.hover_font = None
 
         # load raw background and defer scaling to when we know the screen size
-        self._raw_bg = pygame.image.load('./assets/images/Cowboy image.png').convert()
+        self._raw_bg = AssetManager.get_instance().get("menu_cowboy")
         self._scaled_bg = None
         self._last_screen_size = None
 
@@ -49,14 +52,14 @@ class MainMenu:
             option_size = max(14, int(sh * 0.05))
             hover_size = max(option_size + 6, int(sh * 0.06))
 
-            self.font = pygame.font.Font(None, option_size)
-            self.hover_font = pygame.font.Font(None, hover_size)
-            self._title_font = pygame.font.Font(None, title_size)
+            self.font = get_font(None, option_size)
+            self.hover_font = get_font(None, hover_size)
+            self._title_font = get_font(None, title_size)
 
             self._last_screen_size = (sw, sh)
 
         # Title text
-        title_surface = self._title_font.render("Main Menu", True, (255, 255, 255))
+        title_surface = render_text(self._title_font, "Main Menu", (255, 255, 255))
         title_rect = title_surface.get_rect(center=(sw // 2, int(sh * 0.12)))
 
         # Draw background art and title (centered under title)
@@ -74,12 +77,12 @@ class MainMenu:
             label = option["label"]
 
             # default text style
-            text_surface = self.font.render(label, True, (255, 255, 255))
+            text_surface = render_text(self.font, label, (255, 255, 255))
             text_rect = text_surface.get_rect(center=(sw // 2, start_y))
 
             # hover style (larger font)
             if text_rect.collidepoint(mouse_pos):
-                text_surface = self.hover_font.render(label, True, (255, 255, 255))
+                text_surface = render_text(self.hover_font, label, (255, 255, 255))
                 text_rect = text_surface.get_rect(center=(sw // 2, start_y))
                 screen.blit(text_surface, text_rect)
 
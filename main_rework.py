@@ -1,6 +1,24 @@
 import pygame
 from mainMenu import MainMenu
 from play_screen import PlayScreen
+from loading_screen import LoadingScreen
+from utils.asset_loader import AssetLoader
+from utils.asset_manager import ASSET_MANIFEST
+from utils.font_cache import get_font
+from utils.fixed_timestep import FixedTimestep
+from utils.frame_profiler import FrameProfiler
+from utils.perf_hud import PerfHUD
+from utils import tracing
+from utils import draw_counters
+from utils import memory_profiler
+from utils import gc_scheduler
+
+# images the menu and planet select screen need before the first frame; everything else in
+# the manifest (world maps first) keeps decoding in the background once the menu is up
+STARTUP_ASSETS = ("menu_cowboy", "sheriff_station_locked")
+BACKGROUND_ASSETS = ("world1_map", "world2_map", "world3_map", "world4_map") + tuple(
+    name for name in ASSET_MANIFEST
+    if name not in STARTUP_ASSETS and not name.endswith("_map"))
 
 
 class SpaceCowboyGame:
@@ -23,6 +41,18 @@ class SpaceCowboyGame:
         self.clock = pygame.time.Clock()
         self.running = True
         self.dt = 0.0  # delta time per frame in seconds
+        # simulation advances in fixed PHYSICS_TIMESTEP steps, decoupled from the frame rate
+        self.timestep = FixedTimestep()
+        self.profiler = FrameProfiler.get_instance()
+        self.hud = PerfHUD.get_instance()  # F3, or on by default with DEBUG_MODE / SHOW_FPS
+
+        # decode images on the loader's worker thread; show a progress bar until the
+        # first screens' backgrounds are in
+        self.loader = AssetLoader.get_instance()
+        self.loader.request(STARTUP_ASSETS)
+        self.loader.request(BACKGROUND_ASSETS, parallel=True)  # large maps decode on every core
+        if not LoadingScreen(self.loader, STARTUP_ASSETS).run(self.screen, self.clock):
+            self.running = False
 
         # which screen are we currently showing
         # valid states: "menu", "play", "sheriff_level"
@@ -36,26 +66,42 @@ class SpaceCowboyGame:
 
         # create main menu and inject callback to start playing
         self.main_menu = MainMenu(on_play=self.go_to_play)
+        memory_profiler.scene_enter(self.current_screen)
 
     # ---- state change helpers ----
+    def _set_screen(self, new_state):
+        # scene boundary for the memory profiler (no-op unless it is enabled)
+        memory_profiler.scene_exit(self.current_screen)
+        self.current_screen = new_state
+        memory_profiler.scene_enter(new_state)
+
     def change_screen(self, new_state):
         """
         This lets other screens (like PlayScreen) tell the game
         to switch to something else, e.g. 'sheriff_level'.
         """
-        self.current_screen = new_state
+        self._set_screen(new_state)
 
     def go_to_play(self):
         """Called when 'Play' is clicked in MainMenu."""
-        self.current_screen = "play"
+        self._set_screen("play")
+        # scene entry: the play screen has to repaint everything once
+        self.play_screen.invalidate()
 
     def go_to_menu(self):
         """Return to main menu."""
-        self.current_screen = "menu"
+        self._set_screen("menu")
 
     # ---- event loop ----
     def handle_events(self):
         for event in pygame.event.get():
+            if self.hud.handle_event(event):
+                # hiding the overlay must repaint what it covered
+                self.play_screen.invalidate()
+                continue
+            if tracing.handle_event(event) or draw_counters.handle_event(event):
+                continue
+
             if event.type == pygame.QUIT:
                 self.running = False
 
@@ -63,14 +109,15 @@ class SpaceCowboyGame:
                 # Update window state and recreate screen
                 self.window_state.update_size(event.w, event.h)
                 self.screen = self.window_state.create_screen()
+                self.play_screen.invalidate()
 
             elif event.type == pygame.KEYDOWN:
                 # ESC -> back to menu for now no matter what
                 if event.key == pygame.K_ESCAPE:
                     self.go_to_menu()
 
-    def update(self):
-        # nothing animated yet; placeholder for future logic
+    def update(self, dt):
+        # nothing simulated yet; placeholder for future logic (dt is always timestep.step)
         pass
 
     def render(self):
@@ -78,14 +125,26 @@ class SpaceCowboyGame:
         if self.current_screen == "menu":
             self.screen.fill("black")
             self.main_menu.load_main_menu(self.screen)
+            self.hud.set_counts()
 
         elif self.current_screen == "play":
-            self.play_screen.draw(self.screen)
+            dirty = self.play_screen.draw(self.screen)
+            self.hud.set_counts(planets=len(self.play_screen.planets))
+            if dirty is not None:
+                # dirty-rect mode: only push the regions that changed
+                hud_rect = self.hud.draw(self.screen, self.current_screen)
+                self.profiler.stage("flip")
+                if hud_rect:
+                    dirty.append(hud_rect)
+                if dirty:
+                    pygame.display.update(dirty)
+                return
 
         elif self.current_screen == "sheriff_level":
             # temporary placeholder until you build that screen
             self.screen.fill((20, 0, 0))
-            debug_font = pygame.font.Font(None, 50)
+            self.hud.set_counts()
+            debug_font = get_font(None, 50)
             debug_text = debug_font.render(
                 "Sheriff Level Loaded",
                 True,
@@ -99,20 +158,50 @@ class SpaceCowboyGame:
             )
             self.screen.blit(debug_text, rect)
 
+        self.hud.draw(self.screen, self.current_screen)
+        self.profiler.stage("flip")
         pygame.display.flip()
 
     def run(self):
+        # menu and planet screen assets are loaded by now
+        gc_scheduler.start()
+        gc_scheduler.freeze()
         while self.running:
+            self.profiler.begin_frame(self.current_screen)
+            self.profiler.stage("events")
             self.handle_events()
-            self.update()
+            if self.loader.busy:
+                # convert()/register images the worker finished (background world maps)
+                self.profiler.stage("assets")
+                self.loader.pump()
+            self.profiler.stage("update")
+            for dt in self.timestep.steps(self.dt):
+                self.update(dt)
+            self.profiler.stage("render")
             self.render()
+            self.profiler.end_frame()
 
             # lock frame rate ~60 FPS, capture delta time
             self.dt = self.clock.tick(60) / 1000.0
 
+        gc_scheduler.stop()
         pygame.quit()
 
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Space Cowboy")
+    parser.add_argument("--trace", nargs="?", const="", metavar="PATH",
+                        help="record trace spans and write them as Chrome trace JSON on exit "
+                             "(default: a timestamped file in settings.TRACE_PATH)")
+    args = parser.parse_args()
+    tracer = tracing.Tracer.get_instance()
+    if args.trace is not None:
+        tracer.set_enabled(True)
+
     game = SpaceCowboyGame()
-    game.run()
+    try:
+        game.run()
+    finally:
+        if args.trace is not None:
+            tracer.dump(args.trace or None)
@@ -1,72 +1,86 @@
 import pygame
+from utils.asset_manager import AssetManager
 
 
 class Planet:
     """
     Clickable / hoverable planet icon.
 
-    - Scales up on hover
+    - Scales up on hover (sprites precomputed, no per-frame scaling)
     - Calls on_click when clicked
     - Tracks its own rect
     """
 
+    HOVER_SCALE = 1.1
+
     def __init__(self, image_path: str, pos_center: tuple[int, int],
-                 scale: float = 1.0, on_click=None):
+                 scale: float = 1.0, on_click=None, hover_frames: int = 0):
         """
-        image_path:  path to the planet PNG (should have alpha)
-        pos_center:  (x, y) center position on screen
-        scale:       base size multiplier
-        on_click:    callback function when clicked
+        image_path:   path to the planet PNG (should have alpha)
+        pos_center:   (x, y) center position on screen
+        scale:        base size multiplier
+        on_click:     callback function when clicked
+        hover_frames: in-between frames for an eased grow/shrink (0 = instant swap)
         """
 
         # Load image with alpha. Fail loudly if not found.
-        raw_img = pygame.image.load(image_path).convert_alpha()
+        self.raw_image = AssetManager.get_instance().load_path(image_path, alpha=True)
+        self.hover_frames = max(0, int(hover_frames))
+        self.on_click = on_click
 
-        # Base scaled size
-        w, h = raw_img.get_width(), raw_img.get_height()
-        self.base_image = pygame.transform.smoothscale(
-            raw_img,
-            (int(w * scale), int(h * scale))
-        )
+        # frames[0] is the base sprite, frames[-1] the full hover sprite
+        self.frames = []
+        self.frame_index = 0
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.rect.center = pos_center
+        self.resize(scale)
+
+    def resize(self, scale: float) -> None:
+        """Rebuild the base/hover sprites for a new base scale (e.g. after a window resize)."""
+        w, h = self.raw_image.get_width(), self.raw_image.get_height()
+        base_w, base_h = int(w * scale), int(h * scale)
+        self.base_image = pygame.transform.smoothscale(self.raw_image, (base_w, base_h))
+
+        steps = self.hover_frames + 1
+        self.frames = [self.base_image]
+        for i in range(1, steps + 1):
+            t = i / steps
+            # ease-out so the grow starts quickly and settles on the hover size
+            eased = 1 - (1 - t) * (1 - t)
+            factor = 1 + (self.HOVER_SCALE - 1) * eased
+            self.frames.append(pygame.transform.smoothscale(
+                self.base_image,
+                (int(base_w * factor), int(base_h * factor))
+            ))
+        self.hover_image = self.frames[-1]
 
-        # current_image will swap between base and hover version
-        self.current_image = self.base_image
-        self.rect = self.current_image.get_rect(center=pos_center)
+        self.frame_index = min(self.frame_index, len(self.frames) - 1)
+        self._set_frame(self.frame_index)
 
-        self.on_click = on_click
+    def _set_frame(self, index: int) -> None:
+        # preserve center so it doesn't "jump"
+        center_before = self.rect.center
+        self.frame_index = index
+        self.current_image = self.frames[index]
+        self.rect = self.current_image.get_rect(center=center_before)
 
     def update(self, mouse_pos: tuple[int, int], mouse_down: bool) -> None:
         """
         Handles:
-        - Hover grow (~10%)
+        - Hover grow (~10%), one precomputed frame per update
         - Click trigger
         """
         hovered = self.rect.collidepoint(mouse_pos)
+        target = len(self.frames) - 1 if hovered else 0
 
-        if hovered:
-            bw = self.base_image.get_width()
-            bh = self.base_image.get_height()
+        if self.frame_index < target:
+            self._set_frame(self.frame_index + 1)
+        elif self.frame_index > target:
+            self._set_frame(self.frame_index - 1)
 
-            # hover scale
-            enlarged = pygame.transform.smoothscale(
-                self.base_image,
-                (int(bw * 1.1), int(bh * 1.1))
-            )
-
-            # preserve center so it doesn't "jump"
-            center_before = self.rect.center
-            self.current_image = enlarged
-            self.rect = self.current_image.get_rect(center=center_before)
-
-            # Click fired this frame
-            if mouse_down and self.on_click:
-                self.on_click()
-
-        else:
-            # reset to base image
-            center_before = self.rect.center
-            self.current_image = self.base_image
-            self.rect = self.current_image.get_rect(center=center_before)
+        # Click fired this frame
+        if hovered and mouse_down and self.on_click:
+            self.on_click()
 
     def draw(self, screen: pygame.Surface) -> None:
         screen.blit(self.current_image, self.rect)
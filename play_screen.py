@@ -1,13 +1,17 @@
 import pygame
-from DanielsWorld.adventure_map import AdventureMap
-from DanielsWorld.maps import DungeonMaster, ai_generate_dialogue, run_sebs_minigame, run_presleyworld_minigame
-from adventure_maps import WORLD_MAPS, init_maps
+from adventure_maps import WORLD_MAPS, normalize_map_encounters
 from utils.progress_manager import ProgressManager
+from utils.surface_cache import get_scaled
+from utils.asset_manager import AssetManager
+from utils.image_probe import image_size
+from utils.text_renderer import render_text
+from utils.text_layout import wrap_text
+from utils.font_cache import get_font
+from utils.tracing import traced
+from utils import memory_profiler
+from settings import DIRTY_RECT_RENDERING
 import os
 
-# Initialize the adventure maps system
-init_maps()
-
 # Get the progress manager instance
 progress_manager = ProgressManager.get_instance()
 
@@ -21,24 +25,26 @@ PLANET_MAPS = {
 
 
 class PlayScreen:
-    def __init__(self, bg_path, game_state_callback=None):
+    def __init__(self, bg_path, game_state_callback=None, dirty_rects=None):
         """
         bg_path: background image for this screen
         game_state_callback: a function we can call to tell the game
                              to change screens (ex: 'sheriff_level')
+        dirty_rects: only redraw changed regions between full redraws
+                     (defaults to settings.DIRTY_RECT_RENDERING)
         """
         from utils.window_state import WindowState
         self.window_state = WindowState.get_instance()
         
         # load background
-        self.bg_raw = pygame.image.load(bg_path).convert()
+        self.bg_raw = AssetManager.get_instance().load_path(bg_path)
 
         # store callback for scene changes
         self.game_state_callback = game_state_callback
 
         # font / UI text
         base_font_size = int(32 * (self.window_state.height / 720))  # Scale font relative to reference height
-        self.font = pygame.font.Font(None, base_font_size)
+        self.font = get_font(None, base_font_size)
         self.text_color = (255, 255, 255)
         self.dialog_text = "Select a planet to get started"
         
@@ -64,38 +70,29 @@ class PlayScreen:
 
         # store normalized ratios based on the background image size so we can
         # recompute absolute positions when the window resizes
-        self._bg_size = self.bg_raw.get_size()  # (width, height)
+        self._bg_size = image_size(bg_path)  # (width, height), read from the file header
         self._compute_normalized_planets()
 
         # cached absolute planet positions for current window size
         self._last_screen_size = None
         self._planets_abs = None
 
-    def _wrap_text(self, text, max_width):
-        """Wrap dialog_text into multiple lines so it fits in the box."""
-        words = text.split(" ")
-        lines = []
-        cur_line = ""
-
-        for w in words:
-            test_line = (cur_line + " " + w).strip()
-            surf = self.font.render(test_line, True, self.text_color)
-            if surf.get_width() <= max_width:
-                cur_line = test_line
-            else:
-                lines.append(cur_line)
-                cur_line = w
-
-        if cur_line:
-            lines.append(cur_line)
+        # dirty-rect rendering: only the hovered rings and the textbox are redrawn between
+        # full redraws (resize / scene entry)
+        self.dirty_rects = DIRTY_RECT_RENDERING if dirty_rects is None else dirty_rects
+        self._needs_full_redraw = True
+        self._hovered_id = None
+        self._drawn_text = None
 
-        return lines
+    def _wrap_text(self, text, max_width):
+        """Wrap dialog_text into multiple lines so it fits in the box (honours '\n')."""
+        return wrap_text(text, self.font, max_width)
 
     def _draw_background_scaled(self, screen):
         """Scale background to window size and draw it."""
         sw = screen.get_width()
         sh = screen.get_height()
-        bg_scaled = pygame.transform.scale(self.bg_raw, (sw, sh))
+        bg_scaled = get_scaled(self.bg_raw, (sw, sh), smooth=False)
         screen.blit(bg_scaled, (0, 0))
 
     def _draw_textbox(self, screen):
@@ -120,16 +117,16 @@ class PlayScreen:
         # draw lines
         y = box_rect.top + padding_y
         for line in lines:
-            surf = self.font.render(line, True, self.text_color)
+            surf = render_text(self.font, line, self.text_color)
             screen.blit(surf, (box_rect.left + padding_x, y))
             y += surf.get_height() + 8
 
-    def _draw_planet_circles(self, screen):
+    def _update_planets(self, screen):
         """
-        Draws hoverable/clickable outlines for each planet.
-        - Default: dim white ring
-        - Hover: brighter/yellowish, thicker
+        Hover/click handling for the planets.
+        - Hover: shows the planet description + progress in the textbox
         - Click: triggers action (right now print + optional scene switch)
+        Returns the id of the hovered planet (or None).
         """
         # ensure absolute positions are up-to-date for current screen size
         if self._last_screen_size != (screen.get_width(), screen.get_height()):
@@ -137,6 +134,7 @@ class PlayScreen:
 
         mouse_pos = pygame.mouse.get_pos()
         mouse_click = pygame.mouse.get_pressed()[0]
+        hovered_id = None
 
         for planet in self._planets_abs:
             x, y = planet["pos"]
@@ -149,8 +147,7 @@ class PlayScreen:
             hovered = dist <= r
 
             if hovered:
-                color = (255, 255, 100)  # brighter when hovered
-                width = 4
+                hovered_id = planet["id"]
                 # Get progress for this world
                 world_id = f"world{planet['id'][-1]}"  # Convert planet1 to world1, etc.
                 world_progress = progress_manager.get_world_progress(world_id)
@@ -169,12 +166,6 @@ class PlayScreen:
                     )
                 else:
                     self.dialog_text = self.planet_descriptions.get(planet["id"], "Select a planet to get started")
-            else:
-                color = (255, 255, 255)
-                width = 2
-
-            # draw circle outline
-            pygame.draw.circle(screen, color, (x, y), r, width)
 
             # click behavior
             if hovered and mouse_click:
@@ -197,14 +188,63 @@ class PlayScreen:
                     total = len(world_map['encounters'])
                     self.dialog_text = f"{self.planet_descriptions[planet_id]}\nProgress: {completed}/{total} encounters completed"
                     
-                    # Launch the adventure map
-                    adventure = AdventureMap(world_map['bg_image'])
-                    adventure.run(DungeonMaster, ai_generate_dialogue, run_sebs_minigame, run_presleyworld_minigame)
+                    # encounter ratios from the map's header size (no decode)
+                    normalize_map_encounters(world_map)
+
+                    # Launch the adventure map (map and minigame modules load on the first visit)
+                    from DanielsWorld.adventure_map import get_adventure_map
+                    from DanielsWorld.maps import (DungeonMaster, ai_generate_dialogue, run_sebs_minigame,
+                                                   run_presleyworld_minigame)
+                    with memory_profiler.scene("adventure_map"):
+                        # built once per world and reused on later visits
+                        adventure = get_adventure_map(world_id, world_map['bg_image'])
+                        adventure.run(DungeonMaster, ai_generate_dialogue, run_sebs_minigame, run_presleyworld_minigame)
+                        del adventure  # so the exit snapshot only sees what the map cache keeps
+                    # the map drew over the whole window
+                    self.invalidate()
                 
                 # Keep the sheriff level option for planet2 as an alternate path
                 if planet_id == "planet2" and self.game_state_callback:
                     self.game_state_callback("sheriff_level")
 
+        return hovered_id
+
+    def _planet_ring_rect(self, planet):
+        """Screen area covered by a planet's ring (any ring width)."""
+        x, y = planet["pos"]
+        r = planet["radius"]
+        return pygame.Rect(x - r - 1, y - r - 1, 2 * r + 2, 2 * r + 2)
+
+    def _textbox_rect(self, screen):
+        sw = screen.get_width()
+        sh = screen.get_height()
+        box_h = int(sh * 0.22)
+        return pygame.Rect(0, sh - box_h, sw, box_h)
+
+    def _draw_planet_circles(self, screen, only=None):
+        """
+        Draws hoverable/clickable outlines for each planet.
+        - Default: dim white ring
+        - Hover: brighter/yellowish, thicker
+        only: optional list of rects; when given, just the rings touching them are drawn
+        """
+        for planet in self._planets_abs:
+            if only is not None and self._planet_ring_rect(planet).collidelist(only) == -1:
+                continue
+            if planet["id"] == self._hovered_id:
+                color = (255, 255, 100)  # brighter when hovered
+                width = 4
+            else:
+                color = (255, 255, 255)
+                width = 2
+
+            # draw circle outline
+            pygame.draw.circle(screen, color, planet["pos"], planet["radius"], width)
+
+    def invalidate(self):
+        """Force a full redraw next frame (scene entry, resize, or after another scene drew)."""
+        self._needs_full_redraw = True
+
     def _compute_normalized_planets(self):
         """Compute normalized ratios (x_ratio, y_ratio, radius_ratio) from image-space planets."""
         bw, bh = self._bg_size
@@ -237,11 +277,48 @@ class PlayScreen:
         self._planets_abs = abs_list
         self._last_screen_size = (sw, sh)
 
+    @traced("PlayScreen.draw")
     def draw(self, screen):
         """
-        Full render of this screen.
+        Render this screen.
         Order matters: background -> circles -> textbox
+
+        Returns None after a full redraw (caller should flip the whole display), otherwise
+        the list of rects that changed this frame for pygame.display.update (dirty-rect mode).
         """
-        self._draw_background_scaled(screen)
-        self._draw_planet_circles(screen)
-        self._draw_textbox(screen)
+        if self._last_screen_size != (screen.get_width(), screen.get_height()):
+            self._recalc_planets_for_screen(screen)
+            self._needs_full_redraw = True
+
+        hovered_id = self._update_planets(screen)
+        hover_changed = hovered_id != self._hovered_id
+        old_hovered_id = self._hovered_id
+        self._hovered_id = hovered_id
+
+        if not self.dirty_rects or self._needs_full_redraw:
+            self._needs_full_redraw = False
+            self._drawn_text = self.dialog_text
+            self._draw_background_scaled(screen)
+            self._draw_planet_circles(screen)
+            self._draw_textbox(screen)
+            return None
+
+        dirty = []
+        if hover_changed:
+            for planet in self._planets_abs:
+                if planet["id"] in (old_hovered_id, hovered_id):
+                    dirty.append(self._planet_ring_rect(planet))
+        if self.dialog_text != self._drawn_text:
+            self._drawn_text = self.dialog_text
+            dirty.append(self._textbox_rect(screen))
+        if not dirty:
+            return dirty
+
+        # restore the background under the changed regions, then redraw what overlaps them
+        bg_scaled = get_scaled(self.bg_raw, screen.get_size(), smooth=False)
+        for rect in dirty:
+            screen.blit(bg_scaled, rect, rect)
+        self._draw_planet_circles(screen, only=dirty)
+        if self._textbox_rect(screen).collidelist(dirty) != -1:
+            self._draw_textbox(screen)
+        return dirty
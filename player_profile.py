@@ -5,6 +5,7 @@ Encapsulates loading/saving a JSON-backed profile and provides helpers for choic
 from pathlib import Path
 import json
 from typing import Any, Dict
+from utils.tracing import traced
 
 
 class PlayerProfile:
@@ -25,6 +26,7 @@ class PlayerProfile:
             # keep defaults on error
             self.data = {"choices": {}, "flags": {}}
 
+    @traced("PlayerProfile.save")
     def save(self):
         try:
             self.data_dir.mkdir(parents=True, exist_ok=True)
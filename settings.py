@@ -14,6 +14,7 @@ WINDOW_SIZE = (WINDOW_WIDTH, WINDOW_HEIGHT)
 WINDOW_MODE = "RESIZABLE"  # Can be "RESIZABLE" or "FULLSCREEN"
 FPS = 60
 WINDOW_TITLE = "Space Cowboy"
+DIRTY_RECT_RENDERING = True  # Only update changed screen regions on mostly-static screens
 
 # Player Settings
 PLAYER_SPEED = 300  # pixels per second
@@ -32,6 +33,8 @@ BULLET_OFFSET = 40  # pixels from player center
 BASE_PATH = Path(__file__).resolve().parent
 ASSETS_PATH = BASE_PATH / "assets"
 IMAGES_PATH = ASSETS_PATH / "images"
+CACHE_PATH = BASE_PATH / "cache"  # generated lookup caches (safe to delete)
+TRACE_PATH = BASE_PATH / "traces"  # Chrome trace / cProfile dumps from utils.tracing
 WORLD1_MAP_PATH = IMAGES_PATH / "World1Map.png"
 LOGO_PATH = IMAGES_PATH / "logo.png"
 
@@ -42,6 +45,9 @@ PLAYER_PROJECTILE_COLOR = "red"
 # Debug Settings
 DEBUG_MODE = False  # Set to True to enable debug features
 SHOW_FPS = False  # Show FPS counter when in debug mode
+TRACE_ENABLED = False  # Record trace spans from startup (F9 dumps them, F10 toggles cProfile)
+MEMORY_PROFILING = False  # tracemalloc + Surface snapshots at scene enter/exit (see utils/memory_profiler.py)
+DRAW_COUNTERS = False  # Count draw/transform/font/display calls per frame by module (F8 toggles)
 
 # Controls
 MOVEMENT_CONTROLS = {
@@ -53,4 +59,14 @@ MOVEMENT_CONTROLS = {
 }
 
 # Game Physics
-PHYSICS_TIMESTEP = 1000  # milliseconds per physics update
+PHYSICS_TIMESTEP = 1000 / 60  # milliseconds per physics update (simulation rate, independent of FPS)
+MAX_PHYSICS_STEPS = 5  # cap on catch-up steps per rendered frame; older backlog is dropped
+
+# Asset Loading
+PARALLEL_DECODE = True  # decode large background images in worker processes (utils/parallel_decode.py)
+PARALLEL_DECODE_MIN_BYTES = 256 * 1024  # smaller files decode on the loader thread
+PARALLEL_DECODE_WORKERS = 0  # 0 = one worker per CPU core
+ADVENTURE_MAP_CACHE_SIZE = 3  # built world maps kept for re-entering a planet (least recently used dropped)
+
+# Garbage Collection
+GC_SCHEDULING = True  # freeze loaded assets and run collections in spare frame time (utils/gc_scheduler.py)
@@ -0,0 +1,43 @@
+import logging
+import pygame
+import pytest
+from DanielsWorld.adventure_map import AdventureMapCache
+from adventure_maps import WORLD_MAPS
+
+logging.disable(logging.INFO)
+MAP_PATH = WORLD_MAPS["world1"]["bg_image"]
+
+
+def _encounters(screen):
+    return [{"id": "enc0", "pos": pygame.Vector2(0.25, 0.25), "type": "minigame"}]
+
+
+@pytest.fixture
+def cache():
+    pygame.display.init()
+    pygame.display.set_mode((640, 360))
+    yield AdventureMapCache(max_entries=2)
+    pygame.display.quit()
+
+
+def test_revisit_puts_player_back_on_spawn(cache):
+    adventure = cache.get("world1", MAP_PATH, encounter_generator=_encounters)
+    spawn = pygame.Vector2(adventure.player_pos)
+    adventure.norm_player_pos.update(0.25, 0.25)  # left standing on the encounter
+    adventure._relayout()
+    assert cache.get("world1", MAP_PATH, encounter_generator=_encounters) is adventure
+    assert adventure.player_pos == spawn
+    assert cache.hits == 1
+
+
+def test_different_kwargs_rebuild(cache):
+    first = cache.get("world1", MAP_PATH, encounter_generator=_encounters)
+    second = cache.get("world1", MAP_PATH)
+    assert second is not first
+    assert cache.misses == 2
+
+
+def test_lru_bound(cache):
+    for world in ("world1", "world2", "world3"):
+        cache.get(world, WORLD_MAPS[world]["bg_image"], encounter_generator=_encounters)
+    assert list(cache._maps) == ["world2", "world3"]
@@ -0,0 +1,25 @@
+from utils.bullet_pool import BulletPool, OWNER_PLAYER, OWNER_ENEMY
+
+
+def test_kill_with_a_repeated_index_frees_the_slot_once():
+    bullets = BulletPool(capacity=8)
+    a = bullets.spawn(0, 0, 0, 0, OWNER_PLAYER)
+    b = bullets.spawn(1, 1, 0, 0, OWNER_ENEMY)
+    bullets.kill([a, a])
+    assert len(bullets) == 1
+    # every spawn must get its own slot and the surviving bullet must keep its slot
+    slots = [bullets.spawn(2, 2, 0, 0, OWNER_PLAYER) for _ in range(7)]
+    assert -1 not in slots
+    assert len(set(slots)) == 7
+    assert b not in slots
+    assert bullets.spawn(3, 3, 0, 0) == -1
+    assert len(bullets) == 8
+
+
+def test_kill_ignores_dead_slots():
+    bullets = BulletPool(capacity=4)
+    a = bullets.spawn(0, 0, 0, 0)
+    bullets.spawn(1, 1, 0, 0)
+    bullets.kill([a])
+    bullets.kill([a])
+    assert len(bullets) == 1
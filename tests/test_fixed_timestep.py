@@ -0,0 +1,37 @@
+import pytest
+from utils.fixed_timestep import FixedTimestep, lerp
+
+
+def test_steps_accumulate_fractional_frames():
+    timestep = FixedTimestep(step_ms=10, max_steps=5)
+    assert timestep.advance(0.025) == 2
+    assert timestep.alpha == pytest.approx(0.5)
+    assert timestep.advance(0.005) == 1  # the leftover 5 ms completes a step
+    assert timestep.alpha == pytest.approx(0.0, abs=1e-9)
+    assert list(timestep.steps(0.03)) == pytest.approx([0.01] * 3)
+    assert timestep.ticks == 6
+
+
+def test_backlog_beyond_max_steps_is_dropped():
+    timestep = FixedTimestep(step_ms=10, max_steps=5)
+    assert timestep.advance(1.0) == 5
+    assert timestep.dropped_time == pytest.approx(0.95)
+    assert timestep.accumulator == pytest.approx(0.0, abs=1e-9)
+    assert timestep.advance(0.0125) == 1  # no catch-up from the dropped time
+    assert timestep.alpha == pytest.approx(0.25)
+
+
+def test_render_offset_matches_interpolation():
+    timestep = FixedTimestep(step_ms=10, max_steps=5)
+    timestep.advance(0.017)
+    prev, pos, vel = 0.0, 5.0, 500.0  # pos advanced one 10 ms step at 500 px/s
+    assert pos + vel * timestep.render_offset == pytest.approx(lerp(prev, pos, timestep.alpha))
+
+
+def test_negative_frame_time_and_reset():
+    timestep = FixedTimestep(step_ms=10, max_steps=5)
+    assert timestep.advance(-1.0) == 0
+    timestep.advance(0.005)
+    timestep.reset()
+    assert timestep.alpha == 0.0
+    assert timestep.advance(0.005) == 0
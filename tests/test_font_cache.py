@@ -0,0 +1,16 @@
+import pygame
+from utils.font_cache import FontCache
+
+
+def test_fonts_are_dropped_on_every_quit():
+    cache = FontCache()
+    previous = []
+    for _ in range(3):
+        pygame.init()
+        font = cache.get(None, 20)
+        # a Font from an earlier init cycle is dead and would crash SDL_ttf
+        assert all(font is not old for old in previous)
+        font.render("round", True, (255, 255, 255))
+        previous.append(font)
+        pygame.quit()
+    assert cache._fonts == {}
@@ -0,0 +1,29 @@
+import gc
+from utils.gc_scheduler import GCScheduler
+
+
+def test_idle_collects_young_generations_early():
+    scheduler = GCScheduler(scheduling=True)
+    scheduler.start()
+    try:
+        gc.collect()
+        keep = [[] for _ in range(gc.get_threshold()[0] // 4 + 10)]
+        assert gc.get_count()[0] >= gc.get_threshold()[0] // 4
+        scheduler.idle(total_ms=1.0)
+        assert scheduler.idle_pauses == 1
+        assert gc.get_count()[0] < len(keep)
+    finally:
+        scheduler.stop()
+
+
+def test_idle_waits_without_spare_time():
+    scheduler = GCScheduler(scheduling=True)
+    scheduler.start()
+    try:
+        gc.collect()
+        keep = [[] for _ in range(gc.get_threshold()[0] // 4 + 10)]
+        scheduler.idle(total_ms=1000.0)
+        assert scheduler.idle_pauses == 0
+        assert len(keep)
+    finally:
+        scheduler.stop()
@@ -0,0 +1,49 @@
+import json
+import pygame
+from utils.image_probe import ImageProbe
+
+
+def _write_png(path, size):
+    pygame.image.save(pygame.Surface(size), str(path))
+
+
+def test_sizes_are_saved_once_per_batch(tmp_path):
+    sizes_file = tmp_path / "image_sizes.json"
+    images = [tmp_path / f"{i}.png" for i in range(3)]
+    for i, path in enumerate(images):
+        _write_png(path, (10 + i, 20))
+    probe = ImageProbe(sizes_file)
+    assert [probe.size(path) for path in images] == [(10, 20), (11, 20), (12, 20)]
+    assert not sizes_file.exists()
+    probe.save()
+    with open(sizes_file, "r", encoding="utf-8") as f:
+        assert len(json.load(f)) == 3
+    sizes_file.unlink()
+    probe.size(images[0])  # a hit doesn't make the manifest dirty
+    probe.save()
+    assert not sizes_file.exists()
+
+
+def test_sizes_are_saved_when_pygame_quits(tmp_path):
+    sizes_file = tmp_path / "image_sizes.json"
+    image = tmp_path / "a.png"
+    _write_png(image, (4, 5))
+    pygame.init()
+    probe = ImageProbe(sizes_file)
+    probe.size(image)
+    pygame.quit()
+    with open(sizes_file, "r", encoding="utf-8") as f:
+        assert [entry["size"] for entry in json.load(f).values()] == [[4, 5]]
+
+
+def test_sizes_are_saved_on_every_quit(tmp_path):
+    sizes_file = tmp_path / "image_sizes.json"
+    probe = ImageProbe(sizes_file)
+    for i in range(3):
+        image = tmp_path / f"{i}.png"
+        _write_png(image, (i + 1, 1))
+        pygame.init()
+        probe.size(image)
+        pygame.quit()
+        with open(sizes_file, "r", encoding="utf-8") as f:
+            assert len(json.load(f)) == i + 1
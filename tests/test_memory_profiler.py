@@ -0,0 +1,67 @@
+import gc
+import weakref
+import pygame
+import pytest
+from utils.gc_scheduler import GCScheduler
+from utils.memory_profiler import MemoryProfiler
+
+
+class Scene:
+    def __init__(self):
+        self.background = pygame.Surface((512, 512))
+        self.self_ref = self  # a cycle, like the real scenes
+
+
+@pytest.fixture
+def frozen_scheduler():
+    scheduler = GCScheduler(scheduling=True)
+    scheduler.freeze()
+    yield scheduler
+    gc.unfreeze()
+
+
+@pytest.fixture
+def profiler():
+    profiler = MemoryProfiler(enabled=True)
+    yield profiler
+    profiler.stop()
+    gc.unfreeze()
+
+
+def test_census_sees_surfaces_frozen_before_profiling():
+    holder = [pygame.Surface((64, 32))]
+    GCScheduler(scheduling=True).freeze()
+    assert gc.get_freeze_count() > 0
+    profiler = MemoryProfiler(enabled=True)
+    try:
+        profiler.track_surface(holder[0], "asset:test")
+        labels = [profiler._label(s) for s in profiler.live_surfaces().values()]
+        assert "asset:test" in labels
+    finally:
+        profiler.stop()
+        gc.unfreeze()
+
+
+def test_census_does_not_freeze_scene_garbage(frozen_scheduler, monkeypatch):
+    assert gc.get_freeze_count() > 0
+    profiler = MemoryProfiler(enabled=True)
+    monkeypatch.setattr("utils.memory_profiler._profiler", profiler)
+    try:
+        assert gc.get_freeze_count() == 0  # profiling thaws the startup freeze
+        scene = Scene()
+        ref = weakref.ref(scene.background)
+        del scene
+        profiler.live_surfaces()
+        frozen_scheduler.freeze()  # already frozen once: does nothing
+        assert gc.get_freeze_count() == 0
+        gc.collect()
+        assert ref() is None
+    finally:
+        profiler.stop()
+
+
+def test_scheduler_does_not_freeze_while_profiling(profiler, monkeypatch):
+    monkeypatch.setattr("utils.memory_profiler._profiler", profiler)
+    scheduler = GCScheduler(scheduling=True)
+    scheduler.freeze()
+    assert gc.get_freeze_count() == 0
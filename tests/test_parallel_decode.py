@@ -0,0 +1,41 @@
+import pygame
+import pytest
+from utils.parallel_decode import ParallelDecoder, decode_to_shared
+
+
+def _write_image(path, alpha):
+    surface = pygame.Surface((37, 23), pygame.SRCALPHA if alpha else 0)
+    for x in range(37):
+        for y in range(23):
+            surface.set_at((x, y), (x * 7 % 256, y * 11 % 256, (x + y) * 5 % 256, (x * y) % 256 if alpha else 255))
+    pygame.image.save(surface, str(path))
+
+
+def _pixels(surface, fmt):
+    return pygame.image.tobytes(surface, fmt)
+
+
+@pytest.mark.parametrize("alpha", [False, True])
+def test_shared_memory_round_trip_matches_image_load(tmp_path, alpha):
+    path = tmp_path / "image.png"
+    _write_image(path, alpha)
+    decoder = ParallelDecoder(workers=1)
+    result = decode_to_shared(path)  # the worker function, run in this process
+    assert result[2] == ("RGBA" if alpha else "RGB")
+    surface = decoder.to_surface(result, alpha)
+    expected = pygame.image.load(str(path))
+    assert surface.get_size() == expected.get_size()
+    assert _pixels(surface, result[2]) == _pixels(expected, result[2])
+
+
+def test_process_pool_decode(tmp_path):
+    path = tmp_path / "image.png"
+    _write_image(path, alpha=True)
+    decoder = ParallelDecoder(workers=1)
+    try:
+        result = decoder.submit(path).result(timeout=60)
+    finally:
+        decoder.shutdown()
+    surface = decoder.to_surface(result, alpha=True)
+    assert _pixels(surface, "RGBA") == _pixels(pygame.image.load(str(path)), "RGBA")
+    assert not decoder._unclaimed
@@ -0,0 +1,93 @@
+import random
+import pygame
+import pytest
+from utils.fixed_timestep import FixedTimestep
+from utils.replay import RecordSession, ReplaySession, ReplayDesyncError
+
+FRAME_MS = (16, 17, 33, 5, 70)  # uneven frames, so the step count per frame varies
+
+
+class FakeClock:
+    def __init__(self):
+        self.frame = 0
+
+    def tick(self, fps=0):
+        self.frame += 1
+        return FRAME_MS[self.frame % len(FRAME_MS)]
+
+
+class ScriptedKeys:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        held = {pygame.K_d} if self.calls % 3 else {pygame.K_w, pygame.K_SPACE}
+        return ScriptedKeys.Pressed(held)
+
+    class Pressed:
+        def __init__(self, held):
+            self.held = held
+
+        def __getitem__(self, key):
+            return key in self.held
+
+
+def play(session, frames=None, drift=0.0):
+    """A tiny game loop: keys move a point, clicks and randomness spawn shots."""
+    clock = FakeClock()
+    timestep = FixedTimestep(step_ms=10, max_steps=5)
+    x, y, shots = 0.0, 0.0, []
+    frame = 0
+    running = True
+    while running:
+        frame_dt = session.tick(clock, 60)
+        frame += 1
+        if frames is not None:
+            if frame % 4 == 0:
+                pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=1, pos=(frame, 2 * frame)))
+            if frame == frames:
+                pygame.event.post(pygame.event.Event(pygame.QUIT))
+        for event in session.poll_events():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                shots.append(list(event.pos))
+        for dt in timestep.steps(frame_dt):
+            keys = session.get_pressed()
+            x += (keys[pygame.K_d] - keys[pygame.K_a]) * 100 * dt + drift
+            y += (keys[pygame.K_s] - keys[pygame.K_w]) * 100 * dt
+            if keys[pygame.K_SPACE] or random.random() < 0.2:
+                shots.append([x, y])
+            for shot in shots:
+                shot[1] -= 50 * dt
+            session.end_tick(x, y, shots)
+    session.close()
+    return session
+
+
+@pytest.fixture
+def recording(tmp_path, monkeypatch):
+    pygame.display.init()
+    pygame.display.set_mode((320, 240))
+    pygame.event.clear()
+    monkeypatch.setattr(pygame.key, "get_pressed", ScriptedKeys())
+    path = tmp_path / "run.rec"
+    session = play(RecordSession(str(path), (320, 240), seed=1234), frames=40)
+    yield path, session
+    pygame.display.quit()
+
+
+def test_replay_matches_recording(recording):
+    path, recorded = recording
+    assert recorded.ticks > 40
+    replay = play(ReplaySession(str(path), (320, 240), paced=False))
+    assert replay.finished
+    assert replay.seed == 1234
+    assert replay.ticks == recorded.ticks
+
+
+def test_replay_detects_a_changed_simulation(recording):
+    path, _ = recording
+    with pytest.raises(ReplayDesyncError):
+        play(ReplaySession(str(path), (320, 240), paced=False), drift=1e-9)
@@ -0,0 +1,45 @@
+import numpy as np
+from utils.spatial_hash import SpatialHash
+
+
+def _points(n=500, seed=0):
+    rng = np.random.default_rng(seed)
+    # some points off screen (negative coords) to cover the signed cell keys
+    return rng.uniform(-200, 1400, n), rng.uniform(-200, 900, n)
+
+
+def _segment_distance2(xs, ys, x0, y0, x1, y1):
+    sx, sy = x1 - x0, y1 - y0
+    seg_len2 = sx * sx + sy * sy
+    t = np.zeros(len(xs)) if seg_len2 == 0 else np.clip(((xs - x0) * sx + (ys - y0) * sy) / seg_len2, 0, 1)
+    dx = xs - (x0 + t * sx)
+    dy = ys - (y0 + t * sy)
+    return dx * dx + dy * dy
+
+
+def test_query_radius_matches_brute_force():
+    xs, ys = _points()
+    grid = SpatialHash(cell_size=64)
+    grid.rebuild(xs, ys)
+    for x, y, radius in [(640, 360, 200), (0, 0, 50), (-150, 800, 300), (1000, 100, 1), (600, 300, 2000)]:
+        expected = np.flatnonzero((xs - x) ** 2 + (ys - y) ** 2 < radius * radius)
+        assert sorted(grid.query_radius(x, y, radius).tolist()) == expected.tolist()
+
+
+def test_query_segment_matches_brute_force():
+    xs, ys = _points(seed=1)
+    grid = SpatialHash(cell_size=50)
+    grid.rebuild(xs, ys)
+    for segment, radius in [((0, 0, 1280, 720), 20), ((-100, 500, 900, -50), 60),
+                            ((300, 300, 300, 300), 80), ((640, 0, 640, 720), 5)]:
+        expected = np.flatnonzero(_segment_distance2(xs, ys, *segment) < radius * radius)
+        assert sorted(grid.query_segment(*segment, radius).tolist()) == expected.tolist()
+
+
+def test_ids_are_returned_and_empty_grid_finds_nothing():
+    grid = SpatialHash()
+    assert len(grid.query_radius(0, 0, 100)) == 0
+    grid.rebuild([10.0, 500.0], [10.0, 500.0], ids=[7, 42])
+    assert grid.query_radius(0, 0, 100).tolist() == [7]
+    grid.rebuild([], [])
+    assert len(grid.query_segment(0, 0, 100, 100, 50)) == 0
@@ -0,0 +1,23 @@
+import gc
+import pygame
+from utils.text_renderer import TextRenderer
+
+
+def test_atlases_are_freed_with_their_font():
+    pygame.font.init()
+    renderer = TextRenderer()
+    keep = pygame.font.Font(None, 20)
+    renderer.render(keep, "kept", (255, 255, 255))
+    for size in (21, 22, 23):
+        renderer.render(pygame.font.Font(None, size), "resize", (255, 255, 255))
+    gc.collect()
+    assert len(renderer._atlases) == 1
+    assert keep in renderer._atlases
+
+
+def test_rendered_text_matches_font_size():
+    pygame.font.init()
+    font = pygame.font.Font(None, 24)
+    surf = TextRenderer().render(font, "Hello", (255, 0, 0))
+    assert surf.get_height() >= font.get_height()
+    assert abs(surf.get_width() - font.size("Hello")[0]) <= 2
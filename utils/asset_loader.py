@@ -0,0 +1,180 @@
+"""
+Background image decoding for the AssetManager.
+
+Names from the asset manifest are queued with request(). A single worker thread decodes them
+with pygame.image.load; PNG decoding releases the GIL, so the game keeps rendering meanwhile.
+The decoded surfaces are not usable yet: convert()/convert_alpha() talks to the display and
+has to run on the main thread. pump() does that hand-off. Call it once per frame; it converts
+whatever the worker has finished, within a small time budget, and registers the results
+with the AssetManager.
+
+A screen that asks the AssetManager for an image still in the queue doesn't decode it a
+second time. The AssetManager waits for the worker's copy instead (see wait()).
+
+request(names, parallel=True) sends files of at least PARALLEL_DECODE_MIN_BYTES to a
+process pool (utils.parallel_decode), so a batch of large images decodes on every core.
+Their pixels come back through shared memory and are rebuilt in pump() as well. The pool
+takes a while to start, so use it for background batches rather than for the first screen.
+
+Usage:
+    from utils.asset_loader import AssetLoader
+    loader = AssetLoader.get_instance()
+    loader.request(["menu_cowboy"])
+    loader.request(["world1_map", "world2_map"], parallel=True)
+    while loader.busy:
+        loader.pump()                 # main thread, once per frame
+        draw_progress(loader.progress())
+"""
+import os
+import queue
+import sys
+import threading
+import time
+import pygame
+from utils.asset_manager import AssetManager
+from utils.tracing import span
+from settings import PARALLEL_DECODE, PARALLEL_DECODE_MIN_BYTES
+
+PUMP_BUDGET_MS = 2.0  # main-thread time per pump() spent converting decoded images
+
+
+class AssetLoader:
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """Singleton pattern so every screen shares one worker and one progress count."""
+        if cls._instance is None:
+            cls._instance = AssetLoader()
+        return cls._instance
+
+    def __init__(self, assets=None):
+        self.assets = assets or AssetManager.get_instance()
+        self.assets.loader = self
+        self._jobs = queue.Queue()     # resolved paths for the worker
+        # (path, surface or shared-memory result or None, error or None, from the process pool)
+        self._results = queue.Queue()
+        self._pending = {}             # path -> alpha, requested but not adopted yet
+        self._thread = None
+        self._decoder = None           # ParallelDecoder, created on the first parallel request
+        self._in_pool = 0              # parallel decodes not adopted yet
+        self.requested = 0
+        self.loaded = 0
+        self.failed = []               # (path, error)
+
+    # ---- requests ----
+
+    def request(self, names, parallel=False):
+        """Queue manifest names for background decoding (resident or queued ones are skipped).
+
+        parallel: decode large files in worker processes (settings.PARALLEL_DECODE).
+        """
+        for name in names:
+            path, alpha = self.assets.manifest[name]
+            if path in self._pending or self.assets.is_resident(name):
+                continue
+            self._pending[path] = alpha
+            self.requested += 1
+            if parallel and PARALLEL_DECODE and self._submit_parallel(path):
+                continue
+            self._jobs.put(path)
+        if not self._jobs.empty() and self._thread is None:
+            self._thread = threading.Thread(target=self._work, name="asset-loader", daemon=True)
+            self._thread.start()
+
+    def is_pending(self, path):
+        return path in self._pending
+
+    def pending(self, names):
+        """True while any of the given manifest names is still queued or being decoded."""
+        return any(self.assets.manifest[name][0] in self._pending for name in names)
+
+    @property
+    def busy(self):
+        return bool(self._pending)
+
+    def progress(self, names=None):
+        """Fraction done (0..1) of everything requested, or of just `names`."""
+        if names is not None:
+            names = list(names)
+            if not names:
+                return 1.0
+            waiting = sum(1 for name in names if self.assets.manifest[name][0] in self._pending)
+            return 1.0 - waiting / len(names)
+        if self.requested == 0:
+            return 1.0
+        return (self.requested - len(self._pending)) / self.requested
+
+    def _submit_parallel(self, path):
+        try:
+            if os.path.getsize(path) < PARALLEL_DECODE_MIN_BYTES:
+                return False
+            if self._decoder is None:
+                from utils.parallel_decode import ParallelDecoder
+                self._decoder = ParallelDecoder()
+            future = self._decoder.submit(path)
+        except Exception as e:
+            print(f"Parallel decode unavailable, using the loader thread: {e}", file=sys.stderr)
+            return False
+        self._in_pool += 1
+        future.add_done_callback(lambda f, path=path: self._pool_done(path, f))
+        return True
+
+    def _pool_done(self, path, future):
+        # runs on the pool's result thread; pump() picks it up on the main thread
+        error = future.exception()
+        self._results.put((path, None if error else future.result(), error, True))
+
+    # ---- worker thread ----
+
+    def _work(self):
+        while True:
+            path = self._jobs.get()
+            try:
+                with span("assets.decode", path=path.name):
+                    surface = pygame.image.load(str(path))
+                self._results.put((path, surface, None, False))
+            except Exception as e:
+                self._results.put((path, None, e, False))
+
+    # ---- main thread ----
+
+    def pump(self, budget_ms=PUMP_BUDGET_MS):
+        """Convert and register finished decodes for up to budget_ms; returns how many were adopted."""
+        start = time.perf_counter()
+        adopted = 0
+        while self._pending:
+            try:
+                result = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._adopt(*result)
+            adopted += 1
+            if (time.perf_counter() - start) * 1000 >= budget_ms:
+                break
+        return adopted
+
+    def wait(self, path):
+        """Block until the worker has decoded `path`, adopting everything finished before it."""
+        while path in self._pending:
+            self._adopt(*self._results.get())
+
+    def _adopt(self, path, surface, error, shared):
+        alpha = self._pending.pop(path, False)
+        if shared:
+            self._in_pool -= 1
+            if self._in_pool == 0:
+                # batch done; don't keep idle worker processes around
+                self._decoder.shutdown()
+            if error is None:
+                try:
+                    with span("assets.frombuffer", path=path.name):
+                        surface = self._decoder.to_surface(surface, alpha)
+                except Exception as e:
+                    error = e
+        if error is not None:
+            print(f"Failed to load {path}: {error}", file=sys.stderr)
+            self.failed.append((path, error))
+            return
+        self.assets.adopt(path, surface, alpha, converted=shared)
+        self.loaded += 1
@@ -0,0 +1,152 @@
+"""
+Process-wide image registry so each asset file is decoded from disk only once.
+
+Images are addressed by a logical name (see ASSET_MANIFEST) or by path. The first request
+loads the file and converts it to the display format (convert/convert_alpha) once a display
+exists; every later request returns the same shared Surface. Callers must treat the
+returned surfaces as read-only (copy them before drawing onto them).
+
+Images can also be decoded ahead of time on a worker thread by utils.asset_loader, which
+hands them over through adopt(). A request for an image the loader is still working on
+waits for it rather than decoding the file a second time.
+
+Usage:
+    from utils.asset_manager import AssetManager
+    assets = AssetManager.get_instance()
+    capy = assets.get("player_a")
+    bg = assets.load_path("assets/images/maps/World1Map.png")
+    print(assets.stats())  # {'hits': .., 'misses': .., 'resident': ..}
+"""
+from pathlib import Path
+import pygame
+from utils.tracing import span
+from utils.memory_profiler import track_surface
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+# logical name -> (path relative to project root, needs per-pixel alpha)
+ASSET_MANIFEST = {
+    "player_w": ("assets/images/wCapy.png", True),
+    "player_a": ("assets/images/aCapy.png", True),
+    "player_s": ("assets/images/sCapy.png", True),
+    "player_d": ("assets/images/dCapy.png", True),
+    "player_dead": ("assets/images/deadBara.png", True),
+    "enemy_octopus": ("assets/images/octopusNormal.png", True),
+    "enemy_octopus_damaged": ("assets/images/octopusDamaged.png", True),
+    "mars_background": ("assets/images/marsBackground.png", False),
+    "menu_cowboy": ("assets/images/Cowboy image.png", False),
+    "sheriff_station": ("assets/images/Sheriff_station.png", False),
+    "sheriff_station_locked": ("assets/images/Sherriff_station_boss_locked.png", False),
+    "world1_map": ("assets/images/maps/World1Map.png", False),
+    "world2_map": ("assets/images/maps/World2Map.png", False),
+    "world3_map": ("assets/images/maps/World3Map.png", False),
+    "world4_map": ("assets/images/maps/World4Map.png", False),
+    "logo": ("assets/images/logo.png", True),
+}
+
+
+class AssetManager:
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """Singleton pattern so screens and minigames share one registry."""
+        if cls._instance is None:
+            cls._instance = AssetManager()
+        return cls._instance
+
+    def __init__(self):
+        self.manifest = {name: (PROJECT_ROOT / rel, alpha) for name, (rel, alpha) in ASSET_MANIFEST.items()}
+        # resolved path -> [surface, alpha, converted]
+        self._surfaces = {}
+        self.hits = 0
+        self.misses = 0
+        self.loader = None  # AssetLoader decoding in the background, if one was created
+
+    def register(self, name, path, alpha=False):
+        """Add (or repoint) a logical name."""
+        self.manifest[name] = (self._resolve(path), alpha)
+
+    def get(self, name):
+        """Return the shared surface for a logical name, loading it on first use."""
+        if name not in self.manifest:
+            raise KeyError(f"Unknown asset '{name}'")
+        path, alpha = self.manifest[name]
+        return self._fetch(path, alpha)
+
+    def load_path(self, path, alpha=False):
+        """Return the shared surface for an image path, loading it on first use."""
+        return self._fetch(self._resolve(path), alpha)
+
+    def is_resident(self, name):
+        path, _ = self.manifest[name]
+        return path in self._surfaces
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "resident": len(self._surfaces)}
+
+    def unload(self, name_or_path):
+        """Drop a resident image so the next request reloads it from disk."""
+        if name_or_path in self.manifest:
+            path = self.manifest[name_or_path][0]
+        else:
+            path = self._resolve(name_or_path)
+        self._surfaces.pop(path, None)
+
+    def _resolve(self, path):
+        path = Path(path)
+        if not path.is_absolute():
+            # relative paths in this repo are written relative to the project root
+            path = PROJECT_ROOT / path
+        return path.resolve()
+
+    def _fetch(self, path, alpha):
+        entry = self._surfaces.get(path)
+        if entry is not None:
+            self.hits += 1
+            if not entry[2]:
+                # loaded before a display existed; convert now that one may be up
+                self._convert(entry)
+                track_surface(entry[0], f"asset:{path.name}")
+            return entry[0]
+
+        if self.loader is not None and self.loader.is_pending(path):
+            self.loader.wait(path)
+            entry = self._surfaces.get(path)
+            if entry is not None:
+                self.hits += 1
+                return entry[0]
+
+        self.misses += 1
+        with span("assets.load", path=path.name):
+            entry = [pygame.image.load(str(path)), alpha, False]
+            self._convert(entry)
+        track_surface(entry[0], f"asset:{path.name}")
+        self._surfaces[path] = entry
+        return entry[0]
+
+    def adopt(self, path, surface, alpha=False, converted=False):
+        """Register a surface decoded elsewhere (utils.asset_loader) and convert it here.
+
+        converted: the surface is already in display format (or owns unconverted pixels
+        because there is no display yet, in which case a later get() converts it).
+        """
+        path = self._resolve(path)
+        entry = self._surfaces.get(path)
+        if entry is not None:
+            return entry[0]
+        self.misses += 1
+        entry = [surface, alpha, converted and pygame.display.get_surface() is not None]
+        if not entry[2]:
+            with span("assets.convert", path=path.name):
+                self._convert(entry)
+        track_surface(entry[0], f"asset:{path.name}")
+        self._surfaces[path] = entry
+        return entry[0]
+
+    @staticmethod
+    def _convert(entry):
+        if pygame.display.get_surface() is None:
+            return
+        entry[0] = entry[0].convert_alpha() if entry[1] else entry[0].convert()
+        entry[2] = True
@@ -0,0 +1,145 @@
+"""
+Fixed-capacity bullet storage backed by NumPy arrays (structure of arrays).
+
+Replaces the per-shot linked-list nodes the minigames used: every bullet lives in a slot of
+the x/y/vx/vy/alive/owner arrays, movement, off-screen culling and circle collision run as
+vectorized operations over the used slots, and dead slots go back on a free stack for reuse.
+
+Usage:
+    from utils.bullet_pool import BulletPool, OWNER_PLAYER, OWNER_ENEMY
+    bullets = BulletPool(capacity=4096)
+    bullets.spawn(x, y, vx, vy, OWNER_PLAYER)
+    bullets.move_all(dt)
+    bullets.remove_offscreen(width, height)
+    if bullets.any_hit(enemy_x, enemy_y, 50, OWNER_PLAYER): ...
+"""
+import numpy as np
+
+OWNER_PLAYER = 0
+OWNER_ENEMY = 1
+
+DEFAULT_CAPACITY = 4096
+
+
+class BulletPool:
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.x = np.zeros(capacity, dtype=np.float64)
+        self.y = np.zeros(capacity, dtype=np.float64)
+        self.vx = np.zeros(capacity, dtype=np.float64)
+        self.vy = np.zeros(capacity, dtype=np.float64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.owner = np.zeros(capacity, dtype=np.int8)
+        self._scratch = np.zeros(capacity, dtype=np.float64)
+        self.count = 0
+        self.dropped = 0  # spawns refused because the pool was full
+        self._reset_free()
+
+    def _reset_free(self):
+        # stack of free slots; popping from the end hands out low indices first so live
+        # bullets stay packed at the front and the vectorized passes only touch [:_hi]
+        self._free = np.arange(self.capacity - 1, -1, -1, dtype=np.int32)
+        self._free_top = self.capacity
+        self._hi = 0
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, x, y, vx, vy, owner=OWNER_PLAYER):
+        """Add a bullet; returns its slot index, or -1 if the pool is full."""
+        if self._free_top == 0:
+            self.dropped += 1
+            return -1
+        self._free_top -= 1
+        i = int(self._free[self._free_top])
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.owner[i] = owner
+        self.alive[i] = True
+        self.count += 1
+        if i >= self._hi:
+            self._hi = i + 1
+        return i
+
+    def kill(self, indices):
+        """Free the given slots (already-dead and repeated slots are ignored)."""
+        indices = np.asarray(indices, dtype=np.int32)
+        indices = indices[self.alive[indices]]
+        if len(indices) > 1:
+            # a slot hit by two queries must not go back on the free stack twice. Sort and drop
+            # neighbours instead of np.unique, whose first call imports numpy.ma mid-frame
+            indices = np.sort(indices)
+            indices = indices[np.concatenate(([True], indices[1:] != indices[:-1]))]
+        n = len(indices)
+        if n == 0:
+            return
+        self.alive[indices] = False
+        self.count -= n
+        if self.count == 0:
+            self._reset_free()
+            return
+        self._free[self._free_top:self._free_top + n] = indices
+        self._free_top += n
+
+    def clear(self):
+        self.alive[:] = False
+        self.count = 0
+        self._reset_free()
+
+    def move_all(self, dt):
+        hi = self._hi
+        tmp = self._scratch[:hi]
+        # dead slots move too; cheaper than masking and their values are never read
+        np.multiply(self.vx[:hi], dt, out=tmp)
+        self.x[:hi] += tmp
+        np.multiply(self.vy[:hi], dt, out=tmp)
+        self.y[:hi] += tmp
+
+    def remove_offscreen(self, width, height):
+        hi = self._hi
+        x = self.x[:hi]
+        y = self.y[:hi]
+        off = (x < 0) | (x > width) | (y < 0) | (y > height)
+        off &= self.alive[:hi]
+        if off.any():
+            self.kill(np.flatnonzero(off))
+
+    def _mask(self, owner):
+        hi = self._hi
+        if owner is None:
+            return self.alive[:hi]
+        return self.alive[:hi] & (self.owner[:hi] == owner)
+
+    def indices(self, owner=None):
+        """Slot indices of live bullets, optionally only those fired by owner."""
+        return np.flatnonzero(self._mask(owner))
+
+    def positions(self, owner=None, t=0.0):
+        """(xs, ys) arrays of live bullet positions, extrapolated by t seconds.
+
+        Pass FixedTimestep.render_offset as t to draw bullets interpolated between ticks.
+        """
+        idx = self.indices(owner)
+        if t:
+            return self.x[idx] + self.vx[idx] * t, self.y[idx] + self.vy[idx] * t
+        return self.x[idx], self.y[idx]
+
+    def hits(self, cx, cy, radius, owner=None):
+        """Slot indices of live bullets strictly closer than radius to (cx, cy)."""
+        hi = self._hi
+        dx = self.x[:hi] - cx
+        dy = self.y[:hi] - cy
+        inside = dx * dx + dy * dy < radius * radius
+        inside &= self._mask(owner)
+        return np.flatnonzero(inside)
+
+    def any_hit(self, cx, cy, radius, owner=None):
+        return len(self.hits(cx, cy, radius, owner)) > 0
+
+    def fill_grid(self, grid, owner=None):
+        """Rebuild a SpatialHash with the live bullets (ids are slot indices)."""
+        idx = self.indices(owner)
+        grid.rebuild(self.x[idx], self.y[idx], idx)
+        return grid
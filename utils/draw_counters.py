@@ -0,0 +1,268 @@
+"""
+Per-frame draw-call and surface-operation counters, grouped by calling module.
+
+While enabled, pygame.draw.*, pygame.transform.*, pygame.display.flip/update and the Font
+constructor are replaced by thin wrappers. Font objects are created from a Font subclass,
+so Font.render is counted as well. Each wrapper records calls, pixels touched and time under
+(caller module, operation). The caller is the nearest frame outside utils/, so a smoothscale
+issued through utils.surface_cache is charged to the scene that asked for it. A
+FrameProfiler listener closes every frame, so the numbers are per frame.
+
+Surface.blit/blits/fill are C methods that can't be wrapped. With blits=True they are
+observed through a sys.setprofile hook instead. The hook reports calls and time but no
+pixels, and it slows every Python call while it is on.
+
+Off by default, and nothing is patched while it is off. Enable with settings.DRAW_COUNTERS,
+the SPACECOWBOY_DRAW_COUNTERS environment variable ("blits" also hooks Surface.blit), or F8
+in game. Pressing F8 again prints the per-frame table and restores pygame.
+
+Usage:
+    from utils.draw_counters import DrawCounters
+    counters = DrawCounters.get_instance()
+    counters.enable(blits=True)
+    ...                                   # run some frames
+    counters.print_summary()              # calls / kpixels / ms per frame by module and op
+    counters.disable()
+"""
+import os
+import sys
+import time
+from collections import defaultdict
+import pygame
+from settings import DRAW_COUNTERS
+from utils.frame_profiler import FrameProfiler
+
+TOGGLE_KEY = pygame.K_F8
+DRAW_FUNCS = ("rect", "polygon", "circle", "ellipse", "arc", "line", "lines", "aaline", "aalines")
+TRANSFORM_FUNCS = ("scale", "smoothscale", "scale_by", "smoothscale_by", "rotate", "rotozoom", "scale2x",
+                   "flip", "chop", "laplacian", "grayscale", "average_surfaces", "threshold")
+SURFACE_METHODS = ("blit", "blits", "fill")
+
+_UTILS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _caller():
+    """Module of the nearest frame outside utils/ (scripts report their file name)."""
+    frame = sys._getframe(2)
+    while frame is not None and os.path.dirname(frame.f_code.co_filename) == _UTILS_DIR:
+        frame = frame.f_back
+    if frame is None:
+        return "?"
+    name = frame.f_globals.get("__name__", "?")
+    if name == "__main__":
+        name = os.path.splitext(os.path.basename(frame.f_code.co_filename))[0]
+    return name
+
+
+def _rect_pixels(result, args):
+    return result.w * result.h if result else 0
+
+
+def _surface_pixels(result, args):
+    return result.get_width() * result.get_height() if isinstance(result, pygame.Surface) else 0
+
+
+def _flip_pixels(result, args):
+    screen = pygame.display.get_surface()
+    return screen.get_width() * screen.get_height() if screen is not None else 0
+
+
+def _update_pixels(result, args):
+    if not args or args[0] is None:
+        return _flip_pixels(result, args)
+    rects = args[0] if len(args) == 1 else args
+    try:
+        rects = [pygame.Rect(rects)]  # a single rect
+    except TypeError:
+        rects = [pygame.Rect(r) for r in rects if r]
+    return sum(r.w * r.h for r in rects)
+
+
+class DrawCounters:
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """Singleton pattern so the F8 toggle and the totals cover every scene."""
+        if cls._instance is None:
+            cls._instance = DrawCounters()
+        return cls._instance
+
+    def __init__(self):
+        self.enabled = False
+        self.blits = False
+        self._patched = []  # (owner, attribute, original)
+        self._current = defaultdict(lambda: [0, 0, 0.0])  # (module, op) -> [calls, pixels, seconds]
+        self._totals = defaultdict(lambda: [0, 0, 0.0])
+        self.last_frame = {}
+        self.frames = 0
+        self._calls = []  # open Surface method calls seen by the profile hook
+        self._saved_profile = None
+
+    # ---- switching ----
+
+    def enable(self, blits=False):
+        if self.enabled:
+            return
+        self.enabled = True
+        self.blits = blits
+        for name in DRAW_FUNCS:
+            self._patch(pygame.draw, name, f"draw.{name}", _rect_pixels)
+        for name in TRANSFORM_FUNCS:
+            self._patch(pygame.transform, name, f"transform.{name}", _surface_pixels)
+        self._patch(pygame.display, "flip", "display.flip", _flip_pixels)
+        self._patch(pygame.display, "update", "display.update", _update_pixels)
+        self._patched.append((pygame.font, "Font", pygame.font.Font))
+        pygame.font.Font = _counting_font(self, pygame.font.Font)
+        self._refresh_fonts()
+        if blits:
+            self._saved_profile = sys.getprofile()
+            sys.setprofile(self._profile)
+        FrameProfiler.get_instance().add_listener(self._end_frame)
+
+    def disable(self):
+        if not self.enabled:
+            return
+        self.enabled = False
+        for owner, name, original in reversed(self._patched):
+            setattr(owner, name, original)
+        self._patched = []
+        self._refresh_fonts()
+        if self.blits:
+            sys.setprofile(self._saved_profile)
+            self._saved_profile = None
+            self._calls = []
+        FrameProfiler.get_instance().remove_listener(self._end_frame)
+
+    def toggle(self, blits=False):
+        if self.enabled:
+            self.print_summary()
+            self.disable()
+        else:
+            self.reset()
+            self.enable(blits)
+            print("Draw counters on; press F8 again for the per-frame table")
+
+    def handle_event(self, event):
+        """Toggle on the hotkey; returns True if the event was consumed."""
+        if event.type == pygame.KEYDOWN and event.key == TOGGLE_KEY:
+            self.toggle(blits=self.blits)
+            return True
+        return False
+
+    @staticmethod
+    def _refresh_fonts():
+        # fonts handed out before the switch are of the other class; let the cache rebuild them
+        from utils.font_cache import FontCache
+        from utils import text_renderer
+        FontCache.get_instance().clear()
+        text_renderer.clear()
+
+    # ---- recording ----
+
+    def _patch(self, owner, name, op, pixels):
+        original = getattr(owner, name, None)
+        if original is None:
+            return
+        counts = self._current
+
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            result = original(*args, **kwargs)
+            elapsed = time.perf_counter() - start
+            entry = counts[(_caller(), op)]
+            entry[0] += 1
+            entry[1] += pixels(result, args)
+            entry[2] += elapsed
+            return result
+
+        wrapper.__name__ = name
+        wrapper.__doc__ = original.__doc__
+        self._patched.append((owner, name, original))
+        setattr(owner, name, wrapper)
+
+    def record(self, op, pixels, seconds):
+        entry = self._current[(_caller(), op)]
+        entry[0] += 1
+        entry[1] += pixels
+        entry[2] += seconds
+
+    def _profile(self, frame, event, arg):
+        if event == "c_call":
+            if arg.__name__ in SURFACE_METHODS and isinstance(getattr(arg, "__self__", None), pygame.Surface):
+                self._calls.append((arg, frame, time.perf_counter()))
+        elif event in ("c_return", "c_exception") and self._calls and self._calls[-1][0] is arg:
+            _, caller, start = self._calls.pop()
+            while caller is not None and os.path.dirname(caller.f_code.co_filename) == _UTILS_DIR:
+                caller = caller.f_back
+            name = caller.f_globals.get("__name__", "?") if caller is not None else "?"
+            if name == "__main__":
+                name = os.path.splitext(os.path.basename(caller.f_code.co_filename))[0]
+            entry = self._current[(name, f"Surface.{arg.__name__}")]
+            entry[0] += 1
+            entry[2] += time.perf_counter() - start
+
+    def _end_frame(self, total_ms, stages):
+        frame = {key: tuple(value) for key, value in self._current.items()}
+        for key, (calls, pixels, seconds) in frame.items():
+            total = self._totals[key]
+            total[0] += calls
+            total[1] += pixels
+            total[2] += seconds
+        self._current.clear()
+        self.last_frame = frame
+        self.frames += 1
+
+    # ---- reporting ----
+
+    def reset(self):
+        self._current.clear()
+        self._totals.clear()
+        self.last_frame = {}
+        self.frames = 0
+
+    def summary(self):
+        """{module: {op: {"calls", "kpixels", "ms"}}} averaged per frame."""
+        frames = max(1, self.frames)
+        result = defaultdict(dict)
+        for (module, op), (calls, pixels, seconds) in sorted(self._totals.items()):
+            result[module][op] = {
+                "calls": calls / frames,
+                "kpixels": pixels / frames / 1000,
+                "ms": seconds * 1000 / frames,
+            }
+        return dict(result)
+
+    def print_summary(self):
+        print(f"draw counters, mean per frame over {self.frames} frames")
+        print(f"{'module':<34} {'operation':<24} {'calls':>8} {'kpixels':>10} {'ms':>8}")
+        rows = [(module, op, stats) for module, ops in self.summary().items() for op, stats in ops.items()]
+        for module, op, stats in sorted(rows, key=lambda row: -row[2]["ms"]):
+            print(f"{module:<34} {op:<24} {stats['calls']:>8.1f} {stats['kpixels']:>10.1f} {stats['ms']:>8.3f}")
+
+
+def _counting_font(counters, font_class):
+    class CountingFont(font_class):
+        """Font whose constructor and render calls are recorded by the draw counters."""
+
+        def __init__(self, *args, **kwargs):
+            start = time.perf_counter()
+            super().__init__(*args, **kwargs)
+            counters.record("font.Font", 0, time.perf_counter() - start)
+
+        def render(self, *args, **kwargs):
+            start = time.perf_counter()
+            surface = super().render(*args, **kwargs)
+            counters.record("font.render", surface.get_width() * surface.get_height(), time.perf_counter() - start)
+            return surface
+
+    CountingFont.__name__ = font_class.__name__
+    return CountingFont
+
+
+if DRAW_COUNTERS or os.environ.get("SPACECOWBOY_DRAW_COUNTERS"):
+    DrawCounters.get_instance().enable(blits=os.environ.get("SPACECOWBOY_DRAW_COUNTERS") == "blits")
+
+
+def handle_event(event):
+    return DrawCounters.get_instance().handle_event(event)
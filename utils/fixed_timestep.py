@@ -0,0 +1,66 @@
+"""
+Fixed-timestep simulation clock shared by every scene loop.
+
+Each rendered frame feeds its real elapsed time into an accumulator. The simulation is then
+advanced in whole steps of settings.PHYSICS_TIMESTEP, so physics runs at a fixed rate
+whatever the render rate is. If a frame falls far behind (slow machine, window drag, a
+blocking dialog), at most MAX_PHYSICS_STEPS steps run and the rest of the backlog is
+dropped, so the loop never spirals trying to catch up. alpha (0..1) is how far the rendered
+moment lies between the previous and the latest simulated state; use it to interpolate.
+
+Usage:
+    from utils.fixed_timestep import FixedTimestep
+    timestep = FixedTimestep()
+    while running:
+        frame_dt = clock.tick(FPS) / 1000
+        for dt in timestep.steps(frame_dt):
+            update(dt)                                     # always dt == timestep.step
+        draw(lerp(prev_pos, pos, timestep.alpha))
+"""
+from settings import PHYSICS_TIMESTEP, MAX_PHYSICS_STEPS
+
+
+class FixedTimestep:
+    def __init__(self, step_ms=PHYSICS_TIMESTEP, max_steps=MAX_PHYSICS_STEPS):
+        self.step = step_ms / 1000.0  # seconds per simulation step
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.ticks = 0            # simulation steps run so far
+        self.dropped_time = 0.0   # seconds of backlog discarded by the step cap
+
+    def advance(self, frame_dt):
+        """Add one frame's elapsed seconds; return how many simulation steps to run."""
+        self.accumulator += max(0.0, frame_dt)
+        steps = int(self.accumulator / self.step)
+        if steps > self.max_steps:
+            excess = (steps - self.max_steps) * self.step
+            self.accumulator -= excess
+            self.dropped_time += excess
+            steps = self.max_steps
+        self.accumulator -= steps * self.step
+        self.ticks += steps
+        self.alpha = self.accumulator / self.step
+        return steps
+
+    def steps(self, frame_dt):
+        """Yield the fixed dt once per simulation step due this frame."""
+        for _ in range(self.advance(frame_dt)):
+            yield self.step
+
+    @property
+    def render_offset(self):
+        """Seconds from the latest simulated state back to the rendered moment (<= 0).
+
+        For constant-velocity motion, pos + vel * render_offset equals lerp(prev, pos, alpha).
+        """
+        return (self.alpha - 1.0) * self.step
+
+    def reset(self):
+        """Forget accumulated time, e.g. after a blocking dialog or on scene entry."""
+        self.accumulator = 0.0
+        self.alpha = 0.0
+
+
+def lerp(a, b, alpha):
+    return a + (b - a) * alpha
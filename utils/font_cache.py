@@ -0,0 +1,120 @@
+"""
+Font service: one shared pygame Font per (family, size, bold, italic).
+
+Screens used to build pygame.font.SysFont/Font objects inside their frame loops. get_font
+returns cached Font objects instead. family=None uses pygame's bundled default font and
+never touches the system font scan. Named families are resolved to a file with
+pygame.font.match_font; the first call triggers pygame's slow system font scan, so
+resolved paths are persisted to CACHE_PATH/font_paths.json and later runs skip the scan.
+
+Usage:
+    from utils.font_cache import get_font
+    font = get_font(None, 32)           # bundled default font
+    mono = get_font("consolas", 22)     # system font, path discovered once
+"""
+import json
+import os
+import pygame
+from settings import CACHE_PATH
+
+FONT_PATHS_FILE = CACHE_PATH / "font_paths.json"
+
+
+class FontCache:
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """Singleton pattern so every screen shares Font objects."""
+        if cls._instance is None:
+            cls._instance = FontCache()
+        return cls._instance
+
+    def __init__(self, paths_file=FONT_PATHS_FILE):
+        self.paths_file = paths_file
+        self._fonts = {}
+        # "family|bold|italic" -> font file path (None when the system has no match)
+        self._paths = None
+        # Font objects are dead once pygame quits; using one after a re-init crashes SDL_ttf.
+        # pygame forgets quit functions once it has run them, so clear() is registered again
+        # by the first get() of every init cycle.
+        self._quit_registered = False
+
+    def get(self, family=None, size=24, bold=False, italic=False):
+        size = max(1, int(size))
+        key = (family, size, bold, italic)
+        font = self._fonts.get(key)
+        if font is None:
+            if not self._quit_registered:
+                pygame.register_quit(self.clear)
+                self._quit_registered = True
+            font = self._create(family, size, bold, italic)
+            self._fonts[key] = font
+        return font
+
+    def _create(self, family, size, bold, italic):
+        if not pygame.font.get_init():
+            pygame.font.init()
+        if family is None:
+            font = pygame.font.Font(None, size)
+            fake_bold, fake_italic = bold, italic
+        else:
+            path = self.resolve(family, bold, italic)
+            try:
+                font = pygame.font.Font(path, size)
+            except OSError:
+                # unreadable font file; fall back to the bundled font
+                font = pygame.font.Font(None, size)
+            # same fallback SysFont uses: fake the style if only the plain face exists
+            plain = self.resolve(family) if (bold or italic) else path
+            fake_bold = bold and (path is None or path == plain)
+            fake_italic = italic and (path is None or path == plain)
+        if fake_bold:
+            font.set_bold(True)
+        if fake_italic:
+            font.set_italic(True)
+        return font
+
+    def resolve(self, family, bold=False, italic=False):
+        """Return the font file for a system family, scanning the system only once ever."""
+        paths = self._load_paths()
+        key = f"{family.lower()}|{int(bool(bold))}|{int(bool(italic))}"
+        if key in paths:
+            path = paths[key]
+            # rescan only if the remembered file has since disappeared
+            if path is None or os.path.exists(path):
+                return path
+        path = pygame.font.match_font(family, bold, italic)
+        paths[key] = path
+        self._save_paths()
+        return path
+
+    def _load_paths(self):
+        if self._paths is None:
+            self._paths = {}
+            try:
+                if self.paths_file.exists():
+                    with open(self.paths_file, "r", encoding="utf-8") as f:
+                        self._paths = json.load(f)
+            except Exception:
+                # a broken cache just means we rescan
+                self._paths = {}
+        return self._paths
+
+    def _save_paths(self):
+        try:
+            os.makedirs(self.paths_file.parent, exist_ok=True)
+            with open(self.paths_file, "w", encoding="utf-8") as f:
+                json.dump(self._paths, f, indent=2)
+        except Exception as e:
+            print(f"Error saving font cache: {e}")
+
+    def clear(self):
+        """Drop cached Font objects (persisted path discovery is kept)."""
+        self._fonts.clear()
+        self._quit_registered = False
+
+
+def get_font(family=None, size=24, bold=False, italic=False):
+    """Return a shared Font for (family, size, bold, italic); family None is the bundled font."""
+    return FontCache.get_instance().get(family, size, bold, italic)
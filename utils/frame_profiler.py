@@ -0,0 +1,103 @@
+"""
+Per-frame stage timing shared by all scene loops.
+
+Each loop marks where its frame starts, which stage it is in (events / update / render) and
+where the frame ends. Waiting in clock.tick is left out, so a frame's total is the work done,
+not the frame-rate cap. Every finished frame is appended to a short history and passed to
+any registered listeners (benchmarks, HUD). Marking costs a perf_counter call, cheap enough
+to leave in every loop. While utils.tracing is enabled, each closed stage is also recorded as
+a span named "<scene>.<stage>", and each finished frame as "<scene>.frame".
+
+A scene that runs inside another scene's frame (a minigame launched from the map) restarts
+the frame, so the blocked outer frame is simply not recorded; loops that know a frame was
+held up by a modal dialog call discard_frame() for the same effect.
+
+Usage:
+    from utils.frame_profiler import FrameProfiler
+    profiler = FrameProfiler.get_instance()
+    while running:
+        profiler.begin_frame("adventure_map")
+        profiler.stage("events")
+        ...
+        profiler.stage("update")
+        ...
+        profiler.stage("render")
+        ...
+        profiler.end_frame()
+        clock.tick(60)
+"""
+import time
+from collections import deque
+from utils.tracing import Tracer
+
+HISTORY_FRAMES = 600
+
+
+class FrameProfiler:
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """Singleton pattern so every scene reports to the same history."""
+        if cls._instance is None:
+            cls._instance = FrameProfiler()
+        return cls._instance
+
+    def __init__(self, history=HISTORY_FRAMES):
+        # (total_ms, {stage: ms}) per finished frame, newest last
+        self.frames = deque(maxlen=history)
+        self.frame_count = 0
+        self.listeners = []  # called as listener(total_ms, stages) after every frame
+        self._start = None
+        self._stage = None
+        self._stage_start = 0.0
+        self._stages = {}
+        self._scene = "frame"
+        self._tracer = Tracer.get_instance()
+
+    def begin_frame(self, scene=None):
+        now = time.perf_counter()
+        self._scene = scene or "frame"
+        self._start = now
+        self._stage = None
+        self._stage_start = now
+        self._stages = {}
+
+    def stage(self, name):
+        """Close the running stage and start timing `name` (repeated names accumulate)."""
+        now = time.perf_counter()
+        if self._stage is not None:
+            self._stages[self._stage] = self._stages.get(self._stage, 0.0) + (now - self._stage_start) * 1000
+            if self._tracer.enabled:
+                self._tracer.record(f"{self._scene}.{self._stage}", self._stage_start, now)
+        self._stage = name
+        self._stage_start = now
+
+    def end_frame(self):
+        if self._start is None:
+            # the frame was restarted by a nested scene or discarded; close the stage for the
+            # trace (a dialog hitch should still show up there) but keep it out of the history
+            self.stage(None)
+            return
+        self.stage(None)
+        end = time.perf_counter()
+        total = (end - self._start) * 1000
+        if self._tracer.enabled:
+            self._tracer.record(f"{self._scene}.frame", self._start, end)
+        stages = self._stages
+        self._start = None
+        self.frames.append((total, stages))
+        self.frame_count += 1
+        for listener in self.listeners:
+            listener(total, stages)
+
+    def discard_frame(self):
+        """Drop the running frame, e.g. one that sat in a blocking dialog."""
+        self._start = None
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
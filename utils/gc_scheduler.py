@@ -0,0 +1,215 @@
+"""
+Frame-aware garbage collection.
+
+CPython's collector runs whenever allocation counters cross their thresholds, which during
+gameplay means at a random point inside a frame. Full (generation 2) passes over everything
+the game has loaded are the ones that show up as hitches. This module:
+- freezes everything alive once the startup assets have loaded (gc.freeze), so later passes
+  skip it. This happens once per process: frozen objects are never collected, so freezing again
+  at every scene start would keep each scene's garbage (e.g. a minigame module re-executed by
+  run_sebs_minigame, which is full of reference cycles) alive for good.
+- raises the generation-2 threshold while the game runs, so full passes stop happening on
+  their own
+- runs collections in the spare time left under the settings.FPS frame budget, from a
+  FrameProfiler listener after each frame's work. Once gen0 is a quarter of the way to its
+  threshold, the next frame with spare time collects gen1 (gen0 alone if only that fits), so
+  steady per-frame allocation never reaches the threshold mid-frame. A burst inside a single
+  frame (a lazy import, a scene load) can still trigger an automatic pass. A full pass only
+  runs when its measured cost fits, or is forced after GEN2_MAX_INTERVAL seconds so memory
+  can't grow unbounded.
+- records every gameplay collection pause in a histogram (stats()), shown by the perf HUD
+  and the frame benchmark
+
+Disable the scheduling with settings.GC_SCHEDULING = False; pauses are still recorded. Nothing is
+frozen while utils.memory_profiler is enabled, and enabling it thaws an earlier freeze for good,
+so its Surface census sees every object.
+
+Usage:
+    from utils import gc_scheduler
+    gc_scheduler.start()     # game entry (nested start/stop pairs are counted)
+    ... load assets ...
+    gc_scheduler.freeze()    # once, after the startup assets load (later calls do nothing)
+    ...
+    gc_scheduler.stop()      # restores the interpreter's thresholds
+    print(gc_scheduler.stats())
+"""
+import gc
+import time
+from settings import FPS, GC_SCHEDULING
+from utils.frame_profiler import FrameProfiler
+from utils import memory_profiler
+
+BUDGET_MS = 1000 / FPS
+PAUSE_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2, 5, 10, 25)  # histogram upper bounds; one more bucket above
+GAMEPLAY_GEN2_THRESHOLD = 1_000_000  # full passes effectively only run from idle()
+MIN_SPARE_MS = 1.0       # don't start an idle collection with less spare time than this
+GEN2_MIN_INTERVAL = 5.0  # seconds between idle full passes
+GEN2_MAX_INTERVAL = 60.0  # force a full pass after this long, spare time or not
+YOUNG_TRIGGER_DIVISOR = 4  # collect the young generations from threshold0 / 4 on
+_INITIAL_COST_MS = (0.05, 0.3, 2.0)  # pause estimates per generation until one is measured
+
+
+class GCScheduler:
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """Singleton pattern so every scene shares one policy and histogram."""
+        if cls._instance is None:
+            cls._instance = GCScheduler()
+        return cls._instance
+
+    def __init__(self, scheduling=GC_SCHEDULING):
+        self.scheduling = scheduling
+        self.profiler = FrameProfiler.get_instance()
+        self._users = 0
+        self._saved_threshold = None
+        self._cost_ms = list(_INITIAL_COST_MS)  # smoothed pause per generation
+        self._pause_start = None
+        self._idle = False     # inside a collection started by idle()
+        self._loading = False  # inside freeze(); load-time collections are not gameplay pauses
+        self.frozen = False    # freeze() already ran
+        self._last_full = time.perf_counter()
+        self.reset_stats()
+
+    # ---- lifecycle ----
+
+    def start(self):
+        self._users += 1
+        if self._users > 1:
+            return
+        gc.callbacks.append(self._on_gc)
+        if self.scheduling:
+            self._saved_threshold = gc.get_threshold()
+            gen0, gen1, _ = self._saved_threshold
+            gc.set_threshold(gen0, gen1, GAMEPLAY_GEN2_THRESHOLD)
+            self.profiler.add_listener(self.idle)
+        self._last_full = time.perf_counter()
+
+    def stop(self):
+        if self._users == 0:
+            return
+        self._users -= 1
+        if self._users > 0:
+            return
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+        self.profiler.remove_listener(self.idle)
+        if self._saved_threshold is not None:
+            gc.set_threshold(*self._saved_threshold)
+            self._saved_threshold = None
+
+    @property
+    def running(self):
+        return self._users > 0
+
+    def freeze(self):
+        """Collect once, then move every surviving object to the permanent generation (first call only)."""
+        if not self.scheduling or self.frozen:
+            return
+        if memory_profiler.is_enabled():
+            # the memory profiler's Surface census walks gc.get_objects(), which skips frozen objects
+            return
+        self.frozen = True
+        self._loading = True
+        try:
+            gc.collect()
+        finally:
+            self._loading = False
+        gc.freeze()
+        self._last_full = time.perf_counter()
+
+    # ---- per-frame work ----
+
+    def idle(self, total_ms, stages=None):
+        """FrameProfiler listener: spend the frame's spare budget on a collection if one is due."""
+        spare = BUDGET_MS - total_ms
+        now = time.perf_counter()
+        count0, _, count2 = gc.get_count()
+        generation = None
+        if count2 and now - self._last_full >= GEN2_MAX_INTERVAL:
+            generation = 2
+        elif spare < MIN_SPARE_MS:
+            return
+        elif count2 and now - self._last_full >= GEN2_MIN_INTERVAL and self._cost_ms[2] <= spare:
+            generation = 2
+        elif count0 >= gc.get_threshold()[0] // YOUNG_TRIGGER_DIVISOR:
+            # young objects would trigger an automatic pass soon; take it now while there is time,
+            # gen1 when it fits (it also resets gen1's counter), otherwise at least gen0
+            if self._cost_ms[1] <= spare:
+                generation = 1
+            elif self._cost_ms[0] <= spare:
+                generation = 0
+        if generation is None:
+            return
+        self._idle = True
+        try:
+            gc.collect(generation)
+        finally:
+            self._idle = False
+        if generation == 2:
+            self._last_full = now
+
+    # ---- pause accounting ----
+
+    def _on_gc(self, phase, info):
+        if phase == "start":
+            self._pause_start = time.perf_counter()
+            return
+        if self._pause_start is None:
+            return
+        pause_ms = (time.perf_counter() - self._pause_start) * 1000
+        self._pause_start = None
+        generation = info.get("generation", 2)
+        self._cost_ms[generation] = self._cost_ms[generation] * 0.8 + pause_ms * 0.2
+        if self._loading:
+            return
+        bucket = 0
+        while bucket < len(PAUSE_BUCKETS_MS) and pause_ms > PAUSE_BUCKETS_MS[bucket]:
+            bucket += 1
+        self.histogram[bucket] += 1
+        self.by_generation[generation] += 1
+        self.pauses += 1
+        self.total_ms += pause_ms
+        self.max_ms = max(self.max_ms, pause_ms)
+        if self._idle:
+            self.idle_pauses += 1
+
+    def reset_stats(self):
+        self.histogram = [0] * (len(PAUSE_BUCKETS_MS) + 1)
+        self.by_generation = [0, 0, 0]
+        self.pauses = 0
+        self.idle_pauses = 0  # collections run by idle() rather than by the interpreter
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def stats(self):
+        labels = [f"<={bound}ms" for bound in PAUSE_BUCKETS_MS] + [f">{PAUSE_BUCKETS_MS[-1]}ms"]
+        return {
+            "pauses": self.pauses,
+            "idle_pauses": self.idle_pauses,
+            "total_ms": self.total_ms,
+            "max_ms": self.max_ms,
+            "by_generation": list(self.by_generation),
+            "histogram": dict(zip(labels, self.histogram)),
+            "frozen_objects": gc.get_freeze_count(),
+        }
+
+
+_scheduler = GCScheduler.get_instance()
+
+
+def start():
+    _scheduler.start()
+
+
+def stop():
+    _scheduler.stop()
+
+
+def freeze():
+    _scheduler.freeze()
+
+
+def stats():
+    return _scheduler.stats()
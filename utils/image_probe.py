@@ -0,0 +1,144 @@
+"""
+Image dimensions without decoding pixels.
+
+Width and height are read from the file header: the IHDR chunk of a PNG, or the first
+start-of-frame marker of a JPEG. Other formats fall back to a full pygame.image.load. Sizes
+are remembered in CACHE_PATH/image_sizes.json, keyed by path and checked against the file's
+mtime, so a later run only pays for one os.stat per image. New sizes are written out by
+save(), which runs when pygame quits; call it after a batch of lookups to persist them early.
+
+Usage:
+    from utils.image_probe import image_size
+    w, h = image_size("assets/images/maps/World1Map.png")   # (1024, 576)
+    save_image_sizes()                                      # optional, pygame.quit() does it too
+"""
+import json
+import os
+import struct
+from pathlib import Path
+import pygame
+from settings import CACHE_PATH
+
+IMAGE_SIZES_FILE = CACHE_PATH / "image_sizes.json"
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# JPEG start-of-frame markers (C4 = DHT, C8 = JPG extension, CC = DAC are not frames)
+JPEG_SOF_MARKERS = set(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _png_size(f):
+    header = f.read(24)
+    if len(header) < 24 or header[:8] != PNG_SIGNATURE or header[12:16] != b"IHDR":
+        return None
+    return struct.unpack(">II", header[16:24])
+
+
+def _jpeg_size(f):
+    if f.read(2) != b"\xff\xd8":
+        return None
+    while True:
+        byte = f.read(1)
+        while byte and byte != b"\xff":
+            byte = f.read(1)
+        while byte == b"\xff":  # fill bytes
+            byte = f.read(1)
+        if not byte:
+            return None
+        marker = byte[0]
+        if marker in (0x01, 0xD8) or 0xD0 <= marker <= 0xD7:
+            continue  # standalone markers carry no length
+        length_bytes = f.read(2)
+        if len(length_bytes) < 2:
+            return None
+        length = struct.unpack(">H", length_bytes)[0]
+        if marker in JPEG_SOF_MARKERS:
+            data = f.read(5)
+            if len(data) < 5:
+                return None
+            height, width = struct.unpack(">HH", data[1:5])
+            return width, height
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+def read_header_size(path):
+    """(width, height) from a PNG/JPEG header, or None if the format isn't recognised."""
+    with open(path, "rb") as f:
+        size = _png_size(f)
+        if size is None:
+            f.seek(0)
+            size = _jpeg_size(f)
+    return size
+
+
+class ImageProbe:
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """Singleton pattern so every caller shares the size manifest."""
+        if cls._instance is None:
+            cls._instance = ImageProbe()
+        return cls._instance
+
+    def __init__(self, sizes_file=IMAGE_SIZES_FILE):
+        self.sizes_file = sizes_file
+        # "resolved path" -> {"mtime": float, "size": [w, h]}
+        self._sizes = None
+        self._dirty = False  # sizes added since the last save
+
+    def size(self, path):
+        path = Path(path)
+        if not path.is_absolute():
+            # relative paths in this repo are written relative to the project root
+            path = PROJECT_ROOT / path
+        key = str(path.resolve())
+        mtime = os.stat(key).st_mtime
+        sizes = self._load_sizes()
+        entry = sizes.get(key)
+        if entry is not None and entry["mtime"] == mtime:
+            return tuple(entry["size"])
+        size = read_header_size(key)
+        if size is None:
+            # not PNG/JPEG: let pygame work it out
+            size = pygame.image.load(key).get_size()
+        sizes[key] = {"mtime": mtime, "size": list(size)}
+        if not self._dirty:
+            # pygame forgets quit functions once it has run them, so register per batch
+            pygame.register_quit(self.save)
+            self._dirty = True
+        return tuple(size)
+
+    def _load_sizes(self):
+        if self._sizes is None:
+            self._sizes = {}
+            try:
+                if self.sizes_file.exists():
+                    with open(self.sizes_file, "r", encoding="utf-8") as f:
+                        self._sizes = json.load(f)
+            except Exception:
+                # a broken cache just means we read the headers again
+                self._sizes = {}
+        return self._sizes
+
+    def save(self):
+        """Write the size manifest if anything was added since the last save."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        try:
+            os.makedirs(self.sizes_file.parent, exist_ok=True)
+            with open(self.sizes_file, "w", encoding="utf-8") as f:
+                json.dump(self._sizes, f, indent=2)
+        except Exception as e:
+            print(f"Error saving image size cache: {e}")
+
+
+def image_size(path):
+    """(width, height) of an image file, read from its header and cached by mtime."""
+    return ImageProbe.get_instance().size(path)
+
+
+def save_image_sizes():
+    """Persist the sizes looked up so far (a no-op when nothing new was read)."""
+    ImageProbe.get_instance().save()
@@ -0,0 +1,277 @@
+"""
+Memory instrumentation for scene transitions (tracemalloc + Surface byte accounting).
+
+tracemalloc only sees memory allocated by Python; Surface pixels are allocated by SDL and are
+invisible to it. Each snapshot therefore also takes a census of the live Surfaces (found
+through the objects that reference them) and sums their pixel bytes. Surfaces registered
+with track_surface() are reported under their label, everything else by size.
+
+Scenes are bracketed with scene_enter()/scene_exit() or the scene() context manager. On exit
+a report is printed:
+- Python memory and Surface bytes, and the change since the scene was entered
+- Surfaces created inside the scene that are still alive (the usual suspects for a leak)
+- the top allocation sites that grew during the scene
+The level at each exit is kept per scene name; when it grows on LEAK_VISITS consecutive
+visits by more than LEAK_THRESHOLD_BYTES in total (e.g. repeated planet -> map -> menu
+cycles), a "possible leak" warning is printed. The first LEAK_WARMUP_VISITS exits are left
+out, since they include caches filling up.
+
+Off by default and free when off. Enable with settings.MEMORY_PROFILING or the
+SPACECOWBOY_MEMPROFILE environment variable; benchmarks/memory_cycles.py drives repeated
+cycles headless.
+
+Usage:
+    from utils import memory_profiler
+    with memory_profiler.scene("adventure_map"):
+        AdventureMap(bg).run(...)
+    memory_profiler.track_surface(surface, "asset:World1Map.png")
+"""
+import gc
+import os
+import tracemalloc
+import weakref
+from collections import defaultdict
+from contextlib import contextmanager
+import pygame
+from settings import MEMORY_PROFILING
+
+TRACE_FRAMES = 8          # stack depth kept per allocation
+TOP_SITES = 10            # allocation sites listed per report
+TOP_SURFACES = 10         # surviving surface groups listed per report
+LEAK_VISITS = 3           # consecutive growing exits before a scene is flagged
+LEAK_WARMUP_VISITS = 1    # first exits fill caches (scaled backgrounds, text), so don't count them
+LEAK_THRESHOLD_BYTES = 256 * 1024
+
+_IGNORED_FILES = (
+    __file__,  # this module's own snapshots and reports
+    tracemalloc.__file__,
+    "<frozen importlib._bootstrap>",
+    "<frozen importlib._bootstrap_external>",
+    "<unknown>",
+)
+
+
+def surface_bytes(surface):
+    """Pixel bytes owned by a surface (subsurfaces share their parent's pixels)."""
+    if surface.get_parent() is not None:
+        return 0
+    return surface.get_pitch() * surface.get_height()
+
+
+def _fmt_bytes(n):
+    sign = "-" if n < 0 else ""
+    n = abs(n)
+    if n >= 1024 * 1024:
+        return f"{sign}{n / (1024 * 1024):.1f} MiB"
+    if n >= 1024:
+        return f"{sign}{n / 1024:.1f} KiB"
+    return f"{sign}{n} B"
+
+
+class MemorySnapshot:
+    """Python and Surface memory at one point in time."""
+
+    def __init__(self, label, trace, surfaces):
+        self.label = label
+        self.trace = trace                  # tracemalloc.Snapshot (filtered)
+        self.surfaces = surfaces            # id(surface) -> (surface label, bytes)
+        self.python_bytes = sum(stat.size for stat in trace.statistics("filename"))
+        self.surface_bytes = sum(size for _, size in surfaces.values())
+
+    @property
+    def total_bytes(self):
+        return self.python_bytes + self.surface_bytes
+
+
+class MemoryProfiler:
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """Singleton pattern so nested scenes share one stack and history."""
+        if cls._instance is None:
+            cls._instance = MemoryProfiler()
+        return cls._instance
+
+    def __init__(self, enabled=None):
+        if enabled is None:
+            enabled = MEMORY_PROFILING or bool(os.environ.get("SPACECOWBOY_MEMPROFILE"))
+        self.enabled = False
+        self._labels = {}        # id(surface) -> (weakref, label)
+        self._open = []          # (scene name, MemorySnapshot) for scenes entered, innermost last
+        self.exits = defaultdict(list)  # scene name -> total bytes at each exit
+        self.reports = []        # one dict per scene exit
+        if enabled:
+            self.start()
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACE_FRAMES)
+        self.enabled = True
+        # gc.get_objects() leaves out frozen objects, so thaw the heap utils.gc_scheduler froze
+        # for good: refreezing later would also freeze whatever garbage is alive at that moment.
+        # The scheduler only freezes once per process and never while profiling is on.
+        if gc.get_freeze_count():
+            gc.unfreeze()
+
+    def stop(self):
+        self.enabled = False
+        self._open = []
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    # ---- Surface accounting ----
+
+    def track_surface(self, surface, label):
+        """Name a surface in reports (weakly referenced; forgotten when it is freed)."""
+        if not self.enabled:
+            return
+        key = id(surface)
+        self._labels[key] = (weakref.ref(surface, lambda _, key=key: self._labels.pop(key, None)), label)
+
+    def live_surfaces(self):
+        """Every Surface reachable from a gc-tracked object, by id."""
+        found = {}
+        # start() thawed the heap and nothing freezes it while profiling, so this sees every object
+        for obj in gc.get_objects():
+            for ref in gc.get_referents(obj):
+                if isinstance(ref, pygame.Surface):
+                    found[id(ref)] = ref
+        display = pygame.display.get_surface()
+        if display is not None:
+            found[id(display)] = display
+        return found
+
+    def _label(self, surface):
+        entry = self._labels.get(id(surface))
+        if entry is not None and entry[0]() is surface:
+            return entry[1]
+        if surface is pygame.display.get_surface():
+            return "display"
+        w, h = surface.get_size()
+        return f"untracked {w}x{h}"
+
+    # ---- snapshots ----
+
+    def snapshot(self, label):
+        gc.collect()
+        trace = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, name) for name in _IGNORED_FILES])
+        surfaces = {key: (self._label(s), surface_bytes(s)) for key, s in self.live_surfaces().items()}
+        return MemorySnapshot(label, trace, surfaces)
+
+    def scene_enter(self, name):
+        if not self.enabled:
+            return
+        self._open.append((name, self.snapshot(f"{name}:enter")))
+
+    def scene_exit(self, name):
+        """Snapshot, print the report for `name` and check it for growth; returns the report."""
+        if not self.enabled:
+            return None
+        enter = None
+        for i in range(len(self._open) - 1, -1, -1):
+            if self._open[i][0] == name:
+                enter = self._open.pop(i)[1]
+                break
+        if enter is None:
+            return None
+        exit_ = self.snapshot(f"{name}:exit")
+        report = self._report(name, enter, exit_)
+        self.reports.append(report)
+        self._print(report)
+        return report
+
+    @contextmanager
+    def scene(self, name):
+        self.scene_enter(name)
+        try:
+            yield self
+        finally:
+            self.scene_exit(name)
+
+    # ---- reporting ----
+
+    def _report(self, name, enter, exit_):
+        surviving = defaultdict(lambda: [0, 0])  # label -> [count, bytes]
+        for key, (label, size) in exit_.surfaces.items():
+            if key not in enter.surfaces:
+                surviving[label][0] += 1
+                surviving[label][1] += size
+        sites = []
+        for stat in exit_.trace.compare_to(enter.trace, "lineno"):
+            if stat.size_diff <= 0:
+                continue
+            frame = stat.traceback[0]
+            sites.append((f"{frame.filename}:{frame.lineno}", stat.size_diff, stat.count_diff))
+            if len(sites) >= TOP_SITES:
+                break
+
+        history = self.exits[name]
+        history.append(exit_.total_bytes)
+        leak = None
+        recent = history[LEAK_WARMUP_VISITS:][-(LEAK_VISITS + 1):]
+        if len(recent) == LEAK_VISITS + 1 and all(b > a for a, b in zip(recent, recent[1:])):
+            growth = recent[-1] - recent[0]
+            if growth > LEAK_THRESHOLD_BYTES:
+                leak = growth
+
+        return {
+            "scene": name,
+            "visit": len(history),
+            "python_bytes": exit_.python_bytes,
+            "python_delta": exit_.python_bytes - enter.python_bytes,
+            "surface_bytes": exit_.surface_bytes,
+            "surface_delta": exit_.surface_bytes - enter.surface_bytes,
+            "surfaces": len(exit_.surfaces),
+            "surviving_surfaces": sorted(((label, count, size) for label, (count, size) in surviving.items()),
+                                         key=lambda item: -item[2]),
+            "top_sites": sites,
+            "leak_bytes": leak,
+        }
+
+    @staticmethod
+    def _print(report):
+        print(f"[memory] {report['scene']} exit #{report['visit']}: "
+              f"python {_fmt_bytes(report['python_bytes'])} ({_fmt_bytes(report['python_delta'])}), "
+              f"surfaces {report['surfaces']} / {_fmt_bytes(report['surface_bytes'])} "
+              f"({_fmt_bytes(report['surface_delta'])})")
+        for label, count, size in report["surviving_surfaces"][:TOP_SURFACES]:
+            print(f"[memory]   surviving {count:4d} x {label}: {_fmt_bytes(size)}")
+        for site, size, count in report["top_sites"]:
+            print(f"[memory]   +{_fmt_bytes(size):>10} {count:+6d} blocks  {site}")
+        if report["leak_bytes"] is not None:
+            print(f"[memory] possible leak: {report['scene']} grew {_fmt_bytes(report['leak_bytes'])} "
+                  f"over the last {LEAK_VISITS} visits")
+
+
+_profiler = MemoryProfiler.get_instance()
+
+
+@contextmanager
+def _noop_scene():
+    yield None
+
+
+def scene(name):
+    """Context manager bracketing a scene (no snapshots unless profiling is enabled)."""
+    if not _profiler.enabled:
+        return _noop_scene()
+    return _profiler.scene(name)
+
+
+def scene_enter(name):
+    _profiler.scene_enter(name)
+
+
+def scene_exit(name):
+    return _profiler.scene_exit(name)
+
+
+def track_surface(surface, label):
+    _profiler.track_surface(surface, label)
+    return surface
+
+
+def is_enabled():
+    return _profiler.enabled
@@ -0,0 +1,106 @@
+"""
+Decode large images in worker processes and hand the pixels back through shared memory.
+
+A PNG decode holds one core for tens of milliseconds. The AssetLoader's thread can only run
+one at a time, so the big backgrounds still decode one after another. This module runs
+pygame.image.load in a process pool instead. Each worker writes the raw RGB/RGBA bytes into a
+multiprocessing.shared_memory block and returns only its name, size and pixel format, so
+nothing large is pickled. The main thread wraps the block with pygame.image.frombuffer,
+converts it to the display format (which copies the pixels) and releases the block.
+
+Workers are started with "spawn": a forked child would share the game's SDL/display state
+and tear it down at exit. Spawning costs a fresh interpreter plus a pygame import per
+worker, so use this for batches of large images off the critical path (the world maps
+after the menu is up), not for the first screen.
+
+Usage:
+    from utils.parallel_decode import ParallelDecoder
+    decoder = ParallelDecoder()
+    future = decoder.submit("assets/images/maps/World1Map.png")
+    surface = decoder.to_surface(future.result(), alpha=False)   # main thread
+    decoder.shutdown()
+"""
+import atexit
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import pygame
+from settings import PARALLEL_DECODE_WORKERS
+
+
+def decode_to_shared(path):
+    """Worker: decode `path` into a new shared memory block; returns (name, size, format)."""
+    surface = pygame.image.load(str(path))
+    fmt = "RGBA" if surface.get_flags() & pygame.SRCALPHA or surface.get_alpha() is not None else "RGB"
+    data = pygame.image.tobytes(surface, fmt)
+    block = shared_memory.SharedMemory(create=True, size=len(data))
+    block.buf[:len(data)] = data
+    # the main process unlinks the block; spawned workers share its resource tracker, which
+    # removes any block left over if the game exits before picking it up
+    block.close()
+    return block.name, surface.get_size(), fmt
+
+
+class ParallelDecoder:
+    """Process pool for decode_to_shared, started on the first submit()."""
+
+    def __init__(self, workers=PARALLEL_DECODE_WORKERS):
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = None
+        self._unclaimed = set()  # futures whose shared block hasn't been freed by to_surface()
+        atexit.register(self.discard)
+
+    def submit(self, path):
+        if self._pool is None:
+            # workers inherit the environment; one pygame banner per game is enough
+            os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+            self._pool = ProcessPoolExecutor(max_workers=self.workers,
+                                             mp_context=multiprocessing.get_context("spawn"))
+        future = self._pool.submit(decode_to_shared, str(path))
+        self._unclaimed.add(future)
+        return future
+
+    def to_surface(self, result, alpha=False):
+        """Main thread: rebuild a Surface from a worker result and free the shared block.
+
+        The returned surface owns its pixels: it is converted to the display format when a
+        display exists, otherwise copied.
+        """
+        name, size, fmt = result
+        self._unclaimed = {f for f in self._unclaimed if not (f.done() and f.exception() is None
+                                                              and f.result()[0] == name)}
+        block = shared_memory.SharedMemory(name=name)
+        try:
+            view = pygame.image.frombuffer(block.buf[:size[0] * size[1] * len(fmt)], size, fmt)
+            if pygame.display.get_surface() is None:
+                surface = view.copy()
+            else:
+                surface = view.convert_alpha() if alpha else view.convert()
+            del view
+        finally:
+            block.close()
+            block.unlink()
+        return surface
+
+    def shutdown(self):
+        """Stop the workers (they hold a pygame import each); the next submit starts new ones."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    def discard(self):
+        """Free the blocks of decodes nobody picked up (e.g. the game quit mid-load)."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+        for future in self._unclaimed:
+            if future.cancelled() or future.exception() is not None:
+                continue
+            try:
+                block = shared_memory.SharedMemory(name=future.result()[0])
+                block.close()
+                block.unlink()
+            except FileNotFoundError:
+                pass
+        self._unclaimed.clear()
@@ -0,0 +1,143 @@
+"""
+In-game performance overlay.
+
+Shows instantaneous and smoothed FPS, a rolling frame-time graph, mean per-stage timings
+(from FrameProfiler), garbage collection pauses (from utils.gc_scheduler) and entity counts
+reported by the active scene. The overlay is drawn
+into a cached surface that is rebuilt only a few times a second. Every other frame it costs
+a single blit, so it barely changes the numbers it shows.
+
+On by default when settings.DEBUG_MODE or settings.SHOW_FPS is set; F3 toggles it.
+
+Usage:
+    from utils.perf_hud import PerfHUD
+    hud = PerfHUD.get_instance()
+    for event in pygame.event.get():
+        hud.handle_event(event)
+    hud.set_counts(bullets=len(bullets), encounters=len(encounters))
+    hud.draw(screen, "adventure_map")      # returns the rect it covered, or None when hidden
+"""
+import time
+import pygame
+from settings import DEBUG_MODE, SHOW_FPS
+from utils.frame_profiler import FrameProfiler
+from utils.font_cache import get_font
+from utils.gc_scheduler import GCScheduler
+
+TOGGLE_KEY = pygame.K_F3
+REFRESH_INTERVAL = 0.25   # seconds between overlay rebuilds
+GRAPH_FRAMES = 120        # frames shown in the frame-time graph
+GRAPH_MAX_MS = 33.3       # top of the graph (two 60 FPS frame budgets)
+BUDGET_MS = 1000 / 60
+STAGES = ("events", "update", "render", "flip")
+
+_WIDTH = 240
+_PAD = 6
+_LINE = 16
+_GRAPH_H = 48
+_LINES = 5  # text rows reserved above the graph
+_BG = (12, 12, 16)
+_TEXT = (220, 230, 220)
+_DIM = (140, 150, 140)
+_OK = (90, 200, 90)
+_SLOW = (230, 90, 70)
+
+
+class PerfHUD:
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """Singleton pattern so the F3 toggle carries across screens."""
+        if cls._instance is None:
+            cls._instance = PerfHUD()
+        return cls._instance
+
+    def __init__(self, profiler=None, enabled=None):
+        self.profiler = profiler or FrameProfiler.get_instance()
+        self.enabled = (DEBUG_MODE or SHOW_FPS) if enabled is None else enabled
+        self.counts = {}
+        self.fps = 0.0
+        self.smoothed_fps = 0.0
+        self._last_draw = None
+        self._surface = None
+        self._built_at = 0.0
+        self._scene = None
+
+    def handle_event(self, event):
+        """Toggle on the hotkey; returns True if the event was consumed."""
+        if event.type == pygame.KEYDOWN and event.key == TOGGLE_KEY:
+            self.toggle()
+            return True
+        return False
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self._surface = None
+        self._last_draw = None
+
+    def set_counts(self, **counts):
+        """Entity counts for the active scene (replaces the previous scene's counts)."""
+        self.counts = counts
+
+    def draw(self, screen, scene=None):
+        """Blit the overlay in the top-left corner; returns its rect, or None when hidden."""
+        if not self.enabled:
+            return None
+        now = time.perf_counter()
+        if self._last_draw is not None:
+            # wall time between draws, i.e. including the frame-rate cap
+            interval = now - self._last_draw
+            if interval > 0:
+                self.fps = 1.0 / interval
+                self.smoothed_fps = self.fps if not self.smoothed_fps else self.smoothed_fps * 0.9 + self.fps * 0.1
+        self._last_draw = now
+
+        if self._surface is None or scene != self._scene or now - self._built_at >= REFRESH_INTERVAL:
+            self._scene = scene
+            self._surface = self._build()
+            self._built_at = now
+        return screen.blit(self._surface, (0, 0))
+
+    def _build(self):
+        frames = list(self.profiler.frames)[-GRAPH_FRAMES:]
+        font = get_font(None, 18)
+        lines = [
+            (f"{self._scene or 'scene'}  FPS {self.fps:5.1f}  avg {self.smoothed_fps:5.1f}", _TEXT),
+        ]
+        if frames:
+            totals = [total for total, _ in frames]
+            lines.append((f"work {totals[-1]:5.2f} ms  max {max(totals):5.2f} ms", _TEXT))
+            stage_parts = []
+            for stage in STAGES:
+                mean = sum(stages.get(stage, 0.0) for _, stages in frames) / len(frames)
+                stage_parts.append(f"{stage[0]} {mean:.2f}")
+            lines.append(("  ".join(stage_parts) + " ms", _DIM))
+        gc_stats = GCScheduler.get_instance()
+        if gc_stats.pauses:
+            lines.append((f"gc {gc_stats.pauses} ({gc_stats.idle_pauses} idle)  max {gc_stats.max_ms:.2f} ms", _DIM))
+        if self.counts:
+            lines.append(("  ".join(f"{name} {value}" for name, value in self.counts.items()), _DIM))
+
+        # fixed size, so in dirty-rect mode a rebuilt overlay always covers the previous one
+        height = _PAD * 2 + _LINE * _LINES + _GRAPH_H + _PAD
+        surface = pygame.Surface((_WIDTH, height))
+        surface.fill(_BG)
+        y = _PAD
+        for text, color in lines:
+            surface.blit(font.render(text, True, color), (_PAD, y))
+            y += _LINE
+        y = _PAD + _LINE * _LINES
+
+        # frame-time graph: one bar per frame of work time, green within the 60 FPS budget
+        graph = pygame.Rect(_PAD, y + _PAD // 2, _WIDTH - _PAD * 2, _GRAPH_H)
+        pygame.draw.rect(surface, (30, 30, 38), graph)
+        budget_y = graph.bottom - int(graph.h * BUDGET_MS / GRAPH_MAX_MS)
+        pygame.draw.line(surface, _DIM, (graph.left, budget_y), (graph.right - 1, budget_y))
+        bar_w = graph.w / GRAPH_FRAMES
+        for i, (total, _) in enumerate(frames):
+            h = min(graph.h, max(1, int(graph.h * total / GRAPH_MAX_MS)))
+            x = graph.left + int(i * bar_w)
+            color = _OK if total <= BUDGET_MS else _SLOW
+            pygame.draw.line(surface, color, (x, graph.bottom - 1), (x, graph.bottom - h))
+        return surface.convert() if pygame.display.get_surface() is not None else surface
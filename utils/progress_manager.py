@@ -7,6 +7,7 @@ Keeps track of:
 """
 import json
 import os
+from utils.tracing import traced
 
 
 class WorldProgress:
@@ -94,6 +95,7 @@ class ProgressManager:
                 world.stats[stat_type] += value
                 self.save_progress()
 
+    @traced("ProgressManager.save_progress")
     def save_progress(self):
         """Save all world progress to file."""
         try:
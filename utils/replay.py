@@ -0,0 +1,299 @@
+"""
+Deterministic input recording and replay for the minigames.
+
+A minigame loop reads time, events, key state and randomness through a session instead of
+pygame directly. Three kinds of session are available:
+- LiveSession: plain passthrough to pygame (the default, no overhead to speak of)
+- RecordSession: seeds `random`, then logs every frame's elapsed ms, key mask and the events
+  the simulation reacts to (clicks, resizes, quit), plus a CRC32 of the game state after
+  every simulation tick, to a gzip-compressed binary log
+- ReplaySession: reseeds `random` with the recorded seed and feeds the logged input back
+  through the same update code. Real input is ignored (except closing the window), and
+  ReplayDesyncError is raised as soon as a tick's state checksum differs from the recording.
+
+The session is chosen from the environment, so a minigame started from the adventure map can
+be recorded too:
+    SPACECOWBOY_RECORD=run.rec python SebastiansAwesomeCode/SebsMinigame.py
+    SPACECOWBOY_REPLAY=run.rec python SebastiansAwesomeCode/SebsMinigame.py
+    SPACECOWBOY_REPLAY=run.rec SPACECOWBOY_REPLAY_PACED=0 python ...   # as fast as possible
+
+Usage inside a loop:
+    session = open_session(screen.get_size())
+    while running:
+        frame_dt = session.tick(clock, 60)
+        for event in session.poll_events(): ...
+        for dt in timestep.steps(frame_dt):
+            keys = session.get_pressed()
+            ...
+            if session.wants_state:  # skip building the state when nothing checks it
+                session.end_tick(x, y, *bullets.positions())
+    session.close()
+"""
+import gzip
+import os
+import random
+import struct
+import sys
+import time
+import zlib
+import pygame
+
+RECORD_ENV = "SPACECOWBOY_RECORD"
+REPLAY_ENV = "SPACECOWBOY_REPLAY"
+REPLAY_PACED_ENV = "SPACECOWBOY_REPLAY_PACED"
+
+MAGIC = b"SCRP"
+VERSION = 1
+
+# keys whose held state is recorded; the order defines the bits of the per-frame key mask,
+# so changing it requires bumping VERSION
+TRACKED_KEYS = (pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d, pygame.K_q, pygame.K_SPACE)
+
+_HEADER = struct.Struct("<4sBQHH")   # magic, version, seed, width, height
+_FRAME = struct.Struct("<HHBB")      # frame ms, key mask, event count, tick count
+_EVENT_TYPE = struct.Struct("<B")
+_CLICK = struct.Struct("<Bhh")       # button, x, y
+_RESIZE = struct.Struct("<HH")       # w, h
+_CHECKSUM = struct.Struct("<I")
+
+EV_QUIT = 0
+EV_CLICK = 1
+EV_RESIZE = 2
+
+
+class ReplayDesyncError(Exception):
+    """A replayed tick produced a different state than the recording."""
+
+
+def state_checksum(*parts):
+    """CRC32 over the given state values (numbers, bools, sequences, numpy arrays)."""
+    crc = 0
+    for part in parts:
+        if hasattr(part, "tobytes"):
+            data = part.tobytes()
+        else:
+            # repr round-trips floats exactly, so equal state always hashes equal
+            data = repr(part).encode()
+        crc = zlib.crc32(data, crc)
+    return crc
+
+
+class _KeyState:
+    """Stand-in for pygame.key.get_pressed() built from a recorded key mask."""
+
+    def __init__(self, mask):
+        self._held = {key for bit, key in enumerate(TRACKED_KEYS) if mask & (1 << bit)}
+
+    def __getitem__(self, key):
+        return key in self._held
+
+
+def _key_mask(pressed):
+    mask = 0
+    for bit, key in enumerate(TRACKED_KEYS):
+        if pressed[key]:
+            mask |= 1 << bit
+    return mask
+
+
+class LiveSession:
+    mode = "live"
+    wants_state = False  # end_tick() ignores its arguments, so loops can skip building them
+
+    def __init__(self):
+        self.ticks = 0
+
+    def tick(self, clock, fps):
+        """Wait for the next frame; return the elapsed seconds the simulation should use."""
+        return clock.tick(fps) / 1000
+
+    def poll_events(self):
+        return pygame.event.get()
+
+    def get_pressed(self):
+        return pygame.key.get_pressed()
+
+    def end_tick(self, *state):
+        """Call once after every simulation tick with the values that define game state.
+
+        Sessions with wants_state False ignore the state, so loops skip the call for them.
+        """
+        self.ticks += 1
+
+    def close(self):
+        pass
+
+
+class RecordSession(LiveSession):
+    mode = "record"
+    wants_state = True
+
+    def __init__(self, path, screen_size, seed=None):
+        super().__init__()
+        self.path = path
+        self.seed = seed if seed is not None else time.time_ns() & 0xFFFFFFFFFFFFFFFF
+        random.seed(self.seed)
+        self._file = gzip.open(path, "wb")
+        width, height = screen_size
+        self._file.write(_HEADER.pack(MAGIC, VERSION, self.seed, width, height))
+        self._frame_ms = None
+        self._keys = None
+        self._events = []
+        self._checksums = []
+
+    def tick(self, clock, fps):
+        self._flush_frame()
+        ms = min(clock.tick(fps), 0xFFFF)
+        self._frame_ms = ms
+        return ms / 1000
+
+    def poll_events(self):
+        events = pygame.event.get()
+        for event in events:
+            if event.type == pygame.QUIT:
+                self._events.append(_EVENT_TYPE.pack(EV_QUIT))
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                x, y = event.pos
+                self._events.append(_EVENT_TYPE.pack(EV_CLICK) + _CLICK.pack(event.button, x, y))
+            elif event.type == pygame.VIDEORESIZE:
+                self._events.append(_EVENT_TYPE.pack(EV_RESIZE) + _RESIZE.pack(event.w, event.h))
+        return events
+
+    def get_pressed(self):
+        # sample once per frame: key state only changes when events are pumped
+        if self._keys is None:
+            self._keys = pygame.key.get_pressed()
+        return self._keys
+
+    def end_tick(self, *state):
+        super().end_tick()
+        self._checksums.append(state_checksum(*state))
+
+    def _flush_frame(self):
+        if self._frame_ms is None:
+            return
+        mask = _key_mask(self._keys) if self._keys is not None else 0
+        self._file.write(_FRAME.pack(self._frame_ms, mask, len(self._events), len(self._checksums)))
+        self._file.write(b"".join(self._events))
+        for crc in self._checksums:
+            self._file.write(_CHECKSUM.pack(crc))
+        self._frame_ms = None
+        self._keys = None
+        self._events = []
+        self._checksums = []
+
+    def close(self):
+        if self._file is None:
+            return
+        self._flush_frame()
+        self._file.close()
+        self._file = None
+        print(f"Recorded {self.ticks} ticks to {self.path}")
+
+
+class ReplaySession(LiveSession):
+    mode = "replay"
+    wants_state = True
+
+    def __init__(self, path, screen_size=None, paced=True):
+        super().__init__()
+        self.path = path
+        self.paced = paced
+        with gzip.open(path, "rb") as f:
+            self._data = f.read()
+        magic, version, self.seed, width, height = _HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} replay log")
+        self.screen_size = (width, height)
+        if screen_size is not None and tuple(screen_size) != self.screen_size:
+            print(f"Replay recorded at {self.screen_size}, running at {tuple(screen_size)}; "
+                  "expect a desync", file=sys.stderr)
+        random.seed(self.seed)
+        self._offset = _HEADER.size
+        self.frames = 0
+        self.finished = False
+        self._keys = _KeyState(0)
+        self._events = []
+        self._checksums = []
+        self._tick_in_frame = 0
+
+    def tick(self, clock, fps):
+        if self.paced:
+            clock.tick(fps)
+        else:
+            clock.tick()
+        self._check_frame_ticks()
+        if self._offset >= len(self._data):
+            # log exhausted: end the run the way the player would
+            self.finished = True
+            self._events = [pygame.event.Event(pygame.QUIT)]
+            self._checksums = []
+            return 0.0
+
+        ms, mask, n_events, n_ticks = _FRAME.unpack_from(self._data, self._offset)
+        self._offset += _FRAME.size
+        self._keys = _KeyState(mask)
+        self._events = [self._read_event() for _ in range(n_events)]
+        self._checksums = struct.unpack_from(f"<{n_ticks}I", self._data, self._offset)
+        self._offset += n_ticks * _CHECKSUM.size
+        self._tick_in_frame = 0
+        self.frames += 1
+        return ms / 1000
+
+    def _read_event(self):
+        (kind,) = _EVENT_TYPE.unpack_from(self._data, self._offset)
+        self._offset += _EVENT_TYPE.size
+        if kind == EV_CLICK:
+            button, x, y = _CLICK.unpack_from(self._data, self._offset)
+            self._offset += _CLICK.size
+            return pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=button, pos=(x, y))
+        if kind == EV_RESIZE:
+            w, h = _RESIZE.unpack_from(self._data, self._offset)
+            self._offset += _RESIZE.size
+            return pygame.event.Event(pygame.VIDEORESIZE, w=w, h=h, size=(w, h))
+        return pygame.event.Event(pygame.QUIT)
+
+    def poll_events(self):
+        # live input is ignored, but closing the window still ends the replay
+        live_quit = [e for e in pygame.event.get() if e.type == pygame.QUIT]
+        return self._events + live_quit
+
+    def get_pressed(self):
+        return self._keys
+
+    def end_tick(self, *state):
+        if self._tick_in_frame >= len(self._checksums):
+            raise ReplayDesyncError(f"tick {self.ticks}: more ticks in frame {self.frames} "
+                                    f"than recorded ({len(self._checksums)})")
+        expected = self._checksums[self._tick_in_frame]
+        actual = state_checksum(*state)
+        if actual != expected:
+            raise ReplayDesyncError(f"tick {self.ticks} (frame {self.frames}): state checksum "
+                                    f"{actual:08x} != recorded {expected:08x}")
+        self._tick_in_frame += 1
+        super().end_tick()
+
+    def _check_frame_ticks(self):
+        if self.frames and self._tick_in_frame != len(self._checksums):
+            raise ReplayDesyncError(f"frame {self.frames}: ran {self._tick_in_frame} ticks, "
+                                    f"recorded {len(self._checksums)}")
+
+    def close(self):
+        if self._offset < len(self._data):
+            print(f"Replay stopped early at frame {self.frames}", file=sys.stderr)
+            return
+        self._check_frame_ticks()
+        self.finished = True
+        print(f"Replay of {self.path} matched for {self.ticks} ticks")
+
+
+def open_session(screen_size):
+    """Pick a live, record or replay session from the SPACECOWBOY_* environment variables."""
+    replay_path = os.environ.get(REPLAY_ENV)
+    if replay_path:
+        paced = os.environ.get(REPLAY_PACED_ENV, "1") != "0"
+        return ReplaySession(replay_path, screen_size, paced=paced)
+    record_path = os.environ.get(RECORD_ENV)
+    if record_path:
+        return RecordSession(record_path, screen_size)
+    return LiveSession()
@@ -0,0 +1,123 @@
+"""
+Uniform-grid spatial hash for point entities (bullets, enemies, encounters).
+
+The grid is rebuilt from position arrays each tick with vectorized NumPy (sort by cell key),
+so building it costs one pass over the entities and each query only looks at the cells it
+covers. Per-frame query cost then follows local density instead of total entity count.
+
+Usage:
+    from utils.spatial_hash import SpatialHash
+    grid = SpatialHash(cell_size=64)
+    idx = bullets.indices(OWNER_PLAYER)
+    grid.rebuild(bullets.x[idx], bullets.y[idx], idx)
+    near = grid.query_radius(enemy_x, enemy_y, 300)        # ids strictly within 300 px
+    on_path = grid.query_segment(x0, y0, x1, y1, 20)       # ids within 20 px of the segment
+"""
+import math
+import numpy as np
+
+DEFAULT_CELL_SIZE = 64
+
+_EMPTY = np.zeros(0, dtype=np.int64)
+
+
+class SpatialHash:
+    def __init__(self, cell_size=DEFAULT_CELL_SIZE):
+        self.cell_size = float(cell_size)
+        self._cells = {}
+        self._xs = np.zeros(0)
+        self._ys = np.zeros(0)
+        self._ids = _EMPTY
+
+    def __len__(self):
+        return len(self._ids)
+
+    @staticmethod
+    def _key(cx, cy):
+        # pack signed cell coords into one int64 (cy kept as its low 32 bits)
+        return (cx << 32) + (cy & 0xFFFFFFFF)
+
+    def rebuild(self, xs, ys, ids=None):
+        """Replace the grid contents. ids default to 0..n-1 (positions in xs/ys)."""
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        if ids is None:
+            ids = np.arange(len(xs), dtype=np.int64)
+        else:
+            ids = np.asarray(ids, dtype=np.int64)
+        if len(xs) == 0:
+            self._cells = {}
+            self._xs, self._ys, self._ids = xs, ys, ids
+            return
+
+        cx = np.floor(xs / self.cell_size).astype(np.int64)
+        cy = np.floor(ys / self.cell_size).astype(np.int64)
+        keys = self._key(cx, cy)
+        order = np.argsort(keys, kind="stable")
+        keys = keys[order]
+        self._xs = xs[order]
+        self._ys = ys[order]
+        self._ids = ids[order]
+
+        uniq, starts = np.unique(keys, return_index=True)
+        ends = np.append(starts[1:], len(keys))
+        self._cells = dict(zip(uniq.tolist(), zip(starts.tolist(), ends.tolist())))
+
+    def _gather(self, cells):
+        """Sorted-array positions of every entity in the given cell keys."""
+        slices = [self._cells[k] for k in cells if k in self._cells]
+        if not slices:
+            return _EMPTY
+        if len(slices) == 1:
+            return np.arange(slices[0][0], slices[0][1])
+        return np.concatenate([np.arange(a, b) for a, b in slices])
+
+    def _cell_range(self, lo, hi):
+        return range(math.floor(lo / self.cell_size), math.floor(hi / self.cell_size) + 1)
+
+    def query_radius(self, x, y, radius):
+        """Ids of entities strictly closer than radius to (x, y)."""
+        if not self._cells:
+            return _EMPTY
+        cells = [self._key(cx, cy)
+                 for cx in self._cell_range(x - radius, x + radius)
+                 for cy in self._cell_range(y - radius, y + radius)]
+        pos = self._gather(cells)
+        if len(pos) == 0:
+            return _EMPTY
+        dx = self._xs[pos] - x
+        dy = self._ys[pos] - y
+        return self._ids[pos[dx * dx + dy * dy < radius * radius]]
+
+    def query_segment(self, x0, y0, x1, y1, radius):
+        """Ids of entities strictly closer than radius to the segment (x0, y0)-(x1, y1)."""
+        if not self._cells:
+            return _EMPTY
+        length = math.hypot(x1 - x0, y1 - y0)
+        # sample the segment every cell and collect the cells within radius of each sample
+        samples = max(1, int(math.ceil(length / self.cell_size)))
+        cells = set()
+        for i in range(samples + 1):
+            t = i / samples
+            px = x0 + (x1 - x0) * t
+            py = y0 + (y1 - y0) * t
+            for cx in self._cell_range(px - radius - self.cell_size, px + radius + self.cell_size):
+                for cy in self._cell_range(py - radius - self.cell_size, py + radius + self.cell_size):
+                    cells.add(self._key(cx, cy))
+        pos = self._gather(cells)
+        if len(pos) == 0:
+            return _EMPTY
+
+        # exact point-to-segment distance
+        px = self._xs[pos]
+        py = self._ys[pos]
+        sx = x1 - x0
+        sy = y1 - y0
+        seg_len2 = sx * sx + sy * sy
+        if seg_len2 == 0:
+            t = np.zeros(len(pos))
+        else:
+            t = np.clip(((px - x0) * sx + (py - y0) * sy) / seg_len2, 0.0, 1.0)
+        dx = px - (x0 + t * sx)
+        dy = py - (y0 + t * sy)
+        return self._ids[pos[dx * dx + dy * dy < radius * radius]]
@@ -0,0 +1,77 @@
+"""
+Shared cache for scaled copies of surfaces (mostly full-screen backgrounds).
+
+Scaling a large map image to the window size is expensive, so screens ask this cache
+for the scaled copy instead of calling pygame.transform every frame. Entries are keyed by
+(source surface, target size, filter); when the window size changes the old copy for that
+source/filter is dropped and a new one is built once.
+
+Functions:
+- get_scaled(source, size, smooth=True): return a cached scaled copy of source
+- clear(): drop every cached surface
+"""
+from typing import Tuple
+import weakref
+import pygame
+from utils.memory_profiler import track_surface
+
+SMOOTH = "smooth"
+FAST = "fast"
+
+
+class ScaledSurfaceCache:
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """Singleton pattern so every screen shares the same cache."""
+        if cls._instance is None:
+            cls._instance = ScaledSurfaceCache()
+        return cls._instance
+
+    def __init__(self):
+        # source surface -> {filter: (size, scaled_surface)}
+        # weak keys so a discarded map image does not keep its scaled copy alive
+        self._entries = weakref.WeakKeyDictionary()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, source: pygame.Surface, size: Tuple[int, int], filter_mode: str = SMOOTH) -> pygame.Surface:
+        """Return source scaled to size, building it only if the size changed."""
+        size = (max(1, int(size[0])), max(1, int(size[1])))
+        if source.get_size() == size:
+            return source
+        by_filter = self._entries.get(source)
+        if by_filter is None:
+            by_filter = {}
+            self._entries[source] = by_filter
+        cached = by_filter.get(filter_mode)
+        if cached is not None and cached[0] == size:
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        if filter_mode == SMOOTH:
+            try:
+                scaled = pygame.transform.smoothscale(source, size)
+            except ValueError:
+                # smoothscale only accepts 24/32 bit surfaces
+                scaled = pygame.transform.scale(source, size)
+        else:
+            scaled = pygame.transform.scale(source, size)
+        track_surface(scaled, f"scaled {size[0]}x{size[1]}")
+        # replaces the entry for the previous window size
+        by_filter[filter_mode] = (size, scaled)
+        return scaled
+
+    def clear(self):
+        self._entries = weakref.WeakKeyDictionary()
+
+
+def get_scaled(source: pygame.Surface, size: Tuple[int, int], smooth: bool = True) -> pygame.Surface:
+    """Return a cached copy of source scaled to size (see ScaledSurfaceCache.get)."""
+    return ScaledSurfaceCache.get_instance().get(source, size, SMOOTH if smooth else FAST)
+
+
+def clear():
+    ScaledSurfaceCache.get_instance().clear()
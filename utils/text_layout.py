@@ -0,0 +1,100 @@
+"""
+Shared word-wrap/layout engine for dialog boxes and text panels.
+
+Line widths are computed from cached per-word advances (font.size is called once per
+distinct word), and finished layouts are memoized by (text, font, max_width), so a textbox
+that keeps showing the same text does no measuring work after the first frame.
+
+Functions:
+- wrap_text(text, font, max_width): tuple of lines; '\n' forces a line break
+- measure(font, text): cached width of a single word/string
+- clear(): drop all cached measurements and layouts
+"""
+from collections import OrderedDict
+import weakref
+
+LAYOUT_CACHE_SIZE = 256
+
+
+class TextLayout:
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """Singleton pattern so all screens share measurements."""
+        if cls._instance is None:
+            cls._instance = TextLayout()
+        return cls._instance
+
+    def __init__(self, cache_size=LAYOUT_CACHE_SIZE):
+        # font -> {word: width}; weak so fonts rebuilt on resize drop their entries
+        self._advances = weakref.WeakKeyDictionary()
+        self._layouts = OrderedDict()
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+
+    def measure(self, font, word):
+        widths = self._advances.get(font)
+        if widths is None:
+            widths = {}
+            self._advances[font] = widths
+        w = widths.get(word)
+        if w is None:
+            w = font.size(word)[0]
+            widths[word] = w
+        return w
+
+    def wrap(self, text, font, max_width):
+        key = (text, id(font), max_width)
+        cached = self._layouts.get(key)
+        # id() can be reused once a font is freed, so confirm it is the same font
+        if cached is not None and cached[0]() is font:
+            self._layouts.move_to_end(key)
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        lines = self._layout(text, font, max_width)
+        self._layouts[key] = (weakref.ref(font), lines)
+        if len(self._layouts) > self.cache_size:
+            self._layouts.popitem(last=False)
+        return lines
+
+    def _layout(self, text, font, max_width):
+        space = self.measure(font, " ")
+        lines = []
+        for paragraph in text.split("\n"):
+            cur_words = []
+            cur_width = 0
+            for word in paragraph.split(" "):
+                if not word:
+                    continue
+                w = self.measure(font, word)
+                test_width = cur_width + space + w if cur_words else w
+                if test_width <= max_width or not cur_words:
+                    cur_words.append(word)
+                    cur_width = test_width
+                else:
+                    lines.append(" ".join(cur_words))
+                    cur_words = [word]
+                    cur_width = w
+            lines.append(" ".join(cur_words))
+        return tuple(lines)
+
+    def clear(self):
+        self._advances = weakref.WeakKeyDictionary()
+        self._layouts.clear()
+
+
+def wrap_text(text, font, max_width):
+    """Wrap text into lines no wider than max_width (memoized, see TextLayout.wrap)."""
+    return TextLayout.get_instance().wrap(text, font, max_width)
+
+
+def measure(font, text):
+    return TextLayout.get_instance().measure(font, text)
+
+
+def clear():
+    TextLayout.get_instance().clear()
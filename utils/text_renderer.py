@@ -0,0 +1,159 @@
+"""
+Cached text rendering built on per-font glyph atlases.
+
+font.render rasterizes the whole string every call, which adds up when menus and dialog
+boxes redraw the same text each frame. Here each glyph is rasterized once per
+(font, color, antialias) into an atlas surface, strings are composed from the atlas with a
+single Surface.blits call, and finished strings are kept in an LRU cache keyed by content
+so unchanged text costs a dictionary lookup.
+
+Functions:
+- render_text(font, text, color, antialias=True): drop-in replacement for font.render(text, antialias, color)
+- clear(): drop all atlases and cached strings (e.g. after fonts are rebuilt)
+
+Returned surfaces are shared; treat them as read-only.
+Note: glyphs are placed by their advance width, so kerning pairs are not applied.
+"""
+from collections import OrderedDict
+import weakref
+import pygame
+from utils.memory_profiler import track_surface
+
+ATLAS_WIDTH = 512
+STRING_CACHE_SIZE = 512
+
+
+class GlyphAtlas:
+    """
+    All glyphs rasterized so far for one (font, color, antialias) combination.
+    The font is passed to each call rather than stored: the atlas is the value under that font
+    in TextRenderer's weak-keyed dict, and a reference from it would keep the font alive.
+    """
+
+    def __init__(self, font, color, antialias=True):
+        self.color = color
+        self.antialias = antialias
+        self.height = font.get_height()
+        self.surface = track_surface(pygame.Surface((ATLAS_WIDTH, self.height * 4), pygame.SRCALPHA), "glyph atlas")
+        # char -> (area rect in atlas, advance)
+        self.glyphs = {}
+        # shelf packing cursor
+        self._x = 0
+        self._y = 0
+        self._row_h = 0
+
+    def glyph(self, font, ch):
+        entry = self.glyphs.get(ch)
+        if entry is None:
+            entry = self._add(font, ch)
+        return entry
+
+    def _add(self, font, ch):
+        img = font.render(ch, self.antialias, self.color)
+        if not img.get_flags() & pygame.SRCALPHA:
+            # non-antialiased glyphs come back palettized with a colorkey
+            rgba = pygame.Surface(img.get_size(), pygame.SRCALPHA)
+            rgba.blit(img, (0, 0))
+            img = rgba
+        w, h = img.get_size()
+        metrics = font.metrics(ch)
+        advance = metrics[0][4] if metrics and metrics[0] else w
+
+        if self._x + w > self.surface.get_width():
+            # next shelf
+            self._x = 0
+            self._y += self._row_h
+            self._row_h = 0
+        if self._y + h > self.surface.get_height():
+            self._grow(max(self.surface.get_height() * 2, self._y + h))
+
+        area = pygame.Rect(self._x, self._y, w, h)
+        self.surface.blit(img, area.topleft, special_flags=pygame.BLEND_RGBA_MAX)
+        self._x += w
+        self._row_h = max(self._row_h, h)
+        self.glyphs[ch] = (area, advance)
+        return self.glyphs[ch]
+
+    def _grow(self, new_height):
+        bigger = pygame.Surface((self.surface.get_width(), new_height), pygame.SRCALPHA)
+        bigger.blit(self.surface, (0, 0), special_flags=pygame.BLEND_RGBA_MAX)
+        self.surface = track_surface(bigger, "glyph atlas")
+
+    def compose(self, font, text):
+        """Build a surface for text by blitting glyphs out of the atlas."""
+        glyphs = [self.glyph(font, ch) for ch in text]
+        x = 0
+        width = 0
+        height = self.height
+        placements = []
+        for area, advance in glyphs:
+            placements.append((self.surface, (x, 0), area, pygame.BLEND_RGBA_MAX))
+            width = max(width, x + area.width)
+            # glyphs with deep descenders can be taller than the font height
+            height = max(height, area.height)
+            x += advance
+        out = pygame.Surface((width, height), pygame.SRCALPHA)
+        if placements:
+            out.blits(placements, doreturn=False)
+        return out
+
+
+class TextRenderer:
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """Singleton pattern so every screen shares atlases and cached strings."""
+        if cls._instance is None:
+            cls._instance = TextRenderer()
+        return cls._instance
+
+    def __init__(self, cache_size=STRING_CACHE_SIZE):
+        # font -> {(color, antialias): GlyphAtlas}; weak so rebuilt fonts drop their atlases
+        self._atlases = weakref.WeakKeyDictionary()
+        self._strings = OrderedDict()
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+
+    def atlas(self, font, color, antialias=True):
+        by_style = self._atlases.get(font)
+        if by_style is None:
+            by_style = {}
+            self._atlases[font] = by_style
+        atlas = by_style.get((color, antialias))
+        if atlas is None:
+            atlas = GlyphAtlas(font, color, antialias)
+            by_style[(color, antialias)] = atlas
+        return atlas
+
+    def render(self, font, text, color, antialias=True):
+        if not isinstance(color, tuple):
+            color = tuple(pygame.Color(color))
+        key = (id(font), text, color, antialias)
+        cached = self._strings.get(key)
+        # id() can be reused after a font is freed, so confirm it is the same font
+        if cached is not None and cached[0]() is font:
+            self._strings.move_to_end(key)
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        surf = self.atlas(font, color, antialias).compose(font, text)
+        self._strings[key] = (weakref.ref(font), surf)
+        if len(self._strings) > self.cache_size:
+            self._strings.popitem(last=False)
+        return surf
+
+    def clear(self):
+        self._atlases = weakref.WeakKeyDictionary()
+        self._strings.clear()
+
+
+def render_text(font, text, color, antialias=True):
+    """Cached equivalent of font.render(text, antialias, color)."""
+    return TextRenderer.get_instance().render(font, text, color, antialias)
+
+
+def clear():
+    TextRenderer.get_instance().clear()
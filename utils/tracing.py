@@ -0,0 +1,248 @@
+"""
+Low-overhead trace spans with Chrome trace-event export.
+
+Spans are kept in a fixed-size ring buffer, so a long session keeps only its most recent
+events and memory use stays flat. When tracing is off, span() returns a shared no-op
+context manager and @traced functions make a single flag check, so the instrumentation can
+stay in the hot paths. FrameProfiler also reports every frame stage here, which puts each
+scene's events/update/render/flip phases on the timeline with no extra markup.
+
+Enabled by settings.TRACE_ENABLED, the SPACECOWBOY_TRACE environment variable, or
+`python main_rework.py --trace [PATH]` (which also dumps the buffer on exit).
+
+Hotkeys (call handle_event from a scene's event loop):
+- F9:  dump the buffer as Chrome trace JSON to settings.TRACE_PATH (first press starts tracing
+       if it was off). Open the file in chrome://tracing or https://ui.perfetto.dev
+- F10: start/stop a cProfile capture; stopping writes a .prof file and prints the top entries
+
+Usage:
+    from utils.tracing import span, traced
+    with span("assets.load", path=str(path)):
+        surface = pygame.image.load(path)
+
+    @traced("PlayScreen.draw")
+    def draw(self, screen): ...
+
+    start = tracing.now()
+    ...                                   # a long block not worth re-indenting
+    tracing.record("adventure_map.dialogue", start)
+"""
+import functools
+import io
+import json
+import os
+import sys
+import threading
+import time
+import pygame
+from settings import TRACE_ENABLED, TRACE_PATH
+
+BUFFER_EVENTS = 65536
+DUMP_KEY = pygame.K_F9
+PROFILE_KEY = pygame.K_F10
+PROFILE_TOP = 25  # entries printed when a cProfile capture stops
+
+now = time.perf_counter
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "args", "start")
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = now()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.tracer.record(self.name, self.start, now(), self.args)
+        return False
+
+
+class Tracer:
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        """Singleton pattern so every module writes to the same buffer."""
+        if cls._instance is None:
+            cls._instance = Tracer()
+        return cls._instance
+
+    def __init__(self, capacity=BUFFER_EVENTS, enabled=None):
+        if enabled is None:
+            enabled = TRACE_ENABLED or bool(os.environ.get("SPACECOWBOY_TRACE"))
+        self.enabled = enabled
+        self.capacity = capacity
+        self._events = [None] * capacity  # (name, start, end, thread id, args)
+        self._next = 0
+        self._count = 0
+        self._origin = now()
+        self._profile = None
+
+    # ---- recording ----
+
+    def record(self, name, start, end=None, args=None):
+        """Store a finished span; start/end are perf_counter() seconds."""
+        if not self.enabled:
+            return
+        i = self._next
+        self._events[i] = (name, start, now() if end is None else end, threading.get_ident(), args)
+        self._next = (i + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def events(self):
+        """Buffered spans, oldest first."""
+        if self._count < self.capacity:
+            return self._events[:self._count]
+        return self._events[self._next:] + self._events[:self._next]
+
+    def clear(self):
+        self._events = [None] * self.capacity
+        self._next = 0
+        self._count = 0
+
+    def set_enabled(self, enabled):
+        self.enabled = enabled
+
+    # ---- export ----
+
+    def chrome_trace(self):
+        """The buffer as a Chrome trace-event document (complete 'X' events, microseconds)."""
+        pid = os.getpid()
+        trace_events = []
+        for name, start, end, tid, args in self.events():
+            event = {
+                "name": name,
+                "cat": name.split(".", 1)[0],
+                "ph": "X",
+                "ts": round((start - self._origin) * 1e6, 3),
+                "dur": round((end - start) * 1e6, 3),
+                "pid": pid,
+                "tid": tid,
+            }
+            if args:
+                event["args"] = args
+            trace_events.append(event)
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def dump(self, path=None):
+        """Write the buffer as Chrome trace JSON; returns the path, or None on failure."""
+        path = path or os.path.join(TRACE_PATH, time.strftime("trace-%Y%m%d-%H%M%S.json"))
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.chrome_trace(), f)
+        except Exception as e:
+            print(f"Error writing trace: {e}", file=sys.stderr)
+            return None
+        print(f"Trace written to {path} ({self._count} spans)")
+        return path
+
+    # ---- cProfile capture ----
+
+    @property
+    def profiling(self):
+        return self._profile is not None
+
+    def toggle_profile(self, path=None):
+        """Start a cProfile capture, or stop the running one and save it; returns the .prof path on stop."""
+        if self._profile is None:
+            import cProfile  # imported on first capture; not needed at startup
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+            print("cProfile capture started")
+            return None
+        profile, self._profile = self._profile, None
+        profile.disable()
+        path = path or os.path.join(TRACE_PATH, time.strftime("profile-%Y%m%d-%H%M%S.prof"))
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            profile.dump_stats(path)
+        except Exception as e:
+            print(f"Error writing profile: {e}", file=sys.stderr)
+            path = None
+        import pstats
+        out = io.StringIO()
+        pstats.Stats(profile, stream=out).sort_stats("cumulative").print_stats(PROFILE_TOP)
+        print(out.getvalue())
+        if path:
+            print(f"Profile written to {path}")
+        return path
+
+    # ---- hotkeys ----
+
+    def handle_event(self, event):
+        """F9 dumps the trace, F10 toggles cProfile; returns True if the event was consumed."""
+        if event.type != pygame.KEYDOWN:
+            return False
+        if event.key == DUMP_KEY:
+            if not self.enabled:
+                self.enabled = True
+                print("Tracing started; press F9 again to write the trace")
+            else:
+                self.dump()
+            return True
+        if event.key == PROFILE_KEY:
+            self.toggle_profile()
+            return True
+        return False
+
+
+_tracer = Tracer.get_instance()
+
+
+def span(name, **args):
+    """Context manager timing the enclosed block (a shared no-op while tracing is off)."""
+    if not _tracer.enabled:
+        return _NOOP
+    return _Span(_tracer, name, args or None)
+
+
+def traced(name=None):
+    """Decorator recording each call as a span named `name` (default: the function's qualname)."""
+    def decorate(fn):
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _tracer.enabled:
+                return fn(*args, **kwargs)
+            start = now()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _tracer.record(label, start, now())
+        return wrapper
+    return decorate
+
+
+def record(name, start, end=None, **args):
+    """Record a span measured by hand with now(); end defaults to the current time."""
+    if _tracer.enabled:
+        _tracer.record(name, start, end, args or None)
+
+
+def is_enabled():
+    return _tracer.enabled
+
+
+def handle_event(event):
+    return _tracer.handle_event(event)